@@ -0,0 +1,101 @@
+"""Conditional GET (``ETag`` / ``Last-Modified``) for ``/jobs`` and ``/jobs/{id}``.
+
+Validators come from the rows themselves, never from the serialized body, so
+an unchanged poll is answered ``304`` after a light query of ids and row
+versions (see ``crud.list_jobs(columns=...)`` / ``crud.get_job_version``).
+That pre-query only runs for conditional requests (``is_conditional``); an
+unconditional one reads the rows once and derives the validators from them:
+
+- ``/jobs/{id}``: ``"<id>-<row_version>"``; ``row_version`` is bumped by
+  every UPDATE of the row (models.Job).
+- ``/jobs``: a hash of the query string, the ``total`` and the page's
+  ``(id, row_version)`` pairs. A new matching job, a changed row on the page
+  or a page shift (rolling window, deeper offset) all change it.
+
+``Last-Modified`` is the newest ``updated_at``/``created_at`` on the page. It is
+the weaker validator (it cannot see a row *leaving* the page), so
+``If-None-Match`` wins when both are sent, as RFC 9110 prescribes.
+"""
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Mapping, Optional
+from zoneinfo import ZoneInfo
+
+from app.config import get_settings
+
+# Job attributes a page's validators are computed from.
+JOB_VERSION_COLUMNS = ["id", "row_version", "created_at", "updated_at"]
+
+
+def job_etag(job) -> str:
+    """Strong ETag of one job row."""
+    return f'"{job.id}-{job.row_version}"'
+
+
+def jobs_page_etag(query_items: Iterable[tuple], total: Optional[int], jobs) -> str:
+    """Strong ETag of one ``/jobs`` page (see module docstring)."""
+    key = [
+        sorted(query_items),
+        total,
+        [(job.id, job.row_version) for job in jobs],
+    ]
+    digest = hashlib.sha256(json.dumps(key, separators=(",", ":")).encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def last_modified(jobs) -> Optional[datetime]:
+    """Newest change time (APP_TIMEZONE wall-clock, naive) of ``jobs``, or None."""
+    stamps = [job.updated_at or job.created_at for job in jobs]
+    stamps = [s for s in stamps if s is not None]
+    return max(stamps) if stamps else None
+
+
+def http_date(local_naive: datetime) -> str:
+    """IMF-fixdate for a naive APP_TIMEZONE timestamp (as stored in the DB)."""
+    aware = local_naive.replace(tzinfo=ZoneInfo(get_settings().APP_TIMEZONE))
+    return format_datetime(aware.astimezone(timezone.utc), usegmt=True)
+
+
+def validator_headers(etag: str, modified: Optional[datetime]) -> dict:
+    """``ETag`` (and ``Last-Modified`` when known) response headers."""
+    headers = {"ETag": etag}
+    if modified is not None:
+        headers["Last-Modified"] = http_date(modified)
+    return headers
+
+
+def _etag_listed(header: str, etag: str) -> bool:
+    """Weak comparison of ``etag`` against an ``If-None-Match`` list."""
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque for candidate in header.split(",")
+    )
+
+
+def is_conditional(request_headers: Mapping[str, str]) -> bool:
+    """True when the request carries a validator to check (``If-None-Match``/``If-Modified-Since``)."""
+    return "if-none-match" in request_headers or "if-modified-since" in request_headers
+
+
+def is_not_modified(request_headers: Mapping[str, str], etag: str, modified: Optional[datetime]) -> bool:
+    """True when the client's cached copy is current and a 304 should be sent."""
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_listed(if_none_match, etag)
+
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since is None or modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False  # unparsable dates are ignored
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    aware = modified.replace(tzinfo=ZoneInfo(get_settings().APP_TIMEZONE))
+    # HTTP dates have whole-second precision.
+    return aware.replace(microsecond=0) <= since
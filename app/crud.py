@@ -1,33 +1,183 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import select, func, or_
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import select, func, or_, and_, case, insert, delete, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
-from app.models import Job
+from app.cache import TTLCache, VersionCounter
+from app.config import get_settings
+from app.fulltext import apply_fulltext
+from app.trigram import insert_trigrams, trigram_candidates, trigram_rows
+from app.models import DataVersion, Job, ScrapeFlight, ScrapeTask, ScrapeWatermark
 from app.schemas import JobsQuery
-from typing import Iterable, List
+from typing import Any, Dict, Iterable, List, Optional
+import json
 from datetime import timedelta
 from app.timeutils import local_now_naive
+from app.pagination import JobCursor, decode_job_cursor
+from app.urlkey import job_url_hash
 
 
-def upsert_jobs(db: Session, records: Iterable[dict]) -> int:
-    """Insert jobs, ignore duplicates by unique job_url.
+# Scraped columns; the rest are DB-managed (defaults / row versioning).
+_JOB_COLUMNS = frozenset(c.name for c in Job.__table__.columns) - {
+    "id", "created_at", "row_version", "updated_at",
+    "backfill_attempts", "backfill_last_error", "backfill_next_attempt_at",
+    "backfill_owner", "backfill_lease_expires_at",
+}
+# NOT NULL scraped columns without a default. MySQL ``INSERT IGNORE`` would
+# store a NULL here as '' (it downgrades every error, not just duplicates, to a
+# warning), so rows missing one are dropped up front on every dialect.
+_REQUIRED_JOB_COLUMNS = frozenset(
+    c.name for c in Job.__table__.columns
+    if c.name in _JOB_COLUMNS and not c.nullable
+    and c.default is None and c.server_default is None
+)
 
-    Race-safe: each row is inserted inside its own SAVEPOINT and a duplicate
-    (unique ``job_url``) is swallowed instead of aborting the whole batch. This
-    matters under multiple uvicorn workers, where two concurrent scrapes can
-    return the same job_url and both pass a naive check-then-insert (TOCTOU),
-    with one then hitting MySQL error 1062. Intra-batch duplicates are also
-    pre-filtered via ``seen`` so the same URL in one payload doesn't collide.
+
+def _job_insert_row(r: dict) -> dict:
+    """Project a scraped record onto insertable ``jobs`` columns.
+
+    Multi-row INSERTs need every row to carry the same keys, and the NOT NULL
+    boolean flags must not be sent as NULL (jobspy leaves ``is_remote`` empty
+    for some sites), so missing/None flags collapse to False.
     """
-    inserted = 0
-    seen: set[str] = set()
+    row = {k: r.get(k) for k in _JOB_COLUMNS}
+    row["job_url_hash"] = job_url_hash(row["job_url"])
+    for flag in ("is_remote", "applied"):
+        row[flag] = bool(row[flag])
+    return row
+
+
+def _has_required_columns(r: dict) -> bool:
+    """True when ``r`` carries a value for every NOT NULL scraped column."""
+    return all(r.get(k) is not None for k in _REQUIRED_JOB_COLUMNS)
+
+
+def _insert_ignore_stmt(db: Session, rows: List[dict]):
+    """Multi-row INSERT that skips duplicate ``job_url_hash``es, or None if unsupported.
+
+    MySQL uses ``INSERT IGNORE`` (affected rows == rows actually inserted, unlike
+    ``ON DUPLICATE KEY UPDATE`` whose no-op updates count as found rows under the
+    CLIENT_FOUND_ROWS flag mysqlclient connects with). SQLite uses
+    ``ON CONFLICT DO NOTHING``. Other dialects return None and fall back to the
+    per-row SAVEPOINT loop.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        return insert(Job).prefix_with("IGNORE").values(rows)
+    if dialect == "sqlite":
+        return sqlite_insert(Job).values(rows).on_conflict_do_nothing(
+            index_elements=[Job.job_url_hash]
+        )
+    return None
+
+
+def existing_job_url_hashes(
+    db: Session, hashes: Iterable[bytes], batch_size: Optional[int] = None
+) -> set[bytes]:
+    """Subset of ``hashes`` already stored, probed in chunks of ``batch_size``."""
+    if batch_size is None:
+        batch_size = get_settings().UPSERT_BATCH_SIZE
+    batch_size = max(1, batch_size)
+    hashes = list(hashes)
+    found: set[bytes] = set()
+    for start in range(0, len(hashes), batch_size):
+        found.update(
+            db.scalars(
+                select(Job.job_url_hash).where(
+                    Job.job_url_hash.in_(hashes[start:start + batch_size])
+                )
+            )
+        )
+    return found
+
+
+def known_job_descriptions(
+    db: Session, hashes: Iterable[bytes], batch_size: Optional[int] = None
+) -> dict[bytes, tuple[int, bool]]:
+    """``{job_url_hash: (id, has_description)}`` for the stored subset of ``hashes``."""
+    if batch_size is None:
+        batch_size = get_settings().UPSERT_BATCH_SIZE
+    batch_size = max(1, batch_size)
+    hashes = list(hashes)
+    known: dict[bytes, tuple[int, bool]] = {}
+    # Only the length travels back, not the description bodies themselves.
+    desc_len = func.coalesce(func.length(Job.description), 0)
+    for start in range(0, len(hashes), batch_size):
+        rows = db.execute(
+            select(Job.job_url_hash, Job.id, desc_len).where(
+                Job.job_url_hash.in_(hashes[start:start + batch_size])
+            )
+        )
+        for url_hash, job_pk, length in rows:
+            known[url_hash] = (job_pk, length > 0)
+    return known
+
+
+def upsert_jobs(db: Session, records: Iterable[dict], batch_size: Optional[int] = None) -> int:
+    """Insert jobs, ignore duplicates by job URL. Returns the inserted count.
+
+    Dedup key is ``job_url_hash`` (fixed-width hash of the canonical URL, see
+    ``app.urlkey``), so probes hit a narrow unique index instead of the wide
+    ``job_url`` text. Set-based: records are de-duplicated in memory, then
+    processed in chunks of ``batch_size`` (default ``UPSERT_BATCH_SIZE``). Per
+    chunk, one ``SELECT job_url_hash ... IN (...)`` drops URLs that are already
+    stored and the remainder goes out as a single multi-row insert-ignore, so a
+    200-row scrape costs two round trips instead of ~400.
+
+    Race-safe: under multiple uvicorn workers two concurrent scrapes can return
+    the same job_url and both pass the existence probe (TOCTOU). The insert
+    itself skips rows that hit the unique ``job_url_hash`` key instead of raising
+    MySQL error 1062, and the count comes from the statement's affected rows,
+    so a row lost to a concurrent worker is never counted as inserted here.
+    Records missing a required column (e.g. no ``job_title``) are skipped, as
+    the per-row insert used to skip them through ``IntegrityError``.
+    """
+    if batch_size is None:
+        batch_size = get_settings().UPSERT_BATCH_SIZE
+    batch_size = max(1, batch_size)
+
+    rows: List[dict] = []
+    seen: set[bytes] = set()
     for r in records:
-        url = r.get("job_url")
-        if not url or url in seen:
+        if not r.get("job_url") or not _has_required_columns(r):
             continue
-        seen.add(url)
+        row = _job_insert_row(r)
+        if row["job_url_hash"] in seen:
+            continue
+        seen.add(row["job_url_hash"])
+        rows.append(row)
+
+    inserted = 0
+    for start in range(0, len(rows), batch_size):
+        chunk = rows[start:start + batch_size]
         # Cheap fast-path: skip rows already committed by an earlier scrape.
-        if db.execute(select(Job.id).where(Job.job_url == url)).scalar_one_or_none():
+        existing = existing_job_url_hashes(db, [r["job_url_hash"] for r in chunk], batch_size)
+        fresh = [r for r in chunk if r["job_url_hash"] not in existing]
+        if not fresh:
             continue
+        stmt = _insert_ignore_stmt(db, fresh)
+        if stmt is None:
+            inserted += _upsert_jobs_rowwise(db, fresh)
+        else:
+            count = db.execute(stmt).rowcount
+            inserted += count
+            if count:
+                # Core inserts bypass the ORM hook (models._index_job_trigrams).
+                insert_trigrams(db.connection(), trigram_rows(fresh))
+    db.commit()
+    if inserted:
+        mark_jobs_changed(db)
+    return inserted
+
+
+def _upsert_jobs_rowwise(db: Session, rows: Iterable[dict]) -> int:
+    """Per-row insert fallback for dialects without an insert-ignore form.
+
+    Each row is inserted inside its own SAVEPOINT and a duplicate (unique
+    ``job_url_hash``) is swallowed instead of aborting the whole batch. Does not
+    commit; the caller owns the transaction.
+    """
+    inserted = 0
+    for r in rows:
         try:
             # SAVEPOINT: on a duplicate-key race the nested tx rolls back on its
             # own, leaving the outer transaction (and prior inserts) intact.
@@ -38,32 +188,49 @@ def upsert_jobs(db: Session, records: Iterable[dict]) -> int:
         except IntegrityError:
             # Lost the insert race to a concurrent worker — treat as existing.
             continue
-    db.commit()
     return inserted
 
 
+def _filtered_jobs_stmt(db: Session, params: JobsQuery):
+    """``select(Job)`` with every /jobs filter applied.
 
-def list_jobs(db: Session, params: JobsQuery):
+    Returns ``(stmt, cutoff, relevance)``: the effective created_at cutoff, and
+    the full-text relevance expression when ``q`` went through the index.
+    """
     stmt = select(Job)
+    relevance = None
 
     # --- Filters -----------------------------------------------------
     if params.site_name:
         stmt = stmt.where(Job.site_name == params.site_name)
-    if params.search_term:
-        stmt = stmt.where(Job.search_term.ilike(f"%{params.search_term}%"))
-    if params.location:
-        stmt = stmt.where(Job.location.ilike(f"%{params.location}%"))
-    if params.company:
-        stmt = stmt.where(Job.company.ilike(f"%{params.company}%"))
+    # Substring filters: the trigram index finds the distinct column values
+    # that can match (filters of 3+ characters), so the column's B-tree index
+    # serves the lookup; the ilike confirms the actual match.
+    use_trigrams = get_settings().JOBS_TRIGRAM_ENABLED
+    for field in ("search_term", "location", "company"):
+        value = getattr(params, field)
+        if not value:
+            continue
+        stmt = stmt.where(getattr(Job, field).ilike(f"%{value}%"))
+        candidates = trigram_candidates(field, value) if use_trigrams else None
+        if candidates is not None:
+            stmt = stmt.where(getattr(Job, field).in_(candidates))
     if params.q:
-        like = f"%{params.q}%"
-        stmt = stmt.where(
-            or_(
-                Job.job_title.ilike(like),
-                Job.description.ilike(like),
-                Job.company.ilike(like),
+        # FULLTEXT (MySQL) / FTS5 (SQLite) index when available, else a scan.
+        matched = None
+        if get_settings().JOBS_FULLTEXT_ENABLED:
+            matched = apply_fulltext(stmt, db.get_bind().dialect.name, params.q)
+        if matched is not None:
+            stmt, relevance = matched
+        else:
+            like = f"%{params.q}%"
+            stmt = stmt.where(
+                or_(
+                    Job.job_title.ilike(like),
+                    Job.description.ilike(like),
+                    Job.company.ilike(like),
+                )
             )
-        )
     if getattr(params, "applied", None) is not None:
         stmt = stmt.where(Job.applied == params.applied)
     # --- Filter by created_at (rolling-window default resolved here) --
@@ -76,20 +243,252 @@ def list_jobs(db: Session, params: JobsQuery):
         cutoff = getattr(params, "created_after", None)
     if cutoff is not None:
         stmt = stmt.where(Job.created_at >= cutoff)
+    return stmt, cutoff, relevance
+
+
+def list_jobs(db: Session, params: JobsQuery, columns: Optional[List[str]] = None):
+    """One /jobs page plus the total of the filtered rows (see ``count_jobs``).
+
+    ``columns`` replaces the ``fields`` projection with just these Job
+    attributes, e.g. ``conditional.JOB_VERSION_COLUMNS`` to validate a page
+    without reading its bodies.
+    """
+    stmt, cutoff, relevance = _filtered_jobs_stmt(db, params)
+    by_relevance = relevance is not None and getattr(params, "sort", "recent") == "relevance"
+
+    # --- Count total -------------------------------------------------
+    total = count_jobs(
+        db, stmt, getattr(params, "count", "exact"), _job_count_key(params, cutoff)
+    )
+
+    # --- Column projection -------------------------------------------
+    # Read only the requested columns (plus the sort key for next_cursor);
+    # touching any other attribute raises instead of lazy-loading per row.
+    fields = columns or (params.resolve_fields() if hasattr(params, "resolve_fields") else None)
+    if fields is not None:
+        # row_version/updated_at are the page's ETag/Last-Modified inputs.
+        loaded = set(fields) | {"date_posted", "created_at", "row_version", "updated_at"}
+        stmt = stmt.options(
+            load_only(*(getattr(Job, f) for f in sorted(loaded) if f != "id"), raiseload=True)
+        )
+
+    cursor = getattr(params, "cursor", None)
+    if cursor:
+        if by_relevance:
+            raise ValueError("cursor pagination is not supported with sort=relevance")
+        return total, _list_jobs_after(db, stmt, decode_job_cursor(cursor), params.limit)
 
     # --- Order and pagination ----------------------------------------
-    stmt = stmt.order_by(
+    # id breaks ties so the order (and thus each page) is deterministic.
+    order = [
         Job.date_posted.is_(None).asc(),
         Job.date_posted.desc(),
         Job.created_at.desc(),
-    ).limit(params.limit).offset(params.offset)
-
-    # --- Count total -------------------------------------------------
-    total = db.scalar(select(func.count()).select_from(stmt.subquery()))
+        Job.id.desc(),
+    ]
+    if by_relevance:
+        order = [relevance.desc(), Job.id.desc()]
+    stmt = stmt.order_by(*order).limit(params.limit).offset(params.offset)
     items = db.scalars(stmt).all()
 
     return total, items
 
+
+def iter_jobs(db: Session, params: JobsQuery, fields: List[str], batch_size: Optional[int] = None):
+    """Yield lists of ``fields`` row tuples for every job matching ``params``' filters.
+
+    Backs ``/jobs/export``: rows come in id order through a server-side cursor
+    (``yield_per``), ``batch_size`` (default ``EXPORT_BATCH_SIZE``) at a time,
+    as plain column tuples (no ORM objects), so memory stays flat however many
+    rows match. Paging, sorting and count options of ``params`` are ignored.
+    """
+    if batch_size is None:
+        batch_size = get_settings().EXPORT_BATCH_SIZE
+    stmt, _, _ = _filtered_jobs_stmt(db, params)
+    stmt = stmt.with_only_columns(*(getattr(Job, f) for f in fields)).order_by(Job.id)
+    result = db.execute(stmt.execution_options(yield_per=max(1, batch_size)))
+    for batch in result.partitions():
+        yield [tuple(row) for row in batch]
+
+
+# Exact counts per filter set; dropped whenever jobs are inserted or marked
+# applied in this process (other workers' writes age out with the TTL).
+_JOB_COUNT_CACHE = TTLCache(
+    maxsize=get_settings().JOB_COUNT_CACHE_MAX_ENTRIES,
+    ttl=get_settings().JOB_COUNT_CACHE_TTL_SECONDS,
+)
+# Last exact count per filter set, kept across writes to answer count=estimate.
+_JOB_COUNT_ESTIMATES = TTLCache(
+    maxsize=get_settings().JOB_COUNT_CACHE_MAX_ENTRIES,
+    ttl=get_settings().JOB_COUNT_ESTIMATE_TTL_SECONDS,
+)
+
+
+def _job_count_key(params: JobsQuery, cutoff) -> tuple:
+    # Keyed on the exact cutoff: the rolling default is already floored to the
+    # minute (schemas._default_created_after), so repeated polls share a count,
+    # while distinct explicit created_after values never do.
+    return tuple(
+        getattr(params, name, None)
+        for name in ("site_name", "search_term", "location", "company", "q", "applied")
+    ) + (cutoff,)
+
+
+def job_count_cache_stats() -> dict:
+    return _JOB_COUNT_CACHE.stats()
+
+
+def invalidate_job_counts() -> None:
+    """Forget cached exact counts (call after writes that change /jobs results)."""
+    _JOB_COUNT_CACHE.clear()
+
+
+# --- /jobs query result cache ---------------------------------------
+# Rendered /jobs pages, keyed on the resolved query and the jobs data version.
+_JOBS_QUERY_CACHE = TTLCache(
+    maxsize=get_settings().JOBS_QUERY_CACHE_MAX_ENTRIES,
+    ttl=get_settings().JOBS_QUERY_CACHE_TTL_SECONDS,
+)
+_JOBS_DATA_VERSION = VersionCounter()
+
+
+def mark_jobs_changed(db: Session) -> None:
+    """Record a committed write to ``jobs``: drop cached counts, bump data versions.
+
+    Call after the commit, so no reader can cache pre-write results under the
+    new version. With ``JOBS_QUERY_CACHE_SHARED`` the ``data_versions`` row is
+    bumped too (in its own small transaction).
+    """
+    invalidate_job_counts()
+    if get_settings().JOBS_QUERY_CACHE_SHARED:
+        bumped = db.execute(
+            update(DataVersion)
+            .where(DataVersion.name == "jobs")
+            .values(version=DataVersion.version + 1)
+        ).rowcount
+        if not bumped:
+            db.add(DataVersion(name="jobs", version=1))
+        db.commit()
+    _JOBS_DATA_VERSION.bump()
+
+
+def jobs_data_version(db: Session) -> tuple:
+    """Current version of the jobs data: this worker's counter, plus the shared one."""
+    if not get_settings().JOBS_QUERY_CACHE_SHARED:
+        return (_JOBS_DATA_VERSION.value,)
+    shared = db.scalar(select(DataVersion.version).where(DataVersion.name == "jobs"))
+    return (_JOBS_DATA_VERSION.value, shared or 0)
+
+
+def jobs_query_cache_key(db: Session, params: JobsQuery) -> tuple:
+    """Cache key of one /jobs page: data version, effective cutoff, other params.
+
+    The rolling-window default cutoff is floored to the minute (see
+    ``schemas._default_created_after``), so repeated polls share a key.
+    """
+    resolved = params.model_dump(exclude={"created_after", "all_time"})
+    return jobs_data_version(db) + (params.resolve_created_after(), tuple(sorted(resolved.items())))
+
+
+def get_cached_jobs_page(key: tuple):
+    return _JOBS_QUERY_CACHE.get(key)
+
+
+def cache_jobs_page(key: tuple, page) -> None:
+    _JOBS_QUERY_CACHE.set(key, page)
+
+
+def jobs_query_cache_stats() -> dict:
+    return {**_JOBS_QUERY_CACHE.stats(), "data_version": _JOBS_DATA_VERSION.value}
+
+
+def _planner_row_estimate(db: Session, stmt) -> Optional[int]:
+    """MySQL's EXPLAIN row estimate for ``stmt``; None elsewhere or if unusable."""
+    dialect = db.get_bind().dialect
+    if dialect.name != "mysql":
+        return None
+    compiled = stmt.compile(dialect=dialect)
+    params = (
+        tuple(compiled.params[k] for k in compiled.positiontup)
+        if compiled.positional else compiled.params
+    )
+    plan = db.connection().exec_driver_sql(f"EXPLAIN {compiled}", params).mappings().all()
+    if len(plan) != 1 or plan[0].get("rows") is None:
+        return None
+    filtered = plan[0].get("filtered")
+    return int(plan[0]["rows"] * (100.0 if filtered is None else float(filtered)) / 100)
+
+
+def count_jobs(db: Session, stmt, mode: str = "exact", key: Optional[tuple] = None) -> Optional[int]:
+    """Total rows matched by the filtered ``stmt`` according to ``mode``.
+
+    - ``exact``: ``COUNT(*)``, cached for ``JOB_COUNT_CACHE_TTL_SECONDS`` per
+      filter set (``key``) and invalidated by ``upsert_jobs``/``mark_job_as_applied``.
+    - ``estimate``: the last exact count for the filter set (up to
+      ``JOB_COUNT_ESTIMATE_TTL_SECONDS`` old), else MySQL's planner estimate,
+      else an exact count (which then seeds the estimate cache).
+    - ``none``: no count at all (returns None).
+    """
+    if mode == "none":
+        return None
+    if mode == "estimate" and key is not None:
+        total = _JOB_COUNT_ESTIMATES.get(key)
+        if total is None:
+            total = _planner_row_estimate(db, stmt)
+        if total is not None:
+            return total
+    if key is not None:
+        total = _JOB_COUNT_CACHE.get(key)
+        if total is not None:
+            return total
+
+    total = db.scalar(select(func.count()).select_from(stmt.subquery()))
+    if key is not None:
+        _JOB_COUNT_CACHE.set(key, total)
+        _JOB_COUNT_ESTIMATES.set(key, total)
+    return total
+
+
+def _list_jobs_after(db: Session, stmt, after: Optional[JobCursor], limit: int) -> List[Job]:
+    """Keyset page of ``stmt`` (filtered ``select(Job)``) following ``after``.
+
+    Same order as the offset mode: dated jobs (date_posted, created_at, id
+    descending), then undated ones (created_at, id descending). Each part is
+    its own range query on ``ix_jobs_date_posted_created_at_id``, so a page
+    costs the same however deep it is. ``after=None`` starts at the top.
+    """
+    items: List[Job] = []
+    if after is None or after.date_posted is not None:
+        dated = stmt.where(Job.date_posted.is_not(None))
+        if after is not None:
+            dated = dated.where(
+                or_(
+                    Job.date_posted < after.date_posted,
+                    and_(
+                        Job.date_posted == after.date_posted,
+                        or_(
+                            Job.created_at < after.created_at,
+                            and_(Job.created_at == after.created_at, Job.id < after.id),
+                        ),
+                    ),
+                )
+            )
+        dated = dated.order_by(Job.date_posted.desc(), Job.created_at.desc(), Job.id.desc())
+        items.extend(db.scalars(dated.limit(limit)))
+
+    if len(items) < limit:
+        undated = stmt.where(Job.date_posted.is_(None))
+        if after is not None and after.date_posted is None:
+            undated = undated.where(
+                or_(
+                    Job.created_at < after.created_at,
+                    and_(Job.created_at == after.created_at, Job.id < after.id),
+                )
+            )
+        undated = undated.order_by(Job.created_at.desc(), Job.id.desc())
+        items.extend(db.scalars(undated.limit(limit - len(items))))
+    return items
+
 def mark_job_as_applied(db: Session, job_id: int) -> Job:
     """Set a job's 'applied' attribute to True. Raises ValueError if not found."""
     job = db.get(Job, job_id)
@@ -100,6 +499,7 @@ def mark_job_as_applied(db: Session, job_id: int) -> Job:
         job.applied = True
         db.commit()
         db.refresh(job)
+        mark_jobs_changed(db)
 
     return job
 
@@ -107,26 +507,165 @@ def get_job(db: Session, job_id: int):
     return db.get(Job, job_id)
 
 
-def list_linkedin_jobs_missing_description(
-    db: Session, window_days: int, limit: int
-) -> List[Job]:
-    """LinkedIn jobs with no description, created within `window_days`, newest first.
+def get_job_version(db: Session, job_id: int):
+    """``(id, row_version, created_at, updated_at)`` of a job, or None if not found.
+
+    Reads no other column: enough to answer a conditional GET of /jobs/{id}.
+    """
+    stmt = select(Job.id, Job.row_version, Job.created_at, Job.updated_at).where(
+        Job.id == job_id
+    )
+    return db.execute(stmt).first()
+
 
-    Query-driven so a failed/partial backfill self-heals: rows stay description-less
-    and are picked up again by the next sweep (bounded by the window + limit).
+def _backfill_candidates(stmt, window_days: int, now):
+    """``stmt`` narrowed to jobs a description backfill sweep may fetch at ``now``.
+
+    LinkedIn jobs with no description, created within ``window_days``.
+    Query-driven so a failed/partial backfill self-heals: rows stay
+    description-less and are picked up again by a later sweep. Rows whose last
+    failed fetch scheduled a later retry are skipped until then, and rows that
+    failed ``DESCRIPTION_BACKFILL_MAX_ATTEMPTS`` times for good, so the limit
+    is spent on jobs that can still be filled.
     """
     # APP_TIMEZONE wall-clock (Berlin) to match the DB's naive created_at, which
     # MySQL func.now() writes in the server's local timezone (NOT UTC).
-    cutoff = local_now_naive() - timedelta(days=window_days)
-    stmt = (
-        select(Job)
-        .where(Job.site_name == "linkedin")
+    cutoff = now - timedelta(days=window_days)
+    return (
+        stmt.where(Job.site_name == "linkedin")
+        .where(or_(Job.backfill_next_attempt_at.is_(None), Job.backfill_next_attempt_at <= now))
+        .where(Job.backfill_attempts < get_settings().DESCRIPTION_BACKFILL_MAX_ATTEMPTS)
         .where(or_(Job.description.is_(None), Job.description == ""))
         .where(Job.created_at >= cutoff)
+    )
+
+
+def _backfill_unleased(now):
+    """Rows no sweep holds an unexpired backfill lease on."""
+    return or_(Job.backfill_lease_expires_at.is_(None), Job.backfill_lease_expires_at <= now)
+
+
+def count_claimable_backfill_jobs(db: Session, window_days: int, limit: int) -> int:
+    """How many backfill candidates (at most ``limit``) a sweep could claim now.
+
+    Jobs leased by a sweep in progress are left out; rows are counted, not loaded.
+    """
+    now = local_now_naive()
+    ids = (
+        _backfill_candidates(select(Job.id), window_days, now)
+        .where(_backfill_unleased(now))
+        .limit(limit)
+        .subquery()
+    )
+    return db.scalar(select(func.count()).select_from(ids))
+
+
+def claim_backfill_jobs(
+    db: Session, owner: str, window_days: int, limit: int, lease_seconds: int
+) -> List[Job]:
+    """Lease up to ``limit`` backfill candidates to ``owner`` and return them, newest first.
+
+    Candidates leased by another sweep are skipped until that lease expires
+    (a crashed worker's jobs thus come back on their own). The lease is taken
+    with a conditional UPDATE, so two workers racing for a job cannot both get
+    it; on MySQL the candidate SELECT also uses ``FOR UPDATE SKIP LOCKED``, so
+    concurrent sweeps pick disjoint jobs instead of contending for the same.
+    """
+    now = local_now_naive()
+    free = _backfill_unleased(now)
+    stmt = (
+        _backfill_candidates(select(Job.id), window_days, now)
+        .where(free)
         .order_by(Job.created_at.desc())
         .limit(limit)
     )
-    return list(db.scalars(stmt).all())
+    if db.get_bind().dialect.name == "mysql":
+        stmt = stmt.with_for_update(skip_locked=True)
+    ids = list(db.scalars(stmt).all())
+    if ids:
+        db.execute(
+            update(Job)
+            .where(Job.id.in_(ids))
+            .where(free)
+            .values(
+                backfill_owner=owner,
+                backfill_lease_expires_at=now + timedelta(seconds=lease_seconds),
+                row_version=Job.row_version,
+                updated_at=Job.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+    db.commit()
+    if not ids:
+        return []
+    return list(
+        db.scalars(
+            select(Job)
+            .where(Job.id.in_(ids), Job.backfill_owner == owner)
+            .order_by(Job.created_at.desc())
+        ).all()
+    )
+
+
+def release_backfill_jobs(db: Session, owner: str, job_pks: List[int]) -> None:
+    """Drop ``owner``'s leases on ``job_pks`` (end of a sweep) and commit."""
+    if not job_pks:
+        return
+    db.execute(
+        update(Job)
+        .where(Job.id.in_(job_pks), Job.backfill_owner == owner)
+        .values(
+            backfill_owner=None,
+            backfill_lease_expires_at=None,
+            row_version=Job.row_version,
+            updated_at=Job.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+def backfill_retry_delay(attempts: int) -> timedelta:
+    """Wait before retrying a job whose backfill fetch failed ``attempts`` times.
+
+    Exponential: ``DESCRIPTION_BACKFILL_RETRY_BASE_SECONDS`` doubled per
+    earlier failure, capped at ``DESCRIPTION_BACKFILL_RETRY_MAX_SECONDS``.
+    """
+    s = get_settings()
+    seconds = s.DESCRIPTION_BACKFILL_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, s.DESCRIPTION_BACKFILL_RETRY_MAX_SECONDS))
+
+
+def record_backfill_failures(db: Session, failures: Dict[int, tuple[int, str, bool]]) -> None:
+    """Record failed fetches ``{job_pk: (attempts_before, error, counted)}`` and commit.
+
+    Sets ``backfill_next_attempt_at`` per ``backfill_retry_delay`` and the
+    error, in one UPDATE. ``backfill_attempts`` only grows for ``counted``
+    failures; a throttled fetch (429/5xx/no response) is just deferred, so a
+    throttling spell cannot exhaust ``DESCRIPTION_BACKFILL_MAX_ATTEMPTS``.
+    Bookkeeping only: ``row_version``/``updated_at`` are left alone, so /jobs
+    ETags and caches are not disturbed.
+    """
+    if not failures:
+        return
+    now = local_now_naive()
+    errors = {pk: error[:255] for pk, (_, error, _) in failures.items()}
+    due = {pk: now + backfill_retry_delay(before + 1) for pk, (before, _, _) in failures.items()}
+    counted = {pk: int(c) for pk, (_, _, c) in failures.items()}
+    stmt = (
+        update(Job)
+        .where(Job.id.in_(list(failures)))
+        .values(
+            backfill_attempts=Job.backfill_attempts + case(counted, value=Job.id),
+            backfill_last_error=case(errors, value=Job.id),
+            backfill_next_attempt_at=case(due, value=Job.id),
+            row_version=Job.row_version,
+            updated_at=Job.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.execute(stmt)
+    db.commit()
 
 
 def set_job_description(db: Session, job_pk: int, description: str) -> bool:
@@ -136,4 +675,201 @@ def set_job_description(db: Session, job_pk: int, description: str) -> bool:
         return False
     job.description = description
     db.commit()
+    mark_jobs_changed(db)
     return True
+
+
+def set_job_descriptions(db: Session, descriptions: Dict[int, str]) -> int:
+    """Write ``{job_pk: description}`` in one UPDATE and commit. Returns rows updated.
+
+    Only rows still without a description are written, so one stored in the
+    meantime (e.g. by a sync scrape) is kept.
+    """
+    if not descriptions:
+        return 0
+    stmt = (
+        update(Job)
+        .where(Job.id.in_(list(descriptions)))
+        .where(or_(Job.description.is_(None), Job.description == ""))
+        .values(description=case(descriptions, value=Job.id))
+        .execution_options(synchronize_session=False)
+    )
+    updated = db.execute(stmt).rowcount
+    db.commit()
+    if updated:
+        mark_jobs_changed(db)
+    return updated
+
+
+def claim_scrape_flight(
+    db: Session, key_hash: str, owner: str, lease_seconds: int, accept_finished: bool = True
+) -> tuple[str, Optional[str]]:
+    """Try to become the worker that scrapes ``key_hash``.
+
+    Returns ``("leader", None)`` when this caller now holds the lease,
+    ``("running", None)`` when another worker holds an unexpired one, or
+    ``("finished", result_json)`` when a published result is still fresh
+    (only if ``accept_finished``). Expired leases — including a crashed
+    leader's — are taken over; the PK insert decides races between workers.
+    """
+    now = local_now_naive()
+    row = db.get(ScrapeFlight, key_hash)
+    if row is not None and row.lease_expires_at > now:
+        if row.finished_at is None:
+            return "running", None
+        if accept_finished:
+            return "finished", row.result
+
+    # Conditional delete: never remove a lease another worker just (re)took.
+    stale = ScrapeFlight.lease_expires_at <= now
+    if not accept_finished:
+        stale = or_(stale, ScrapeFlight.finished_at.is_not(None))
+    db.execute(delete(ScrapeFlight).where(ScrapeFlight.key_hash == key_hash).where(stale))
+    try:
+        db.add(ScrapeFlight(
+            key_hash=key_hash,
+            owner=owner,
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+        ))
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return "running", None
+    return "leader", None
+
+
+def finish_scrape_flight(
+    db: Session, key_hash: str, owner: str, result_json: Optional[str], keep_seconds: int
+) -> None:
+    """Publish the leader's result (or release the lease when ``result_json`` is None).
+
+    Also purges every other expired flight row so the table stays small.
+    """
+    now = local_now_naive()
+    mine = (ScrapeFlight.key_hash == key_hash) & (ScrapeFlight.owner == owner)
+    if result_json is None or keep_seconds <= 0:
+        db.execute(delete(ScrapeFlight).where(mine))
+    else:
+        db.execute(
+            update(ScrapeFlight)
+            .where(mine)
+            .values(
+                result=result_json,
+                finished_at=now,
+                lease_expires_at=now + timedelta(seconds=keep_seconds),
+            )
+        )
+    db.execute(delete(ScrapeFlight).where(ScrapeFlight.lease_expires_at <= now))
+    db.commit()
+
+
+def create_task(db: Session, kind: str, payload: dict) -> ScrapeTask:
+    """Queue a task; a worker in ``app.tasks`` picks it up."""
+    task = ScrapeTask(kind=kind, state="queued", payload=json.dumps(payload, default=str))
+    db.add(task)
+    db.commit()
+    db.refresh(task)
+    return task
+
+
+def get_task(db: Session, task_id: int) -> Optional[ScrapeTask]:
+    return db.get(ScrapeTask, task_id)
+
+
+def claim_next_task(
+    db: Session, owner: str, lease_seconds: int, max_attempts: int
+) -> Optional[ScrapeTask]:
+    """Claim the oldest runnable task for ``owner``, or None if there is none.
+
+    Runnable = queued, or running with an expired lease (its worker died).
+    Claiming is a conditional UPDATE on the row's current state, so two
+    workers racing for the same id cannot both win. Abandoned tasks that
+    already used ``max_attempts`` are failed instead of retried.
+    """
+    now = local_now_naive()
+    expired = (ScrapeTask.state == "running") & (ScrapeTask.lease_expires_at <= now)
+    db.execute(
+        update(ScrapeTask)
+        .where(expired & (ScrapeTask.attempts >= max_attempts))
+        .values(state="failed", finished_at=now,
+                error=f"abandoned: worker lease expired {max_attempts} time(s)")
+    )
+    runnable = (ScrapeTask.state == "queued") | expired
+    candidates = db.scalars(
+        select(ScrapeTask.id).where(runnable).order_by(ScrapeTask.id).limit(5)
+    ).all()
+    for task_id in candidates:
+        claimed = db.execute(
+            update(ScrapeTask)
+            .where(ScrapeTask.id == task_id)
+            .where(runnable)
+            .values(
+                state="running",
+                owner=owner,
+                attempts=ScrapeTask.attempts + 1,
+                started_at=now,
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+            )
+        ).rowcount
+        if claimed:
+            db.commit()
+            return db.get(ScrapeTask, task_id)
+    db.commit()
+    return None
+
+
+def finish_task(
+    db: Session,
+    task_id: int,
+    owner: str,
+    *,
+    result: Optional[Any] = None,
+    error: Optional[str] = None,
+) -> bool:
+    """Record a task's outcome. No-op (returns False) if ``owner`` lost the lease."""
+    done = db.execute(
+        update(ScrapeTask)
+        .where(ScrapeTask.id == task_id)
+        .where(ScrapeTask.owner == owner)
+        .where(ScrapeTask.state == "running")
+        .values(
+            state="failed" if error is not None else "succeeded",
+            result=json.dumps(result, default=str) if result is not None else None,
+            error=error,
+            finished_at=local_now_naive(),
+            lease_expires_at=None,
+        )
+    ).rowcount
+    db.commit()
+    return bool(done)
+
+
+def get_scrape_watermarks(db: Session, key_hashes: Iterable[str]) -> dict:
+    """``{key_hash: ScrapeWatermark}`` for the keys that have one."""
+    key_hashes = list(key_hashes)
+    if not key_hashes:
+        return {}
+    rows = db.scalars(select(ScrapeWatermark).where(ScrapeWatermark.key_hash.in_(key_hashes)))
+    return {row.key_hash: row for row in rows}
+
+
+def record_scrape_watermark(db: Session, key_hash: str, **values) -> None:
+    """Insert or advance one watermark; timestamps only ever move forward."""
+    row = db.get(ScrapeWatermark, key_hash)
+    if row is None:
+        try:
+            with db.begin_nested():
+                db.add(ScrapeWatermark(key_hash=key_hash, **values))
+                db.flush()
+            db.commit()
+            return
+        except IntegrityError:
+            # A concurrent worker created it first — fall through and update.
+            row = db.get(ScrapeWatermark, key_hash)
+    last = values.pop("last_success_at")
+    newest = values.pop("newest_date_posted", None)
+    if last > row.last_success_at:
+        row.last_success_at = last
+    if newest is not None and (row.newest_date_posted is None or newest > row.newest_date_posted):
+        row.newest_date_posted = newest
+    db.commit()
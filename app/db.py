@@ -1,6 +1,12 @@
+import threading
+import time
+
+from fastapi import Depends
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, sessionmaker
 from app.config import get_settings
+from app.logging_config import logger
 
 settings = get_settings()
 
@@ -19,6 +25,25 @@ engine = create_engine(
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
+# Optional read replica (DB_READ_URL), with its own pool. None = primary only.
+read_engine = (
+    create_engine(
+        settings.DB_READ_URL,
+        pool_pre_ping=True,
+        pool_size=settings.DB_READ_POOL_SIZE,
+        max_overflow=settings.DB_READ_POOL_MAX_OVERFLOW,
+        future=True,
+    )
+    if settings.DB_READ_URL
+    else None
+)
+
+ReadSessionLocal = (
+    sessionmaker(bind=read_engine, autoflush=False, autocommit=False, future=True)
+    if read_engine is not None
+    else None
+)
+
 
 def get_db():
     """FastAPI dependency that provides a DB session."""
@@ -27,3 +52,60 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Replica health: after a failed connect, reads go to the primary until then.
+_replica_lock = threading.Lock()
+_replica_down_until = 0.0
+_replica_stats = {"reads": 0, "fallbacks": 0}
+
+
+def _open_replica_session() -> Session | None:
+    """A connected replica session, or None (not configured, or unreachable)."""
+    global _replica_down_until
+    if ReadSessionLocal is None or time.monotonic() < _replica_down_until:
+        return None
+    read_db = ReadSessionLocal()
+    try:
+        # Check out a (pre-pinged) connection now, so an outage shows up here
+        # instead of in the middle of the endpoint.
+        read_db.connection()
+    except DBAPIError as e:
+        read_db.close()
+        with _replica_lock:
+            _replica_down_until = time.monotonic() + settings.DB_READ_RETRY_SECONDS
+            _replica_stats["fallbacks"] += 1
+        logger.bind(event="db.replica_unavailable").warning(
+            "Read replica unavailable, reading from the primary for {}s: {}",
+            settings.DB_READ_RETRY_SECONDS, e,
+        )
+        return None
+    with _replica_lock:
+        _replica_stats["reads"] += 1
+    return read_db
+
+
+def get_read_db(db: Session = Depends(get_db)):
+    """FastAPI dependency for read-only endpoints (/jobs, /jobs/{id}, exports).
+
+    Yields a read-replica session when DB_READ_URL is set and reachable, else
+    the primary session ``db``. Replica reads may lag the primary slightly, so
+    never use it for read-modify-write paths.
+    """
+    read_db = _open_replica_session()
+    if read_db is None:
+        yield db
+        return
+    try:
+        yield read_db
+    finally:
+        read_db.close()
+
+
+def read_replica_stats() -> dict:
+    with _replica_lock:
+        return {
+            "configured": ReadSessionLocal is not None,
+            "available": time.monotonic() >= _replica_down_until,
+            **_replica_stats,
+        }
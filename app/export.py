@@ -0,0 +1,31 @@
+"""Encoders for ``GET /jobs/export``: NDJSON or CSV chunks from row batches."""
+import csv
+import io
+from datetime import datetime
+from typing import Iterable, Iterator, List, Sequence
+
+from app.serialization import dumps
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+
+def ndjson_chunks(fields: List[str], batches: Iterable[Sequence[tuple]]) -> Iterator[bytes]:
+    """One JSON object per row, one chunk per batch."""
+    for batch in batches:
+        yield b"".join(dumps(dict(zip(fields, row))) + b"\n" for row in batch)
+
+
+def csv_chunks(fields: List[str], batches: Iterable[Sequence[tuple]]) -> Iterator[str]:
+    """A header line, then the rows of each batch as one chunk (None -> empty cell)."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(fields)
+    yield buf.getvalue()
+    for batch in batches:
+        buf.seek(0)
+        buf.truncate()
+        writer.writerows(
+            ["" if v is None else v.isoformat() if isinstance(v, datetime) else v for v in row]
+            for row in batch
+        )
+        yield buf.getvalue()
@@ -0,0 +1,106 @@
+"""Full-text search over ``jobs.job_title``, ``description`` and ``company``.
+
+MySQL uses the ``ix_jobs_fulltext`` FULLTEXT index with ``MATCH ... AGAINST``
+in boolean mode; SQLite (tests/local runs) uses the ``jobs_fts`` FTS5 table,
+kept in sync with ``jobs`` by triggers. Other dialects get no full-text path
+and ``crud.list_jobs`` falls back to ``ilike``.
+
+Each word of ``q`` is required and matched as a word prefix, so ``q=pyth dev``
+finds "Python Developer". Unlike ``ilike '%q%'`` a match must start at a word
+boundary. Searches the index cannot answer faithfully keep the ``ilike`` path:
+punctuation inside a term (``C++``, ``C#``, ``.NET``), words shorter than
+InnoDB's ``innodb_ft_min_token_size`` (``AI``, ``Go``) and InnoDB stopwords,
+none of which MySQL indexes.
+"""
+import re
+from typing import List, Optional
+
+from sqlalchemy import literal_column, select, text
+from sqlalchemy.dialects.mysql import match as mysql_match
+
+FULLTEXT_COLUMNS = ("job_title", "description", "company")
+MYSQL_FULLTEXT_INDEX = "ix_jobs_fulltext"
+
+# External-content FTS5 table over jobs plus the triggers keeping it current.
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5("
+    "job_title, description, company, content='jobs', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN "
+    "INSERT INTO jobs_fts(rowid, job_title, description, company) "
+    "VALUES (new.id, new.job_title, new.description, new.company); END",
+    "CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN "
+    "INSERT INTO jobs_fts(jobs_fts, rowid, job_title, description, company) "
+    "VALUES ('delete', old.id, old.job_title, old.description, old.company); END",
+    "CREATE TRIGGER IF NOT EXISTS jobs_fts_au "
+    "AFTER UPDATE OF job_title, description, company ON jobs BEGIN "
+    "INSERT INTO jobs_fts(jobs_fts, rowid, job_title, description, company) "
+    "VALUES ('delete', old.id, old.job_title, old.description, old.company); "
+    "INSERT INTO jobs_fts(rowid, job_title, description, company) "
+    "VALUES (new.id, new.job_title, new.description, new.company); END",
+]
+SQLITE_FTS_DROP = [
+    "DROP TRIGGER IF EXISTS jobs_fts_au",
+    "DROP TRIGGER IF EXISTS jobs_fts_ad",
+    "DROP TRIGGER IF EXISTS jobs_fts_ai",
+    "DROP TABLE IF EXISTS jobs_fts",
+]
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_SPACE_RE = re.compile(r"\s+", re.UNICODE)
+
+# InnoDB defaults: innodb_ft_min_token_size and INFORMATION_SCHEMA.INNODB_FT_DEFAULT_STOPWORD.
+MIN_TERM_LENGTH = 3
+_STOPWORDS = frozenset(
+    "a about an are as at be by com de en for from how i in is it la of on or "
+    "that the this to was what when where who will with und www".split()
+)
+
+
+def fulltext_terms(q: Optional[str]) -> List[str]:
+    """Words of a search string (operators and punctuation dropped)."""
+    return _WORD_RE.findall(q or "")
+
+
+def _indexable(q: str, terms: List[str]) -> bool:
+    """True when the index sees exactly what ``ilike '%q%'`` would search for."""
+    if "".join(terms) != _SPACE_RE.sub("", q):
+        return False  # punctuation was dropped (C++, C#, .NET, full-stack)
+    return all(len(t) >= MIN_TERM_LENGTH and t.lower() not in _STOPWORDS for t in terms)
+
+
+def apply_fulltext(stmt, dialect_name: str, q: Optional[str]):
+    """``(stmt, relevance)`` with ``stmt`` (a ``select(Job)``) narrowed to ``q``.
+
+    Returns None when there is no full-text path (unsupported dialect, or
+    ``q`` has no indexable words, see module docstring); the caller should
+    fall back to ``ilike``.
+    ``relevance`` sorts best-first when ordered descending.
+    """
+    from app.models import Job
+
+    terms = fulltext_terms(q)
+    if not terms or not _indexable(q, terms):
+        return None
+    if dialect_name == "mysql":
+        relevance = mysql_match(
+            *(getattr(Job, c) for c in FULLTEXT_COLUMNS),
+            against=" ".join(f"+{t}*" for t in terms),
+        ).in_boolean_mode()
+        return stmt.where(relevance), relevance
+    if dialect_name == "sqlite":
+        # bm25() is "lower is better"; negate it so descending = most relevant.
+        fts = (
+            select(
+                literal_column("jobs_fts.rowid").label("id"),
+                literal_column("-bm25(jobs_fts)").label("score"),
+            )
+            .select_from(text("jobs_fts"))
+            .where(
+                text("jobs_fts MATCH :fulltext_q").bindparams(
+                    fulltext_q=" ".join(f'"{t}"*' for t in terms)
+                )
+            )
+            .subquery("fts")
+        )
+        return stmt.join(fts, fts.c.id == Job.id), fts.c.score
+    return None
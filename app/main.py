@@ -1,26 +1,80 @@
-from fastapi import FastAPI, Depends, HTTPException, BackgroundTasks
-from fastapi.encoders import jsonable_encoder
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Literal
+
+from fastapi import FastAPI, Depends, HTTPException, BackgroundTasks, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 from app.config import get_settings
-from app.db import get_db, SessionLocal
-from app.schemas import JobOut, ScrapeRequest, JobsQuery
+from app.db import get_db, get_read_db, read_replica_stats, SessionLocal
+from app.schemas import JobOut, ScrapeRequest, JobsQuery, BatchScrapeRequest, TaskOut
 from app.crud import (
     upsert_jobs,
+    existing_job_url_hashes,
     list_jobs,
+    iter_jobs,
+    job_count_cache_stats,
+    jobs_query_cache_key,
+    jobs_query_cache_stats,
+    get_cached_jobs_page,
+    cache_jobs_page,
     get_job,
+    get_job_version,
+    get_task,
     mark_job_as_applied,
-    list_linkedin_jobs_missing_description,
+    count_claimable_backfill_jobs,
+)
+from app.scraper import (
+    run_scrape,
+    fetch_missing_linkedin_details,
+    ScrapeError,
+    run_description_backfill,
+    backfill_progress,
+    linkedin_rate_limiter_stats,
+    linkedin_scraper_pool_stats,
+    scrape_cache_stats,
+    scrape_singleflight_stats,
+    plan_incremental_scrape,
+    record_incremental_scrape,
+)
+from app.conditional import (
+    JOB_VERSION_COLUMNS,
+    is_conditional,
+    is_not_modified,
+    job_etag,
+    jobs_page_etag,
+    last_modified,
+    validator_headers,
 )
-from app.scraper import run_scrape, ScrapeError, run_description_backfill
+from app.export import MEDIA_TYPES, csv_chunks, ndjson_chunks
 from app.logging_config import logger
+from app.pagination import encode_job_cursor
+from app.serialization import FastJSONResponse, jobs_payload
+from app.tasks import TaskWorkerPool, enqueue_scrape, task_summary
+from app.urlkey import job_url_hash
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Queued scrapes (/scrape queue=true) are executed by task workers. Run them
+    # in-process unless TASK_WORKERS=0 (then use `python -m app.tasks`).
+    pool = TaskWorkerPool(settings.TASK_WORKERS).start() if settings.TASK_WORKERS > 0 else None
+    try:
+        yield
+    finally:
+        if pool is not None:
+            pool.stop()
+
+
 app = FastAPI(
     title=settings.APP_NAME,
     version="1.1.5",
     description="API to scrape and fetch job postings using jobspy and persist them to MySQL.",
+    lifespan=lifespan,
 )
 
 # --- CORS ---------------------------------------------------------
@@ -39,6 +93,22 @@ def health():
     return {"status": "ok"}
 
 
+# --- Metrics ------------------------------------------------------
+@app.get("/metrics", response_model=dict, tags=["ops"])
+def metrics():
+    """In-process counters of this worker (caches etc.), as JSON."""
+    return {
+        "scrape_cache": scrape_cache_stats(),
+        "scrape_singleflight": scrape_singleflight_stats(),
+        "job_count_cache": job_count_cache_stats(),
+        "jobs_query_cache": jobs_query_cache_stats(),
+        "read_replica": read_replica_stats(),
+        "description_backfill": backfill_progress(),
+        "linkedin_rate_limiter": linkedin_rate_limiter_stats(),
+        "linkedin_scraper_pool": linkedin_scraper_pool_stats(),
+    }
+
+
 # --- country_indeed resolution ------------------------------------
 # jobspy requires a country for Indeed/Glassdoor scrapes. Resolve it explicitly
 # so a missing value fails loudly with a clean 400 instead of blowing up deep
@@ -90,6 +160,31 @@ def log_kept_without_company(records):
     return len(missing)
 
 
+def scrape_with_missing_details(db: Session, scrape_payload: dict):
+    """Sync scrape; LinkedIn details only for jobs not already stored with one.
+
+    With ``linkedin_fetch_description`` jobspy would fetch every LinkedIn
+    detail page. Instead the listing is scraped first and details are fetched
+    for new or description-less jobs (``fetch_missing_linkedin_details``).
+    Returns ``(records, descriptions)``.
+    """
+    wants_details = bool(scrape_payload.get("linkedin_fetch_description")) and any(
+        str(s).lower() == "linkedin" for s in scrape_payload.get("site_name") or []
+    )
+    if wants_details:
+        scrape_payload = {**scrape_payload, "linkedin_fetch_description": False}
+    records = run_scrape(scrape_payload)
+    descriptions = (
+        fetch_missing_linkedin_details(db, records) if wants_details else {"status": "skipped"}
+    )
+    return records, descriptions
+
+
+def window_summary(window):
+    """Public part of an incremental-scrape plan (see plan_incremental_scrape)."""
+    return {k: window[k] for k in ("incremental", "hours_old", "results_wanted")}
+
+
 # --- Scrape and Save ----------------------------------------------
 @app.post(
     "/scrape",
@@ -100,12 +195,15 @@ def log_kept_without_company(records):
         "Sync by default (waits for the full scrape, including LinkedIn descriptions). "
         "Set `background=true` to return the listing summary immediately; when "
         "`linkedin_fetch_description=true` the LinkedIn descriptions are then fetched "
-        "in the background and backfilled onto the stored rows."
+        "in the background and backfilled onto the stored rows. Set `queue=true` to "
+        "persist the scrape as a durable task and get its id back immediately (202); "
+        "poll `GET /tasks/{id}` for its state and counts."
     ),
 )
 def scrape_jobs_endpoint(
     payload: ScrapeRequest,
     background_tasks: BackgroundTasks,
+    response: Response,
     db: Session = Depends(get_db),
 ):
     logger.bind(event="scrape.start", background=payload.background).info(
@@ -123,22 +221,41 @@ def scrape_jobs_endpoint(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    if payload.queue:
+        # ---- QUEUED: durable task, executed by app.tasks workers ---------
+        task = enqueue_scrape(db, payload.model_dump())
+        logger.bind(event="scrape.queued", task_id=task.id).info(
+            f"Queued scrape task {task.id} for {payload.search_term}"
+        )
+        response.status_code = 202
+        return {
+            "mode": "queued",
+            "task_id": task.id,
+            "state": task.state,
+            "status_url": f"/tasks/{task.id}",
+            "search_term": payload.search_term,
+            "site_name": payload.site_name,
+            "location": payload.location,
+        }
+
     try:
         if not payload.background:
             # ---- SYNC (unchanged behaviour) ------------------------------
-            records = run_scrape(payload.model_dump())
+            scrape_payload, window = plan_incremental_scrape(db, payload.model_dump())
+            records, descriptions = scrape_with_missing_details(db, scrape_payload)
 
             log_kept_without_company(records)
             inserted = upsert_jobs(db, records)
+            record_incremental_scrape(db, scrape_payload, window, records)
 
-            total, db_items = list_jobs(db, JobsQuery(limit=inserted))
-            db_items_payload = [JobOut.model_validate(i).model_dump() for i in db_items]
+            total, db_items = list_jobs(db, JobsQuery(limit=inserted, count="none"))
+            db_items_payload = jobs_payload(db_items)
 
             logger.bind(event="scrape.done").info(
                 f"Scrape complete. Inserted: {inserted}, Returned: {len(records)}"
             )
 
-            return {
+            return FastJSONResponse({
                 "mode": "sync",
                 "search_term": payload.search_term,
                 "site_name": payload.site_name,
@@ -147,20 +264,25 @@ def scrape_jobs_endpoint(
                 "is_remote": payload.is_remote,
                 "inserted": inserted,
                 "returned": len(records),
-                "scrape_items": jsonable_encoder(records),
+                "sites": getattr(records, "sites", {}),
+                "window": window_summary(window),
+                "descriptions": descriptions,
+                "scrape_items": records,
                 "db_items": db_items_payload,
                 "items": db_items_payload,
-            }
+            })
 
         # ---- BACKGROUND -------------------------------------------------
         # Fast listing pass for THIS call only: pass an explicit False, do NOT
         # mutate payload.linkedin_fetch_description. The caller's flag is read
         # (below) solely to decide whether to schedule the description backfill.
         fast_payload = {**payload.model_dump(), "linkedin_fetch_description": False}
+        fast_payload, window = plan_incremental_scrape(db, fast_payload)
         records = run_scrape(fast_payload)
 
         log_kept_without_company(records)
         inserted = upsert_jobs(db, records)
+        record_incremental_scrape(db, fast_payload, window, records)
 
         wants_descriptions = bool(payload.linkedin_fetch_description)
         scrapes_linkedin = any(str(s).lower() == "linkedin" for s in payload.site_name)
@@ -172,7 +294,6 @@ def scrape_jobs_endpoint(
                 window_days=s.DESCRIPTION_BACKFILL_WINDOW_DAYS,
                 limit=s.DESCRIPTION_BACKFILL_LIMIT,
                 concurrency=s.DESCRIPTION_BACKFILL_CONCURRENCY,
-                delay=s.DESCRIPTION_BACKFILL_DELAY_SECONDS,
             )
 
         logger.bind(event="scrape.done", background=True, backfill=will_backfill).info(
@@ -202,6 +323,8 @@ def scrape_jobs_endpoint(
             "is_remote": payload.is_remote,
             "inserted": inserted,
             "returned": len(records),
+            "sites": getattr(records, "sites", {}),
+            "window": window_summary(window),
             "descriptions": "pending" if will_backfill else "skipped",
             # 1-element stub (no job bodies) — keeps the n8n "Build Summary"
             # node working: it reads `returned` + items[].search_term/site.
@@ -225,6 +348,131 @@ def scrape_jobs_endpoint(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# --- Batch Scrape -------------------------------------------------
+@app.post(
+    "/scrape/batch",
+    response_model=dict,
+    tags=["scrape"],
+    summary="Scrape many queries and persist them in one call",
+    description=(
+        "Runs every ScrapeRequest in `requests` like a sync /scrape (per-entry "
+        "`background` is ignored) with bounded concurrency, de-duplicates job URLs "
+        "across the whole batch and persists them in one bulk upsert. Returns a "
+        "per-query summary; a failing query is reported, not fatal."
+    ),
+)
+def scrape_batch_endpoint(payload: BatchScrapeRequest, db: Session = Depends(get_db)):
+    s = get_settings()
+    if len(payload.requests) > s.SCRAPE_BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"batch has {len(payload.requests)} requests; "
+                f"max is {s.SCRAPE_BATCH_MAX_REQUESTS} (SCRAPE_BATCH_MAX_REQUESTS)"
+            ),
+        )
+
+    for i, req in enumerate(payload.requests):
+        try:
+            req.country_indeed = resolve_country_indeed(
+                req.site_name, req.country_indeed, s.COUNTRY_INDEED_FALLBACK
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"requests[{i}]: {e}")
+
+    logger.bind(event="scrape.batch.start", queries=len(payload.requests)).info(
+        f"Starting batch scrape of {len(payload.requests)} queries"
+    )
+    started = time.perf_counter()
+
+    # Sessions are not thread-safe: each query's detail lookup gets its own.
+    thread_sessions = sessionmaker(bind=db.get_bind(), autoflush=False, autocommit=False)
+
+    def one(scrape_payload: dict):
+        t0 = time.perf_counter()
+        thread_db = thread_sessions()
+        try:
+            records, descriptions = scrape_with_missing_details(thread_db, scrape_payload)
+        except ScrapeError as e:
+            return [], {"ok": False, "error": str(e), "seconds": round(time.perf_counter() - t0, 3)}
+        finally:
+            thread_db.close()
+        return records, {
+            "ok": True,
+            "sites": getattr(records, "sites", {}),
+            "descriptions": descriptions,
+            "seconds": round(time.perf_counter() - t0, 3),
+        }
+
+    workers = min(len(payload.requests), payload.concurrency or s.SCRAPE_BATCH_CONCURRENCY)
+    try:
+        plans = [plan_incremental_scrape(db, req.model_dump()) for req in payload.requests]
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+            results = list(ex.map(one, [scrape_payload for scrape_payload, _ in plans]))
+
+        # Cross-batch dedup: a job returned by several queries is attributed to
+        # the first query (in request order) that returned it.
+        unique_records = []
+        per_query_hashes = []
+        seen: set[bytes] = set()
+        for records, _ in results:
+            hashes = []
+            for r in records:
+                if not r.get("job_url"):
+                    continue
+                h = job_url_hash(r["job_url"])
+                if h in seen:
+                    continue
+                seen.add(h)
+                hashes.append(h)
+                unique_records.append(r)
+            per_query_hashes.append(hashes)
+
+        all_records = [r for records, _ in results for r in records]
+        log_kept_without_company(all_records)
+        # Per-query `inserted` is attributed from this probe; the batch total comes
+        # from the insert itself, so it stays exact if a concurrent worker wins a race.
+        known = existing_job_url_hashes(db, seen)
+        inserted = upsert_jobs(db, unique_records)
+        for (scrape_payload, window), (records, info) in zip(plans, results):
+            if info["ok"]:
+                record_incremental_scrape(db, scrape_payload, window, records)
+    except Exception as e:
+        logger.exception("Batch scrape failed")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    queries = []
+    for i, (req, (_, window), (records, info), hashes) in enumerate(
+        zip(payload.requests, plans, results, per_query_hashes)
+    ):
+        queries.append({
+            "index": i,
+            "search_term": req.search_term,
+            "site_name": req.site_name,
+            "location": req.location,
+            "returned": len(records),
+            "unique": len(hashes),
+            "inserted": sum(1 for h in hashes if h not in known),
+            "window": window_summary(window),
+            **info,
+        })
+
+    failed = sum(1 for q in queries if not q["ok"])
+    logger.bind(event="scrape.batch.done", failed=failed).info(
+        f"Batch scrape complete. Inserted: {inserted}, Unique: {len(unique_records)}, "
+        f"Returned: {len(all_records)}"
+    )
+    return {
+        "mode": "batch",
+        "queries": queries,
+        "failed": failed,
+        "returned": len(all_records),
+        "unique": len(unique_records),
+        "inserted": inserted,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
 # --- Backfill LinkedIn descriptions (on-demand mop-up) -------------
 @app.post(
     "/descriptions/backfill",
@@ -233,7 +481,8 @@ def scrape_jobs_endpoint(
     summary="Backfill missing LinkedIn descriptions",
     description=(
         "Schedules a background sweep that fetches descriptions for description-less "
-        "LinkedIn jobs created within the window. Returns the current candidate count. "
+        "LinkedIn jobs created within the window. Returns the current candidate count "
+        "(jobs leased by a sweep already running elsewhere are not counted). "
         "`window_days`/`limit` default to the configured env values when omitted."
     ),
 )
@@ -248,7 +497,7 @@ def backfill_descriptions_endpoint(
 
     db = SessionLocal()
     try:
-        candidates = len(list_linkedin_jobs_missing_description(db, w, lim))
+        candidates = count_claimable_backfill_jobs(db, w, lim)
     finally:
         db.close()
 
@@ -257,28 +506,119 @@ def backfill_descriptions_endpoint(
         window_days=w,
         limit=lim,
         concurrency=s.DESCRIPTION_BACKFILL_CONCURRENCY,
-        delay=s.DESCRIPTION_BACKFILL_DELAY_SECONDS,
     )
     return {"scheduled": True, "candidates": candidates, "window_days": w, "limit": lim}
 
 
+# --- Task status --------------------------------------------------
+@app.get("/tasks/{task_id}", response_model=TaskOut, tags=["scrape"])
+def get_task_status(task_id: int, db: Session = Depends(get_db)):
+    task = get_task(db, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task_summary(task)
+
+
 # --- List Jobs ----------------------------------------------------
-@app.get("/jobs", response_model=dict)
-def get_jobs(params: JobsQuery = Depends(), db: Session = Depends(get_db)):
-    total, items = list_jobs(db, params)
-    return {
-        "total": total,
-        "count": len(items),
-        "items": [JobOut.model_validate(i).model_dump() for i in items],
-    }
+@app.get("/jobs", response_model=dict, response_class=FastJSONResponse)
+def get_jobs(request: Request, params: JobsQuery = Depends(), db: Session = Depends(get_read_db)):
+    try:
+        fields = params.resolve_fields()
+        # Rendered pages are cached per resolved query and jobs data version;
+        # a hit answers without touching the jobs table.
+        key = jobs_query_cache_key(db, params)
+        cached = get_cached_jobs_page(key)
+        if cached is None and is_conditional(request.headers):
+            # Conditional GET: validate the page from ids/row versions only,
+            # and answer 304 before any job body is read or serialized.
+            total, versions = list_jobs(db, params, columns=JOB_VERSION_COLUMNS)
+            etag = jobs_page_etag(request.query_params.multi_items(), total, versions)
+            modified = last_modified(versions)
+            if is_not_modified(request.headers, etag, modified):
+                return Response(status_code=304, headers=validator_headers(etag, modified))
+            # Same page in full; `total` is already known.
+            _, items = list_jobs(db, params.model_copy(update={"count": "none"}))
+        elif cached is None:
+            total, items = list_jobs(db, params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if cached is None:
+        # A full page may have more after it; resume there with ?cursor=<next_cursor>.
+        # Relevance order has no keyset, so those pages are offset-paged only.
+        next_cursor = None
+        if items and len(items) == params.limit and params.sort != "relevance":
+            next_cursor = encode_job_cursor(items[-1])
+        # Rendered once here (FastAPI does not re-encode it); the validators
+        # are recomputed from the rows actually sent.
+        rendered = FastJSONResponse({
+            "total": total,
+            "total_mode": params.count,
+            "count": len(items),
+            "next_cursor": next_cursor,
+            "items": jobs_payload(items, fields),
+        })
+        cached = (
+            rendered.body,
+            jobs_page_etag(request.query_params.multi_items(), total, items),
+            last_modified(items),
+        )
+        cache_jobs_page(key, cached)
+
+    body, etag, modified = cached
+    headers = validator_headers(etag, modified)
+    if is_not_modified(request.headers, etag, modified):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type=FastJSONResponse.media_type, headers=headers)
+
+
+# --- Export Jobs --------------------------------------------------
+# Declared before /jobs/{job_id} so "export" is not parsed as a job id.
+@app.get(
+    "/jobs/export",
+    summary="Stream every matching job as NDJSON or CSV",
+    description=(
+        "Same filters (and `fields`) as `GET /jobs`, but no paging: all matching "
+        "jobs are streamed in id order from a server-side cursor, with constant "
+        "memory however many rows match. `limit`, `offset`, `cursor`, `sort` and "
+        "`count` are ignored."
+    ),
+)
+def export_jobs(
+    params: JobsQuery = Depends(),
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    db: Session = Depends(get_read_db),
+):
+    try:
+        fields = params.resolve_fields() or list(JobOut.model_fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    encode = ndjson_chunks if format == "ndjson" else csv_chunks
+    return StreamingResponse(
+        encode(fields, iter_jobs(db, params, fields)),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="jobs.{format}"'},
+    )
 
 
 # --- Get Job by ID ------------------------------------------------
 @app.get("/jobs/{job_id}", response_model=JobOut)
-def get_job_by_id(job_id: int, db: Session = Depends(get_db)):
+def get_job_by_id(
+    job_id: int, request: Request, response: Response, db: Session = Depends(get_read_db)
+):
+    if is_conditional(request.headers):
+        # Validate from the row version alone before reading the full row.
+        version = get_job_version(db, job_id)
+        if not version:
+            raise HTTPException(status_code=404, detail="Job not found")
+        etag, modified = job_etag(version), last_modified([version])
+        if is_not_modified(request.headers, etag, modified):
+            return Response(status_code=304, headers=validator_headers(etag, modified))
     job = get_job(db, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
+    # Validators describe the row actually sent (it may have changed since a version read).
+    response.headers.update(validator_headers(job_etag(job), last_modified([job])))
     return JobOut.model_validate(job)
 
 
@@ -1,5 +1,17 @@
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import String, Text, DateTime, func, Integer, Boolean
+from sqlalchemy import (
+    String, Text, DateTime, func, Integer, Boolean, BINARY, Index, DDL, event, literal_column,
+)
+from sqlalchemy.dialects.mysql import LONGTEXT
+
+from app.fulltext import FULLTEXT_COLUMNS, MYSQL_FULLTEXT_INDEX, SQLITE_FTS_DDL
+from app.trigram import TRIGRAM_COLLATION, TRIGRAM_FIELDS, insert_trigrams, trigram_rows
+from app.urlkey import JOB_URL_HASH_BYTES, job_url_hash
+
+
+def _job_url_hash_default(context) -> bytes:
+    """Column default: derive ``job_url_hash`` from the row's ``job_url``."""
+    return job_url_hash(context.get_current_parameters()["job_url"])
 
 
 class Base(DeclarativeBase):
@@ -8,6 +20,17 @@ class Base(DeclarativeBase):
 
 class Job(Base):
     __tablename__ = "jobs"
+    # Serves the /jobs sort order (date_posted, created_at, id; all descending)
+    # and its keyset-pagination range scans.
+    __table_args__ = (
+        Index("ix_jobs_date_posted_created_at_id", "date_posted", "created_at", "id"),
+        # Description backfill candidates: per site, rows whose next attempt is due.
+        Index("ix_jobs_site_name_backfill_next_attempt_at", "site_name", "backfill_next_attempt_at"),
+        # Full-text search for /jobs?q= (see app.fulltext); SQLite uses FTS5 instead.
+        Index(
+            MYSQL_FULLTEXT_INDEX, *FULLTEXT_COLUMNS, mysql_prefix="FULLTEXT"
+        ).ddl_if(dialect="mysql"),
+    )
 
     # Internal DB primary key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -18,7 +41,12 @@ class Job(Base):
     job_title: Mapped[str] = mapped_column(String(512))
     company: Mapped[str | None] = mapped_column(String(512), index=True, nullable=True)
     location: Mapped[str] = mapped_column(String(255), index=True)
-    job_url: Mapped[str] = mapped_column(Text, unique=True)
+    job_url: Mapped[str] = mapped_column(Text)
+    # Dedup key: fixed-width hash of the canonical job_url (see app.urlkey).
+    # Filled automatically from job_url when not supplied explicitly.
+    job_url_hash: Mapped[bytes] = mapped_column(
+        BINARY(JOB_URL_HASH_BYTES), unique=True, index=True, default=_job_url_hash_default
+    )
 
     # New scraper attributes
     job_type: Mapped[str | None] = mapped_column(String(128), nullable=True)
@@ -39,3 +67,133 @@ class Job(Base):
 
     # Metadata
     created_at: Mapped[DateTime] = mapped_column(DateTime, server_default=func.now())
+    # Bumped by every UPDATE of the row (ETag of /jobs/{id}, see app.conditional).
+    row_version: Mapped[int] = mapped_column(
+        Integer, default=1, server_default="1", nullable=False,
+        onupdate=literal_column("row_version") + 1,
+    )
+    # Time of the last UPDATE (None until the row is first changed).
+    updated_at: Mapped[DateTime | None] = mapped_column(
+        DateTime, nullable=True, onupdate=func.now()
+    )
+
+    # Description backfill bookkeeping (see crud.record_backfill_failures):
+    # failed fetches so far, the last failure, and when the row is due again.
+    backfill_attempts: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    backfill_last_error: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    backfill_next_attempt_at: Mapped[DateTime | None] = mapped_column(DateTime, nullable=True)
+    # Sweep currently holding the job (see crud.claim_backfill_jobs); a lease
+    # past its expiry is free to be claimed again.
+    backfill_owner: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    backfill_lease_expires_at: Mapped[DateTime | None] = mapped_column(DateTime, nullable=True)
+
+
+# SQLite counterpart of the FULLTEXT index (create_all in tests/local runs).
+for _stmt in SQLITE_FTS_DDL:
+    event.listen(Job.__table__, "after_create", DDL(_stmt).execute_if(dialect="sqlite"))
+
+
+class JobTrigram(Base):
+    """One lower-cased trigram of a distinct search_term/location/company value.
+
+    See app.trigram. Filled for every inserted job: by ``crud.upsert_jobs`` for
+    its bulk inserts, and by the ``after_insert`` hook below for ORM inserts.
+    """
+    __tablename__ = "job_trigrams"
+
+    field: Mapped[str] = mapped_column(String(16), primary_key=True)
+    # Binary collation on MySQL: trigrams and values compare exactly as in
+    # Python, so a value holds one row per query trigram (trigram_candidates
+    # relies on that) instead of several folded together by case/accents.
+    trigram: Mapped[str] = mapped_column(
+        String(3).with_variant(String(3, collation=TRIGRAM_COLLATION), "mysql"), primary_key=True
+    )
+    value: Mapped[str] = mapped_column(
+        String(512).with_variant(String(512, collation=TRIGRAM_COLLATION), "mysql"), primary_key=True
+    )
+
+
+@event.listens_for(Job, "after_insert")
+def _index_job_trigrams(mapper, connection, target):
+    rows = trigram_rows([{f: getattr(target, f) for f in TRIGRAM_FIELDS}])
+    if rows:
+        insert_trigrams(connection, rows)
+
+
+class ScrapeFlight(Base):
+    """Cross-worker single-flight lease for one normalized scrape payload.
+
+    The worker holding an unexpired, unfinished row is scraping that payload;
+    others wait for ``result`` instead of scraping it again. A finished row
+    serves its result until ``lease_expires_at``.
+    """
+    __tablename__ = "scrape_flights"
+
+    # sha256 hex of app.scraper.scrape_cache_key(payload)
+    key_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    owner: Mapped[str] = mapped_column(String(128))
+    lease_expires_at: Mapped[DateTime] = mapped_column(DateTime, index=True)
+    finished_at: Mapped[DateTime | None] = mapped_column(DateTime, nullable=True)
+    # JSON {"records": [...], "sites": {...}} once finished
+    result: Mapped[str | None] = mapped_column(
+        Text().with_variant(LONGTEXT(), "mysql"), nullable=True
+    )
+
+
+class ScrapeTask(Base):
+    """Durable unit of queued work (a scrape or a description backfill).
+
+    Rows are claimed by ``app.tasks`` workers through a conditional UPDATE, so
+    any number of worker processes can share the queue. A claimed task holds a
+    lease; a task whose worker died is re-queued once the lease expires.
+    """
+    __tablename__ = "scrape_tasks"
+    __table_args__ = (Index("ix_scrape_tasks_state_lease", "state", "lease_expires_at"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(32))            # "scrape" | "backfill"
+    state: Mapped[str] = mapped_column(String(16), default="queued")  # queued|running|succeeded|failed
+    payload: Mapped[str] = mapped_column(Text)                # JSON
+    result: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON counts/timings
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    owner: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    lease_expires_at: Mapped[DateTime | None] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[DateTime] = mapped_column(DateTime, server_default=func.now())
+    started_at: Mapped[DateTime | None] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[DateTime | None] = mapped_column(DateTime, nullable=True)
+
+
+class ScrapeWatermark(Base):
+    """High-water mark of one recurring query on one site.
+
+    Keyed by a hash of the normalized (site, search_term, location, is_remote);
+    read by ``app.scraper.plan_incremental_scrape`` to shrink the next scrape's
+    ``hours_old`` to the gap since ``last_success_at``.
+    """
+    __tablename__ = "scrape_watermarks"
+
+    key_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    site_name: Mapped[str] = mapped_column(String(64))
+    search_term: Mapped[str] = mapped_column(String(255))
+    location: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    is_remote: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Start time (APP_TIMEZONE wall-clock) of the last scrape that succeeded.
+    last_success_at: Mapped[DateTime] = mapped_column(DateTime)
+    # Newest date_posted seen for this query so far.
+    newest_date_posted: Mapped[DateTime | None] = mapped_column(DateTime, nullable=True)
+
+
+class DataVersion(Base):
+    """Cluster-wide change counter of one dataset (``name="jobs"``).
+
+    Bumped after writes to the dataset and read into the keys of result
+    caches (``JOBS_QUERY_CACHE_SHARED``), so a write by any worker
+    invalidates every worker's cached results.
+    """
+    __tablename__ = "data_versions"
+
+    name: Mapped[str] = mapped_column(String(32), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -0,0 +1,36 @@
+import base64
+import json
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+
+class JobCursor(NamedTuple):
+    """Sort key of the last job on a ``/jobs`` page (see crud.list_jobs)."""
+    date_posted: Optional[datetime]
+    created_at: datetime
+    id: int
+
+
+def encode_job_cursor(job) -> str:
+    """Opaque ``next_cursor`` token for the page that ends with ``job``."""
+    key = [
+        job.date_posted.isoformat() if job.date_posted is not None else None,
+        job.created_at.isoformat(),
+        job.id,
+    ]
+    raw = json.dumps(key, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_job_cursor(token: str) -> JobCursor:
+    """Inverse of ``encode_job_cursor``. Raises ValueError on a malformed token."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        date_posted, created_at, job_pk = json.loads(raw)
+        return JobCursor(
+            datetime.fromisoformat(date_posted) if date_posted is not None else None,
+            datetime.fromisoformat(created_at),
+            int(job_pk),
+        )
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"invalid cursor: {token!r}") from e
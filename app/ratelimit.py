@@ -0,0 +1,96 @@
+import threading
+import time
+from typing import Optional
+
+
+def is_throttle(status: Optional[int]) -> bool:
+    """True for a response that signals load: 429, any 5xx, or none at all."""
+    return status is None or status == 429 or status >= 500
+
+
+class AdaptiveRateLimiter:
+    """Token bucket shared by every thread, with an AIMD-adapted refill rate.
+
+    ``acquire()`` blocks until the caller may send one request; tokens refill
+    at ``rate`` per second up to ``burst``. Callers report each outcome with
+    ``record(status)``: a success raises the rate by ``increase`` (additive),
+    a throttle signal (429, 5xx, or no response at all) multiplies it by
+    ``decrease`` and empties the bucket, so every thread backs off at once.
+    The rate stays within ``[min_rate, max_rate]``. Other 4xx (e.g. a removed
+    job's 404) say nothing about load and leave the rate alone.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        min_rate: float,
+        max_rate: float,
+        increase: float,
+        decrease: float,
+        burst: float = 1.0,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.burst = max(1.0, burst)
+        self.rate = min(max(rate, min_rate), max_rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+        self.acquired = 0
+        self.waited_seconds = 0.0
+        self.successes = 0
+        self.throttles = 0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Wait for one token; returns the seconds waited.
+
+        The token is reserved up front (the bucket may go negative), so
+        concurrent callers queue up behind each other instead of all waking
+        at the same refill.
+        """
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.acquired += 1
+            self.waited_seconds += wait
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def record(self, status: Optional[int]) -> None:
+        """Adapt the rate to one response's HTTP status (None: no response)."""
+        with self._lock:
+            if is_throttle(status):
+                self.throttles += 1
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self._refill(self._clock())
+                self._tokens = min(self._tokens, 0.0)
+            elif status < 400:
+                self.successes += 1
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "rate_per_second": round(self.rate, 4),
+                "min_rate": self.min_rate,
+                "max_rate": self.max_rate,
+                "burst": self.burst,
+                "tokens": round(min(self.burst, self._tokens), 4),
+                "acquired": self.acquired,
+                "waited_seconds": round(self.waited_seconds, 3),
+                "successes": self.successes,
+                "throttles": self.throttles,
+            }
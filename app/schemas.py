@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Literal, Optional, List
 
 from app.config import get_settings
 from app.timeutils import local_now_naive
@@ -67,6 +67,49 @@ class ScrapeRequest(BaseModel):
     #            is also True, LinkedIn descriptions are fetched afterwards in the
     #            background. If it is False, no descriptions are fetched (summary only).
     background: bool = False
+    # Scrape each site in its own concurrent jobspy call (bounded by
+    # SCRAPE_SITE_CONCURRENCY) instead of one combined call. Wall-clock drops to
+    # roughly the slowest site, and a failing site is reported in the response's
+    # `sites` map instead of failing the whole request (502 only if all fail).
+    parallel_sites: bool = False
+    # Serve an identical payload scraped within SCRAPE_CACHE_TTL_SECONDS from the
+    # in-process cache. False forces a fresh scrape (which then refreshes the cache).
+    use_cache: bool = True
+    # Durable queue mode: persist the scrape as a task and return its id at once
+    # (HTTP 202); poll GET /tasks/{id}. Takes precedence over `background`.
+    queue: bool = False
+    # Incremental scraping shrinks hours_old/results_wanted to the gap since this
+    # query last succeeded (SCRAPE_INCREMENTAL_ENABLED). True forces the full
+    # requested window.
+    full_window: bool = False
+
+
+class BatchScrapeRequest(BaseModel):
+    # Each entry is scraped like a sync /scrape call (its `background` flag is
+    # ignored); results are de-duplicated across the batch and persisted once.
+    requests: List[ScrapeRequest] = Field(..., min_length=1)
+    # Queries scraped concurrently; defaults to SCRAPE_BATCH_CONCURRENCY.
+    concurrency: Optional[int] = Field(default=None, ge=1)
+
+
+class TaskOut(BaseModel):
+    id: int
+    kind: str
+    state: str
+    attempts: int
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    seconds: Optional[float] = None
+
+
+# Columns of the `fields=summary` preset: enough to list, link and triage jobs.
+JOB_SUMMARY_FIELDS = [
+    "id", "site_name", "job_title", "company", "location", "job_url",
+    "date_posted", "is_remote", "applied", "created_at",
+]
 
 
 def _default_created_after() -> datetime:
@@ -75,9 +118,12 @@ def _default_created_after() -> datetime:
     Computed per request via default_factory so the window never freezes at
     import/container-start time. Uses APP_TIMEZONE wall-clock (Berlin) to match
     the DB's naive ``created_at`` (compared with ``>=`` in crud.list_jobs).
+    Floored to the minute, so polls within a minute resolve to the same query
+    (and share the /jobs query cache entry).
     """
     days = get_settings().CREATED_AFTER_WINDOW_DAYS
-    return local_now_naive() - timedelta(days=days)
+    cutoff = local_now_naive() - timedelta(days=days)
+    return cutoff.replace(second=0, microsecond=0)
 
 
 class JobsQuery(BaseModel):
@@ -85,7 +131,13 @@ class JobsQuery(BaseModel):
     search_term: Optional[str] = None
     location: Optional[str] = None
     company: Optional[str] = None
-    q: Optional[str] = None
+    q: Optional[str] = Field(
+        default=None,
+        description=(
+            "Keyword search over title, description and company. Every word must "
+            "match the start of a word (full-text index)."
+        ),
+    )
     applied: Optional[bool] = Field(
         default=None,
         description="Filter by application status (true = applied, false = not applied).",
@@ -111,6 +163,56 @@ class JobsQuery(BaseModel):
 
     limit: int = 20
     offset: int = 0
+    sort: Literal["recent", "relevance"] = Field(
+        default="recent",
+        description=(
+            "`recent`: newest postings first. `relevance`: best `q` matches first "
+            "(only with `q`; not combinable with `cursor`)."
+        ),
+    )
+    count: Literal["exact", "estimate", "none"] = Field(
+        default="exact",
+        description=(
+            "How `total` is computed: `exact` (COUNT, briefly cached), `estimate` "
+            "(recent cached count or the DB planner's estimate) or `none` "
+            "(skipped; `total` is null)."
+        ),
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        description=(
+            "Opaque keyset cursor: pass a previous response's `next_cursor` to get "
+            "the page after it (`offset` is then ignored). Constant cost per page, "
+            "and stable while new jobs are inserted."
+        ),
+    )
+    fields: Optional[str] = Field(
+        default=None,
+        description=(
+            "Comma-separated job fields to return (e.g. `id,job_title,job_url`), or "
+            "`summary` for a light listing shape without the description. Only "
+            "these columns are read from the DB. Omit for every field."
+        ),
+        json_schema_extra={"example": "summary"},
+    )
+
+    def resolve_fields(self) -> Optional[List[str]]:
+        """Job fields requested via ``fields`` (in ``JobOut`` order), None for all.
+
+        Raises ValueError on an unknown field name; the caller maps it to 400.
+        """
+        if not self.fields:
+            return None
+        wanted = set()
+        for name in self.fields.split(","):
+            name = name.strip()
+            if name == "summary":
+                wanted.update(JOB_SUMMARY_FIELDS)
+            elif name in JobOut.model_fields:
+                wanted.add(name)
+            elif name:
+                raise ValueError(f"unknown field {name!r} in fields")
+        return [name for name in JobOut.model_fields if name in wanted] or None
 
     def resolve_created_after(self) -> Optional[datetime]:
         """Effective created_at lower bound applied by crud.list_jobs.
@@ -1,22 +1,52 @@
 import csv
+import hashlib
+import json
+import math
+import os
 import re
+import socket
 import time
 import threading
+import uuid
+from datetime import datetime
 from types import SimpleNamespace
-from typing import List, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import numpy as np
 import pandas as pd
 from jobspy import scrape_jobs
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from app.cache import SingleFlight, TTLCache
+from app.ratelimit import AdaptiveRateLimiter, is_throttle
 from app.logging_config import logger
 from app.config import get_settings
 
 settings = get_settings()
 
+# Recent scrape results keyed by the normalized payload (see scrape_cache_key).
+_SCRAPE_CACHE = TTLCache(
+    maxsize=settings.SCRAPE_CACHE_MAX_ENTRIES, ttl=settings.SCRAPE_CACHE_TTL_SECONDS
+)
+# Concurrent identical scrapes in this process share one jobspy call.
+_SCRAPE_FLIGHTS = SingleFlight()
+
 # Guards against overlapping backfill sweeps (only one sweep at a time; the
 # per-sweep ThreadPoolExecutor bounds concurrent LinkedIn fetches).
 _BACKFILL_LOCK = threading.Lock()
+# Paces every LinkedIn detail fetch of this process (backfill and sync scrapes).
+_LINKEDIN_RATE_LIMITER = AdaptiveRateLimiter(
+    settings.LINKEDIN_RATE_INITIAL,
+    min_rate=settings.LINKEDIN_RATE_MIN,
+    max_rate=settings.LINKEDIN_RATE_MAX,
+    increase=settings.LINKEDIN_RATE_INCREASE,
+    decrease=settings.LINKEDIN_RATE_DECREASE,
+    burst=settings.LINKEDIN_RATE_BURST,
+)
+# Counters of the running (or last finished) sweep; see backfill_progress().
+_BACKFILL_PROGRESS: Dict[str, Any] = {"running": False}
+_BACKFILL_PROGRESS_LOCK = threading.Lock()
 _LINKEDIN_JOB_ID_RE = re.compile(r"/jobs/view/(\d+)")
 
 
@@ -48,13 +78,84 @@ COLMAP = {
 }
 
 
-def run_scrape(payload: dict) -> List[Dict]:
-    log = logger.bind(event="scrape.start", search_term=payload.get("search_term"))
-    log.info("Starting job scrape", payload=payload)
+# Keys of every normalized record, in order.
+REQUIRED_COLS = [
+    "site_name", "search_term", "job_title", "company", "location", "job_url",
+    "job_type", "job_level", "emails", "company_industry", "company_url",
+    "description", "date_posted", "salary", "is_remote", "job_id"
+]
+
+
+def _is_missing(value) -> bool:
+    # NaN/NaT/pd.NA -> None. Lists/dicts (e.g. emails) are never "missing".
+    return (
+        value is None
+        or value is pd.NaT
+        or value is pd.NA
+        or (isinstance(value, float) and math.isnan(value))
+    )
+
+
+def _column_values(series: pd.Series) -> list:
+    return [None if _is_missing(v) else v for v in series.tolist()]
+
+
+def _strip_or_none(value):
+    # Company is optional (task #6, policy A): keep company-less jobs, but
+    # normalize blank/whitespace to a clean NULL so we never store "" or "   ".
+    return (value.strip() or None) if isinstance(value, str) else value
+
+
+def normalize_jobs_frame(jobs_df: pd.DataFrame, search_term: Optional[str]) -> List[dict]:
+    """Turn a jobspy frame into ``REQUIRED_COLS`` record dicts in a single pass.
+
+    Each needed column is converted to a Python list once (COLMAP renames
+    resolved by name, absent columns become ``None``, ``date_posted`` parsed
+    vectorized, NaN/NaT mapped to ``None``) and the records are zipped from
+    those lists, so the frame itself is never copied, renamed or rewritten.
+    """
+    n = len(jobs_df)
+    sources: Dict[str, str] = {}
+    for col in jobs_df.columns:
+        sources.setdefault(COLMAP.get(col, col), col)
+
+    columns = []
+    for col in REQUIRED_COLS:
+        src = sources.get(col)
+        if col == "search_term":
+            values = [search_term] * n
+        elif src is None:
+            values = [None] * n
+        elif col == "date_posted":
+            values = _column_values(pd.to_datetime(jobs_df[src], errors="coerce"))
+        elif col == "company":
+            values = [_strip_or_none(v) for v in _column_values(jobs_df[src])]
+        else:
+            values = _column_values(jobs_df[src])
+        columns.append(values)
+
+    return [dict(zip(REQUIRED_COLS, row)) for row in zip(*columns)]
+
+
+class ScrapeResult(list):
+    """Normalized job records returned by ``run_scrape``.
+
+    A plain list of record dicts (so every existing caller keeps working) that
+    also carries ``sites``: the per-site report of a fanned-out scrape, mapping
+    site name -> ``{"ok", "returned", "seconds"[, "error"]}``. Empty when the
+    sites were scraped together in a single jobspy call.
+    """
 
+    def __init__(self, records=(), sites: Optional[Dict[str, dict]] = None):
+        super().__init__(records)
+        self.sites = sites or {}
+
+
+def _scrape_frame(payload: dict, sites: List[str]) -> pd.DataFrame:
+    """One ``jobspy.scrape_jobs`` call for ``sites``; raises ScrapeError on failure."""
     try:
-        jobs_df = scrape_jobs(
-            site_name=payload.get("site_name"),
+        return scrape_jobs(
+            site_name=sites,
             search_term=payload.get("search_term"),
             google_search_term=payload.get("google_search_term"),
             location=payload.get("location"),
@@ -71,7 +172,7 @@ def run_scrape(payload: dict) -> List[Dict]:
         # then surface a typed error the API maps to a clean 502.
         logger.bind(
             event="scrape.error",
-            site_name=payload.get("site_name"),
+            site_name=sites,
             search_term=payload.get("search_term"),
             location=payload.get("location"),
             results_wanted=payload.get("results_wanted", 20),
@@ -79,9 +180,215 @@ def run_scrape(payload: dict) -> List[Dict]:
         raise ScrapeError(
             f"scrape failed for '{payload.get('search_term')}' "
             f"@ '{payload.get('location')}' "
-            f"(sites={payload.get('site_name')}): {e}"
+            f"(sites={sites}): {e}"
         ) from e
 
+
+def _scrape_sites_parallel(payload: dict, sites: List[str]):
+    """Scrape each site in its own jobspy call on a bounded thread pool.
+
+    Wall-clock is roughly the slowest single site instead of the sum, and one
+    failing site no longer sinks the others: its error is recorded in the
+    per-site report. Raises ScrapeError only when every site failed.
+    Returns ``(merged_frame, report)``.
+    """
+    def one(site):
+        t0 = time.perf_counter()
+        try:
+            df = _scrape_frame(payload, [site])
+        except ScrapeError as e:
+            return site, None, {
+                "ok": False, "returned": 0,
+                "seconds": round(time.perf_counter() - t0, 3), "error": str(e),
+            }
+        return site, df, {
+            "ok": True, "returned": len(df),
+            "seconds": round(time.perf_counter() - t0, 3),
+        }
+
+    workers = max(1, min(len(sites), settings.SCRAPE_SITE_CONCURRENCY))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        results = list(ex.map(one, sites))
+
+    report = {site: info for site, _, info in results}
+    failed = [site for site, info in report.items() if not info["ok"]]
+    if len(failed) == len(sites):
+        raise ScrapeError(
+            "scrape failed for every site: "
+            + "; ".join(report[site]["error"] for site in failed)
+        )
+    if failed:
+        logger.bind(event="scrape.partial", failed=failed, sites=report).warning(
+            f"Scrape succeeded for {len(sites) - len(failed)}/{len(sites)} sites"
+        )
+
+    frames = [df for _, df, _ in results if df is not None and not df.empty]
+    jobs_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    return jobs_df, report
+
+
+def _fold(value):
+    return value.strip().casefold() if isinstance(value, str) else value
+
+
+def scrape_cache_key(payload: dict) -> tuple:
+    """Normalized identity of a scrape payload: equal keys => same jobspy query.
+
+    Sites are de-duplicated and sorted, free-text fields stripped and
+    case-folded, and ``is_remote`` None/False collapsed (jobspy treats them the
+    same). Response-shaping flags (``background``, ``parallel_sites``,
+    ``use_cache``) are not part of the key.
+    """
+    sites = tuple(sorted({_fold(str(s)) for s in payload.get("site_name") or []}))
+    return (
+        sites,
+        _fold(payload.get("search_term")),
+        _fold(payload.get("google_search_term")),
+        _fold(payload.get("location")),
+        _fold(payload.get("country_indeed")),
+        payload.get("results_wanted", 20),
+        payload.get("hours_old", 72),
+        bool(payload.get("is_remote")),
+        bool(payload.get("linkedin_fetch_description", False)),
+    )
+
+
+def _copy_result(result: ScrapeResult) -> ScrapeResult:
+    # Callers own their records; never hand out the cached dicts themselves.
+    return ScrapeResult([dict(r) for r in result], sites=dict(result.sites))
+
+
+def scrape_cache_stats() -> dict:
+    return _SCRAPE_CACHE.stats()
+
+
+def scrape_singleflight_stats() -> dict:
+    return _SCRAPE_FLIGHTS.stats()
+
+
+def run_scrape(payload: dict) -> ScrapeResult:
+    """Scrape and normalize jobs for ``payload``, via the TTL result cache.
+
+    A cache hit returns a copy of the earlier result without calling jobspy.
+    ``use_cache=False`` skips the lookup; the fresh result still refreshes the
+    cache. Results with a failed site (``parallel_sites``) are never cached.
+    Concurrent identical payloads are coalesced into one scrape (single-flight),
+    across workers too when ``SCRAPE_SINGLEFLIGHT_DB`` is enabled.
+    """
+    key = scrape_cache_key(payload)
+    use_cache = payload.get("use_cache", True)
+    if use_cache:
+        cached = _SCRAPE_CACHE.get(key)
+        if cached is not None:
+            logger.bind(event="scrape.cache_hit", search_term=payload.get("search_term")).info(
+                f"Serving {len(cached)} cached jobs"
+            )
+            return _copy_result(cached)
+
+    result, shared = _SCRAPE_FLIGHTS.do(key, lambda: _scrape_shared(payload, key, use_cache))
+    if shared:
+        logger.bind(event="scrape.coalesced", search_term=payload.get("search_term")).info(
+            f"Joined an in-flight identical scrape ({len(result)} jobs)"
+        )
+    return _copy_result(result)
+
+
+def _scrape_shared(payload: dict, key: tuple, use_cache: bool) -> ScrapeResult:
+    if settings.SCRAPE_SINGLEFLIGHT_DB:
+        result = _scrape_with_db_lease(payload, key, use_cache)
+    else:
+        result = _run_scrape_uncached(payload)
+    if all(info["ok"] for info in result.sites.values()):
+        _SCRAPE_CACHE.set(key, result)
+    return result
+
+
+# Identifies this process as a lease owner (scrape_flights, backfill leases).
+_FLIGHT_OWNER = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def _encode_result(result: ScrapeResult) -> str:
+    return json.dumps({"records": list(result), "sites": result.sites}, default=_json_default)
+
+
+def _decode_result(raw: str) -> ScrapeResult:
+    data = json.loads(raw)
+    for r in data["records"]:
+        if r.get("date_posted"):
+            r["date_posted"] = datetime.fromisoformat(r["date_posted"])
+    return ScrapeResult(data["records"], sites=data["sites"])
+
+
+def _scrape_with_db_lease(payload: dict, key: tuple, use_cache: bool, session_factory=None):
+    """Cross-worker single-flight via a ``scrape_flights`` lease row.
+
+    The worker that inserts the lease scrapes and publishes the JSON result;
+    the others poll until it is published (then reuse it) or the lease expires
+    (crashed leader), in which case one of them takes over.
+    """
+    from app.crud import claim_scrape_flight, finish_scrape_flight
+    if session_factory is None:
+        from app.db import SessionLocal
+        session_factory = SessionLocal
+
+    key_hash = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+    while True:
+        db = session_factory()
+        try:
+            state, raw = claim_scrape_flight(
+                db, key_hash, _FLIGHT_OWNER, settings.SCRAPE_FLIGHT_LEASE_SECONDS,
+                accept_finished=use_cache,
+            )
+        finally:
+            db.close()
+
+        if state == "finished":
+            logger.bind(event="scrape.coalesced", scope="db").info(
+                "Reusing a scrape published by another worker"
+            )
+            return _decode_result(raw)
+        if state == "leader":
+            break
+        time.sleep(settings.SCRAPE_FLIGHT_POLL_SECONDS)
+
+    result = None
+    try:
+        result = _run_scrape_uncached(payload)
+        return result
+    finally:
+        publish = result is not None and all(info["ok"] for info in result.sites.values())
+        db = session_factory()
+        try:
+            finish_scrape_flight(
+                db, key_hash, _FLIGHT_OWNER,
+                _encode_result(result) if publish else None,
+                keep_seconds=settings.SCRAPE_CACHE_TTL_SECONDS,
+            )
+        except Exception:
+            logger.bind(event="scrape.flight_error").exception("failed to publish scrape flight")
+        finally:
+            db.close()
+
+
+def _run_scrape_uncached(payload: dict) -> ScrapeResult:
+    log = logger.bind(event="scrape.start", search_term=payload.get("search_term"))
+    log.info("Starting job scrape", payload=payload)
+
+    sites = list(payload.get("site_name") or [])
+    report: Dict[str, dict] = {}
+    if payload.get("parallel_sites") and len(sites) > 1:
+        jobs_df, report = _scrape_sites_parallel(payload, sites)
+    else:
+        jobs_df = _scrape_frame(payload, payload.get("site_name"))
+
     count = len(jobs_df)
     logger.bind(event="scrape.success").info(f"Scraped {count} jobs successfully.")
 
@@ -90,40 +397,13 @@ def run_scrape(payload: dict) -> List[Dict]:
     # -----------------------------
     if jobs_df.empty:
         logger.warning("Scrape returned 0 jobs. Returning empty list.")
-        return []
-
-    # Rename columns according to COLMAP
-    jobs_df = jobs_df.rename(columns={k: v for k, v in COLMAP.items() if k in jobs_df.columns})
-
-    # Ensure essential columns exist
-    for col in ["site_name", "job_title", "company", "location", "job_url"]:
-        if col not in jobs_df.columns:
-            jobs_df[col] = None
-
-    # Ensure all required downstream columns exist
-    REQUIRED_COLS = [
-        "site_name", "search_term", "job_title", "company", "location", "job_url",
-        "job_type", "job_level", "emails", "company_industry", "company_url",
-        "description", "date_posted", "salary", "is_remote", "job_id"
-    ]
-
-    # -----------------------------
-    # FIX #2: Add any missing columns
-    # -----------------------------
-    for col in REQUIRED_COLS:
-        if col not in jobs_df.columns:
-            jobs_df[col] = None
-
-    # Parse date_posted if present
-    if "date_posted" in jobs_df.columns:
-        jobs_df["date_posted"] = pd.to_datetime(jobs_df["date_posted"], errors="coerce")
+        return ScrapeResult(sites=report)
 
-    # Add search term column
-    jobs_df["search_term"] = payload.get("search_term")
+    records = normalize_jobs_frame(jobs_df, payload.get("search_term"))
 
     # Debug CSV dump in development
     if settings.APP_ENV.lower() == "dev":
-        jobs_df.to_csv(
+        pd.DataFrame.from_records(records, columns=REQUIRED_COLS).to_csv(
             "/jobs.csv",
             quoting=csv.QUOTE_NONNUMERIC,
             escapechar="\\",
@@ -131,23 +411,107 @@ def run_scrape(payload: dict) -> List[Dict]:
         )
         logger.debug("Saved debug CSV output to jobs.csv")
 
-    # Clean NaNs
-    jobs_df.replace({np.nan: None, pd.NaT: None}, inplace=True)
-    jobs_df.where(pd.notnull(jobs_df), None, inplace=True)
+    return ScrapeResult(records, sites=report)
 
-    # Company is optional (task #6, policy A): keep company-less jobs, but
-    # normalize blank/whitespace to a clean NULL so we never store "" or "   ".
-    if "company" in jobs_df.columns:
-        jobs_df["company"] = jobs_df["company"].map(
-            lambda v: (v.strip() or None) if isinstance(v, str) else v
-        )
 
-    # -----------------------------
-    # FIX #3: Now it's safe — no KeyError possible
-    # -----------------------------
-    records = jobs_df[REQUIRED_COLS].to_dict(orient="records")
+# ---------------------------------------------------------------------------
+# Incremental scraping (per-query high-water marks)
+# ---------------------------------------------------------------------------
 
-    return records
+def _watermark_key(site: str, payload: dict) -> tuple[str, dict]:
+    ident = {
+        "site_name": _fold(str(site)),
+        "search_term": _fold(payload.get("search_term")) or "",
+        "location": _fold(payload.get("location")),
+        "is_remote": bool(payload.get("is_remote")),
+    }
+    return hashlib.sha256(repr(sorted(ident.items())).encode("utf-8")).hexdigest(), ident
+
+
+def plan_incremental_scrape(db, payload: dict) -> tuple[dict, dict]:
+    """Shrink a recurring query's window to the gap since its last success.
+
+    Looks up the watermark of every (site, search_term, location, is_remote) in
+    the payload. If all sites have one, ``hours_old`` becomes the hours since
+    the oldest ``last_success_at`` plus ``SCRAPE_INCREMENTAL_MARGIN_HOURS``
+    (never more than requested) and ``results_wanted`` shrinks in proportion,
+    floored at ``SCRAPE_INCREMENTAL_MIN_RESULTS``. Any site without a
+    watermark, ``full_window=True`` or the feature being disabled keeps the
+    requested window. Returns ``(effective_payload, window)``; pass ``window``
+    to ``record_incremental_scrape`` once the scrape succeeded.
+    """
+    from app.crud import get_scrape_watermarks
+    from app.timeutils import local_now_naive
+
+    requested_hours = payload.get("hours_old", 72)
+    requested_results = payload.get("results_wanted", 20)
+    window = {
+        "incremental": False,
+        "hours_old": requested_hours,
+        "results_wanted": requested_results,
+        "started_at": local_now_naive(),
+    }
+    sites = list(payload.get("site_name") or [])
+    if not settings.SCRAPE_INCREMENTAL_ENABLED or payload.get("full_window") or not sites:
+        return payload, window
+    if not requested_hours or requested_hours <= 0:
+        return payload, window
+
+    keys = [_watermark_key(site, payload)[0] for site in sites]
+    marks = get_scrape_watermarks(db, keys)
+    if len(marks) < len(set(keys)):
+        return payload, window
+
+    oldest = min(m.last_success_at for m in marks.values())
+    gap_hours = max((window["started_at"] - oldest).total_seconds(), 0) / 3600
+    hours = math.ceil(gap_hours + settings.SCRAPE_INCREMENTAL_MARGIN_HOURS)
+    if hours >= requested_hours:
+        return payload, window
+
+    results = max(
+        settings.SCRAPE_INCREMENTAL_MIN_RESULTS,
+        math.ceil(requested_results * hours / requested_hours),
+    )
+    window.update(
+        incremental=True, hours_old=hours, results_wanted=min(results, requested_results)
+    )
+    logger.bind(event="scrape.incremental", search_term=payload.get("search_term"),
+                hours_old=hours, results_wanted=window["results_wanted"]).info(
+        f"Incremental window: {hours}h instead of {requested_hours}h"
+    )
+    return {**payload, "hours_old": hours, "results_wanted": window["results_wanted"]}, window
+
+
+def record_incremental_scrape(db, payload: dict, window: dict, records) -> None:
+    """Advance the watermark of every site that scraped successfully.
+
+    A site that returned ``results_wanted`` rows or more saturated its window,
+    so postings older than the ones it returned may never have been fetched.
+    Its watermark only advances to the oldest ``date_posted`` it returned (or
+    stays put when none is known), keeping that gap inside the next window.
+    """
+    from app.crud import record_scrape_watermark
+
+    report = getattr(records, "sites", {}) or {}
+    for site in payload.get("site_name") or []:
+        if report and not report.get(site, {}).get("ok", False):
+            continue
+        key_hash, ident = _watermark_key(site, payload)
+        site_records = [
+            r for r in records if _fold(str(r.get("site_name"))) == ident["site_name"]
+        ]
+        posted = [r["date_posted"] for r in site_records if r.get("date_posted")]
+        last_success_at = window["started_at"]
+        if len(site_records) >= window["results_wanted"]:
+            if not posted:
+                continue
+            last_success_at = min(min(posted), last_success_at)
+        record_scrape_watermark(
+            db, key_hash,
+            last_success_at=last_success_at,
+            newest_date_posted=max(posted) if posted else None,
+            **ident,
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -186,17 +550,233 @@ def _make_linkedin_scraper():
     from jobspy.model import DescriptionFormat
     scraper = LinkedIn()
     scraper.scraper_input = SimpleNamespace(description_format=DescriptionFormat.MARKDOWN)
+    # jobspy's session retries 429/5xx internally with long backoffs, hiding
+    # them; retry only failed connects so throttling reaches the rate limiter.
+    adapter = HTTPAdapter(max_retries=Retry(total=2, connect=2, read=0, status=0))
+    scraper.session.mount("http://", adapter)
+    scraper.session.mount("https://", adapter)
     return scraper
 
 
-def _fetch_description_for_job(job_id: str) -> Optional[str]:
-    """Fetch one LinkedIn description. A fresh scraper per call keeps it thread-safe.
+class _PooledLinkedInScraper:
+    """A LinkedIn scraper plus the bookkeeping of its pool slot."""
+
+    def __init__(self, scraper, created: float):
+        self.scraper = scraper
+        self.created = created
+        self.uses = 0
+        # HTTP status of the last response, set by a session response hook
+        # (``_get_job_details`` swallows errors, so this is how we see them).
+        self.status: Optional[int] = None
+        scraper.session.hooks["response"].append(self._record_status)
+
+    def _record_status(self, response, *args, **kwargs):
+        self.status = response.status_code
+
+
+class _LinkedInScraperPool:
+    """Idle LinkedIn scrapers kept for reuse, so fetches share keep-alive connections.
+
+    A scraper is checked out by one thread at a time. It goes back to the pool
+    after a fetch unless it got throttled/failed (then it is recycled: session
+    closed, the next fetch starts fresh), outlived ``max_age`` seconds or served
+    ``max_uses`` fetches. At most ``maxsize`` idle scrapers are kept.
+    """
+
+    def __init__(self, maxsize: int, max_age: float, max_uses: int, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self.max_uses = max_uses
+        self._clock = clock
+        self._idle: List[_PooledLinkedInScraper] = []
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+        self.recycled = 0
+
+    def _fresh(self, pooled: _PooledLinkedInScraper) -> bool:
+        return pooled.uses < self.max_uses and self._clock() - pooled.created < self.max_age
+
+    def checkout(self) -> _PooledLinkedInScraper:
+        stale = []
+        with self._lock:
+            while self._idle:
+                pooled = self._idle.pop()
+                if self._fresh(pooled):
+                    self.reused += 1
+                    break
+                stale.append(pooled)
+            else:
+                pooled = None
+            self.recycled += len(stale)
+        for old in stale:
+            old.scraper.session.close()
+        if pooled is None:
+            pooled = _PooledLinkedInScraper(_make_linkedin_scraper(), self._clock())
+            with self._lock:
+                self.created += 1
+        pooled.uses += 1
+        pooled.status = None
+        return pooled
+
+    def checkin(self, pooled: _PooledLinkedInScraper, healthy: bool) -> None:
+        with self._lock:
+            keep = healthy and self._fresh(pooled) and len(self._idle) < self.maxsize
+            if keep:
+                self._idle.append(pooled)
+            else:
+                self.recycled += 1
+        if not keep:
+            pooled.scraper.session.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "idle": len(self._idle),
+                "maxsize": self.maxsize,
+                "created": self.created,
+                "reused": self.reused,
+                "recycled": self.recycled,
+            }
+
+
+# Idle LinkedIn scrapers (HTTP sessions) reused across detail fetches.
+_LINKEDIN_SCRAPERS = _LinkedInScraperPool(
+    maxsize=settings.LINKEDIN_SESSION_POOL_SIZE,
+    max_age=settings.LINKEDIN_SESSION_MAX_AGE_SECONDS,
+    max_uses=settings.LINKEDIN_SESSION_MAX_USES,
+)
+
+
+def _fetch_linkedin_details(job_id: str) -> tuple[dict, Optional[int]]:
+    """Fetch one LinkedIn detail page (description, job_level, company_industry, ...).
+
+    Runs on a scraper checked out of ``_LINKEDIN_SCRAPERS`` (never shared
+    between threads at the same time), so consecutive fetches reuse its HTTP
+    connection. Returns ``(details, status)``: ``details`` is ``{}`` on
+    failure and ``status`` the page's HTTP status (None: no response). Waits
+    for a token of the shared ``_LINKEDIN_RATE_LIMITER`` first and reports the
+    status back to it; a throttled or failed fetch also recycles the scraper.
+    """
+    pooled = _LINKEDIN_SCRAPERS.checkout()
+    healthy = False
+    _LINKEDIN_RATE_LIMITER.acquire()
+    try:
+        details = pooled.scraper._get_job_details(job_id) or {}
+        healthy = not is_throttle(pooled.status)
+        return details, pooled.status
+    finally:
+        _LINKEDIN_RATE_LIMITER.record(pooled.status)
+        _LINKEDIN_SCRAPERS.checkin(pooled, healthy)
+
+
+def linkedin_scraper_pool_stats() -> dict:
+    return _LINKEDIN_SCRAPERS.stats()
+
+
+def linkedin_rate_limiter_stats() -> dict:
+    return _LINKEDIN_RATE_LIMITER.stats()
+
+
+def _fetch_description_for_job(job_id: str) -> tuple[Optional[str], Optional[int]]:
+    """Fetch one LinkedIn description; ``(description, HTTP status)``.
 
     Isolated as its own function so tests can monkeypatch it (no network).
     """
-    scraper = _make_linkedin_scraper()
-    details = scraper._get_job_details(job_id) or {}
-    return details.get("description")
+    details, status = _fetch_linkedin_details(job_id)
+    return details.get("description"), status
+
+
+# Detail-page fields copied onto a listing-only record when it has none.
+_LINKEDIN_DETAIL_FIELDS = ("description", "job_level", "company_industry")
+
+
+def fetch_missing_linkedin_details(db, records) -> dict:
+    """Fill LinkedIn details onto listing-only ``records``, skipping known jobs.
+
+    With ``linkedin_fetch_description`` jobspy fetches a detail page for every
+    LinkedIn listing. Callers instead scrape listings only and pass the records
+    here: their URLs are looked up in the DB in bulk and details are fetched
+    just for jobs that are new or still have no description (bounded by
+    ``DESCRIPTION_BACKFILL_CONCURRENCY`` and the shared LinkedIn rate limiter). Stored
+    description-less rows get the fetched descriptions written directly, in one
+    batched UPDATE, since ``upsert_jobs`` leaves existing rows alone. Returns counts.
+    """
+    from app.crud import known_job_descriptions, set_job_descriptions
+    from app.urlkey import job_url_hash
+
+    by_hash: Dict[bytes, List[dict]] = {}
+    for r in records:
+        if str(r.get("site_name") or "").lower() == "linkedin" and _linkedin_job_id(r.get("job_url")):
+            by_hash.setdefault(job_url_hash(r["job_url"]), []).append(r)
+    known = known_job_descriptions(db, by_hash)
+    targets = [h for h in by_hash if not known.get(h, (None, False))[1]]
+    stats = {"status": "ok", "linkedin": len(by_hash), "known": len(by_hash) - len(targets),
+             "fetched": 0, "updated": 0}
+    if not targets:
+        return stats
+
+    s = get_settings()
+
+    def work(url_hash):
+        job_id = _linkedin_job_id(by_hash[url_hash][0]["job_url"])
+        try:
+            return url_hash, _fetch_linkedin_details(job_id)[0]
+        except Exception:
+            logger.bind(event="scrape.detail_error", job_id=job_id).exception(
+                "description fetch failed"
+            )
+            return url_hash, {}
+
+    with ThreadPoolExecutor(max_workers=max(1, s.DESCRIPTION_BACKFILL_CONCURRENCY)) as ex:
+        results = list(ex.map(work, targets))
+
+    stored: Dict[int, str] = {}
+    for url_hash, details in results:
+        if not details.get("description"):
+            continue
+        stats["fetched"] += 1
+        for r in by_hash[url_hash]:
+            for field in _LINKEDIN_DETAIL_FIELDS:
+                if r.get(field) is None and details.get(field) is not None:
+                    r[field] = details[field]
+        if url_hash in known:
+            stored[known[url_hash][0]] = details["description"]
+    stats["updated"] = set_job_descriptions(db, stored)
+
+    logger.bind(event="scrape.details", **stats).info(
+        f"LinkedIn details: fetched {stats['fetched']}/{len(targets)}, "
+        f"skipped {stats['known']} already described"
+    )
+    return stats
+
+
+def _backfill_progress_start(candidates: int) -> None:
+    with _BACKFILL_PROGRESS_LOCK:
+        _BACKFILL_PROGRESS.clear()
+        _BACKFILL_PROGRESS.update(
+            running=True, started_at=datetime.now().isoformat(timespec="seconds"),
+            candidates=candidates, fetched=0, failed=0, throttled=0, pending=0, updated=0,
+        )
+
+
+def _backfill_progress_add(running: Optional[bool] = None, **deltas: int) -> None:
+    with _BACKFILL_PROGRESS_LOCK:
+        for name, delta in deltas.items():
+            _BACKFILL_PROGRESS[name] = _BACKFILL_PROGRESS.get(name, 0) + delta
+        if running is not None:
+            _BACKFILL_PROGRESS["running"] = running
+
+
+def backfill_progress() -> dict:
+    """Counters of the running (or last) backfill sweep in this process.
+
+    ``fetched`` descriptions are ``pending`` until their batch is written;
+    ``updated`` counts rows actually written, ``failed`` fetches that gave none
+    (``throttled`` of them by a 429/5xx/no response).
+    """
+    with _BACKFILL_PROGRESS_LOCK:
+        return dict(_BACKFILL_PROGRESS)
 
 
 def run_description_backfill(
@@ -205,19 +785,41 @@ def run_description_backfill(
     window_days: int,
     limit: int,
     concurrency: int = 2,
-    delay: float = 2.0,
+    write_batch: Optional[int] = None,
 ) -> dict:
     """Backfill descriptions for description-less LinkedIn jobs (query-driven).
 
-    Only one sweep runs at a time (``_BACKFILL_LOCK``); within a sweep, up to
-    ``concurrency`` LinkedIn detail fetches run concurrently, each preceded by a
-    polite ``delay``. Network fetches run in worker threads; DB writes happen on a
-    single Session in the calling thread (Sessions are not thread-safe).
+    Only one sweep per process runs at a time (``_BACKFILL_LOCK``). Sweeps in
+    other workers/containers may run concurrently: each leases its jobs in the
+    DB (``crud.claim_backfill_jobs``), so they fetch disjoint sets. Leases are
+    taken one chunk (``max(write_batch, concurrency)`` jobs, up to ``limit`` in
+    total) at a time and released once the chunk is written, so a chunk's lease
+    only has to cover its own fetches. Within a sweep, up to ``concurrency`` LinkedIn detail
+    fetches run concurrently, paced by the shared adaptive rate limiter (see
+    ``_fetch_linkedin_details``). Network fetches run in worker threads; DB
+    writes happen on a single Session in the calling thread (Sessions are not
+    thread-safe).
+
+    Results are consumed as fetches complete and written every ``write_batch``
+    descriptions (default ``DESCRIPTION_BACKFILL_WRITE_BATCH``) in one UPDATE
+    plus commit, so a crash loses at most one batch and only that batch is held
+    in memory. Failed fetches are recorded per row with the batch, which defers
+    the job's next attempt (``crud.record_backfill_failures``); throttled ones
+    (429/5xx/no response) are deferred without using up an attempt. Progress is
+    visible via ``backfill_progress()``.
     """
-    from app.crud import list_linkedin_jobs_missing_description, set_job_description
+    from app.crud import (
+        claim_backfill_jobs,
+        record_backfill_failures,
+        release_backfill_jobs,
+        set_job_descriptions,
+    )
     if session_factory is None:
         from app.db import SessionLocal
         session_factory = SessionLocal
+    if write_batch is None:
+        write_batch = get_settings().DESCRIPTION_BACKFILL_WRITE_BATCH
+    write_batch = max(1, write_batch)
 
     if not has_description_backfill_support():
         logger.bind(event="backfill.unsupported").error(
@@ -230,42 +832,88 @@ def run_description_backfill(
         return {"status": "already_running", "candidates": 0, "updated": 0}
 
     try:
-        db = session_factory()
-        try:
-            jobs = list_linkedin_jobs_missing_description(db, window_days, limit)
-            targets = [(j.id, _linkedin_job_id(j.job_url)) for j in jobs]
-        finally:
-            db.close()
-
-        candidates = len(targets)
-        if not candidates:
-            return {"status": "ok", "candidates": 0, "updated": 0}
+        # Unique per sweep, so a later sweep of this process is another owner.
+        owner = f"{_FLIGHT_OWNER}:{uuid.uuid4().hex[:8]}"
+        lease_seconds = get_settings().DESCRIPTION_BACKFILL_LEASE_SECONDS
+        # Jobs are leased one chunk at a time, so a slow sweep (rate limiter
+        # backed off) never outlives its leases and other workers share the rest.
+        chunk_size = max(write_batch, concurrency, 1)
+        _backfill_progress_start(0)
 
         def work(item):
+            """``(job_pk, description, error, throttled)``; ``description`` or ``error`` is set.
+
+            ``throttled`` marks a 429/5xx/no-response fetch: that says nothing
+            about the job itself, so it is retried later without counting as
+            one of its attempts.
+            """
             job_pk, job_id = item
             if not job_id:
-                return (job_pk, None)
-            time.sleep(max(delay, 0))  # polite spacing to avoid LinkedIn 429s
+                return (job_pk, None, "no LinkedIn job id in job_url", False)
             try:
-                return (job_pk, _fetch_description_for_job(job_id))
-            except Exception:
+                desc, status = _fetch_description_for_job(job_id)
+            except Exception as e:
                 logger.bind(event="backfill.fetch_error", job_pk=job_pk).exception(
                     "description fetch failed"
                 )
-                return (job_pk, None)
-
-        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as ex:
-            results = list(ex.map(work, targets))
-
+                return (job_pk, None, f"fetch failed: {type(e).__name__}: {e}", False)
+            if desc:
+                return (job_pk, desc, None, False)
+            if is_throttle(status):
+                return (job_pk, None, f"throttled: HTTP {status}" if status else "no response", True)
+            return (job_pk, None, f"no description on page (HTTP {status})", False)
+
+        candidates = 0
         updated = 0
+        pending: Dict[int, str] = {}
+        # {job_pk: (attempts before this sweep, error, counts as an attempt)};
+        # written with each batch.
+        failures: Dict[int, tuple] = {}
         db = session_factory()
         try:
-            for job_pk, desc in results:
-                if desc and set_job_description(db, job_pk, desc):
-                    updated += 1
+            def flush():
+                nonlocal updated
+                written = set_job_descriptions(db, pending)
+                record_backfill_failures(db, failures)
+                updated += written
+                _backfill_progress_add(updated=written, pending=-len(pending))
+                pending.clear()
+                failures.clear()
+
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as ex:
+                while candidates < limit:
+                    jobs = claim_backfill_jobs(
+                        db, owner, window_days, min(chunk_size, limit - candidates), lease_seconds
+                    )
+                    if not jobs:
+                        break
+                    targets = [(j.id, _linkedin_job_id(j.job_url)) for j in jobs]
+                    attempts = {j.id: j.backfill_attempts or 0 for j in jobs}
+                    candidates += len(targets)
+                    _backfill_progress_add(candidates=len(targets))
+                    try:
+                        # as_completed drops each future once yielded, so a finished
+                        # description lives only until its batch is written.
+                        for future in as_completed([ex.submit(work, t) for t in targets]):
+                            job_pk, desc, error, throttled = future.result()
+                            if desc:
+                                pending[job_pk] = desc
+                                _backfill_progress_add(fetched=1, pending=1)
+                            else:
+                                failures[job_pk] = (attempts[job_pk], error, not throttled)
+                                _backfill_progress_add(failed=1, throttled=int(throttled))
+                            if len(pending) + len(failures) >= write_batch:
+                                flush()
+                        if pending or failures:
+                            flush()
+                    finally:
+                        release_backfill_jobs(db, owner, list(attempts))
         finally:
             db.close()
+            _backfill_progress_add(running=False)
 
+        if not candidates:
+            return {"status": "ok", "candidates": 0, "updated": 0}
         logger.bind(event="backfill.done", candidates=candidates, updated=updated).info(
             f"description backfill: {updated}/{candidates} updated"
         )
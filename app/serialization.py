@@ -0,0 +1,43 @@
+"""Single-pass JSON for job listings.
+
+``FastJSONResponse`` encodes its content with pydantic-core's Rust encoder,
+which handles pydantic models, datetimes and numpy scalars directly, so a
+route returning it skips FastAPI's ``jsonable_encoder`` walk and the stdlib
+``json.dumps`` of the result. ``jobs_payload`` validates a whole page of ORM
+rows in one ``TypeAdapter`` call and leaves the models to that encoder,
+instead of ``model_validate(...).model_dump()`` per row followed by a second
+encoding pass.
+"""
+from typing import Any, List, Optional
+
+import numpy as np
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from app.schemas import JobOut
+
+JOB_LIST_ADAPTER = TypeAdapter(List[JobOut])
+
+
+def _fallback(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def dumps(content: Any) -> bytes:
+    """JSON bytes for ``content``; NaN/inf become null as in ``jsonable_encoder`` output."""
+    return to_json(content, fallback=_fallback, inf_nan_mode="null")
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def jobs_payload(items, fields: Optional[List[str]] = None) -> list:
+    """Response items for Job rows: JobOut models, or dicts of only ``fields``."""
+    if fields is None:
+        return JOB_LIST_ADAPTER.validate_python(items, from_attributes=True)
+    return [{f: getattr(i, f) for f in fields} for i in items]
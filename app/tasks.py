@@ -0,0 +1,199 @@
+"""Durable scrape/backfill queue backed by the ``scrape_tasks`` table.
+
+``POST /scrape`` with ``queue=true`` only inserts a task row; a ``TaskWorkerPool``
+executes it. The pool runs inside each API process (``TASK_WORKERS`` threads,
+0 disables) and/or in dedicated worker processes:
+
+    poetry run python -m app.tasks [workers]
+
+Tasks survive restarts: a task claimed by a worker that dies is re-queued
+when its lease (``TASK_LEASE_SECONDS``) expires.
+"""
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+import uuid
+from typing import Optional
+
+from app.config import get_settings
+from app.crud import claim_next_task, create_task, finish_task, upsert_jobs
+from app.logging_config import logger
+from app.models import ScrapeTask
+from app.scraper import (
+    plan_incremental_scrape,
+    record_incremental_scrape,
+    run_description_backfill,
+    run_scrape,
+)
+
+
+def enqueue_scrape(db, payload: dict) -> ScrapeTask:
+    """Queue a scrape; ``payload`` is a ``ScrapeRequest.model_dump()``."""
+    return create_task(db, "scrape", payload)
+
+
+def enqueue_backfill(db, **params) -> ScrapeTask:
+    """Queue a description backfill sweep (``run_description_backfill`` kwargs)."""
+    return create_task(db, "backfill", params)
+
+
+def task_summary(task: ScrapeTask) -> dict:
+    """Public view of a task row (``GET /tasks/{id}``)."""
+    seconds = None
+    if task.started_at is not None and task.finished_at is not None:
+        seconds = round((task.finished_at - task.started_at).total_seconds(), 3)
+    return {
+        "id": task.id,
+        "kind": task.kind,
+        "state": task.state,
+        "attempts": task.attempts,
+        "result": json.loads(task.result) if task.result else None,
+        "error": task.error,
+        "created_at": task.created_at,
+        "started_at": task.started_at,
+        "finished_at": task.finished_at,
+        "seconds": seconds,
+    }
+
+
+def _run_scrape_task(payload: dict, session_factory) -> dict:
+    # Same split as background mode: listing pass now, LinkedIn descriptions as
+    # a follow-up backfill task so the scrape task finishes quickly.
+    wants_descriptions = bool(payload.get("linkedin_fetch_description"))
+    scrapes_linkedin = any(str(s).lower() == "linkedin" for s in payload.get("site_name") or [])
+    db = session_factory()
+    try:
+        scrape_payload, window = plan_incremental_scrape(
+            db, {**payload, "linkedin_fetch_description": False}
+        )
+    finally:
+        db.close()
+
+    t0 = time.perf_counter()
+    records = run_scrape(scrape_payload)
+    scrape_seconds = round(time.perf_counter() - t0, 3)
+
+    db = session_factory()
+    try:
+        inserted = upsert_jobs(db, records)
+        record_incremental_scrape(db, scrape_payload, window, records)
+        backfill_task_id = None
+        if wants_descriptions and scrapes_linkedin:
+            s = get_settings()
+            backfill_task_id = enqueue_backfill(
+                db,
+                window_days=s.DESCRIPTION_BACKFILL_WINDOW_DAYS,
+                limit=s.DESCRIPTION_BACKFILL_LIMIT,
+                concurrency=s.DESCRIPTION_BACKFILL_CONCURRENCY,
+            ).id
+    finally:
+        db.close()
+
+    return {
+        "returned": len(records),
+        "inserted": inserted,
+        "scrape_seconds": scrape_seconds,
+        "hours_old": window["hours_old"],
+        "incremental": window["incremental"],
+        "sites": getattr(records, "sites", {}),
+        "backfill_task_id": backfill_task_id,
+    }
+
+
+def execute_task(task: ScrapeTask, session_factory) -> dict:
+    """Run one claimed task and return its result summary (raises on failure)."""
+    payload = json.loads(task.payload)
+    if task.kind == "scrape":
+        return _run_scrape_task(payload, session_factory)
+    if task.kind == "backfill":
+        return run_description_backfill(session_factory, **payload)
+    raise ValueError(f"unknown task kind {task.kind!r}")
+
+
+class TaskWorkerPool:
+    """``workers`` threads that claim and execute queued tasks until stopped."""
+
+    def __init__(self, workers: int, session_factory=None, poll_seconds: Optional[float] = None):
+        if session_factory is None:
+            from app.db import SessionLocal
+            session_factory = SessionLocal
+        s = get_settings()
+        self.workers = workers
+        self.session_factory = session_factory
+        self.poll_seconds = s.TASK_POLL_SECONDS if poll_seconds is None else poll_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def run_once(self) -> bool:
+        """Claim and execute at most one task. Returns True if one was processed."""
+        s = get_settings()
+        db = self.session_factory()
+        try:
+            task = claim_next_task(db, self.owner, s.TASK_LEASE_SECONDS, s.TASK_MAX_ATTEMPTS)
+            if task is None:
+                return False
+            db.expunge(task)
+        finally:
+            db.close()
+
+        log = logger.bind(event="task.run", task_id=task.id, kind=task.kind, attempt=task.attempts)
+        log.info("Running queued task")
+        result, error = None, None
+        try:
+            result = execute_task(task, self.session_factory)
+        except Exception as e:
+            log.exception("Queued task failed")
+            error = str(e) or e.__class__.__name__
+
+        db = self.session_factory()
+        try:
+            if not finish_task(db, task.id, self.owner, result=result, error=error):
+                log.warning("Task lease lost before completion; result discarded")
+        finally:
+            db.close()
+        logger.bind(event="task.done", task_id=task.id, failed=error is not None).info(
+            "Queued task finished"
+        )
+        return True
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                if self.run_once():
+                    continue
+            except Exception:
+                logger.bind(event="task.worker_error").exception("task worker iteration failed")
+            self._stop.wait(self.poll_seconds)
+
+    def start(self) -> "TaskWorkerPool":
+        for i in range(self.workers):
+            t = threading.Thread(target=self._loop, name=f"task-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        logger.bind(event="task.pool_start", workers=self.workers).info("Task workers started")
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads.clear()
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else max(1, get_settings().TASK_WORKERS)
+    pool = TaskWorkerPool(workers).start()
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop.set())
+    stop.wait()
+    pool.stop()
+
+
+if __name__ == "__main__":
+    main()
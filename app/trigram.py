@@ -0,0 +1,89 @@
+"""Trigram side index for the substring filters of ``/jobs``.
+
+``search_term``, ``location`` and ``company`` are filtered with ``ilike
+'%value%'``, which no B-tree index can serve. Those columns hold few distinct
+values compared to the number of jobs (the same companies, cities and search
+terms recur), so ``job_trigrams`` indexes the distinct *values*: one row per
+(column, lower-cased 3-character window, value). A filter of 3+ characters
+first finds the values containing all of its trigrams (a small index probe),
+then the jobs through the column's own B-tree index (``column IN (values)``);
+the ``ilike`` stays on as the exact check, since trigrams can give false
+positives but never false negatives.
+"""
+from typing import Iterable, List, Mapping, Set
+
+# Job columns indexed in job_trigrams.
+TRIGRAM_FIELDS = ("search_term", "location", "company")
+# MySQL collation of job_trigrams.trigram/value: binary, so the default
+# case/accent-insensitive one cannot fold distinct trigrams together.
+TRIGRAM_COLLATION = "utf8mb4_bin"
+
+
+def trigrams(value) -> Set[str]:
+    """Distinct lower-cased 3-character windows of ``value`` (empty if shorter).
+
+    ``lower()`` rather than ``casefold()``: it must fold case the way SQL
+    ``LOWER()`` (and thus ``ilike``) does, or the probe could miss real matches.
+    """
+    if not isinstance(value, str):
+        return set()
+    folded = value.lower()
+    return {folded[i:i + 3] for i in range(len(folded) - 2)}
+
+
+def trigram_rows(jobs: Iterable[Mapping]) -> List[dict]:
+    """``job_trigrams`` rows for the distinct indexed values of ``jobs``."""
+    values = {
+        (field, job.get(field))
+        for job in jobs
+        for field in TRIGRAM_FIELDS
+        if isinstance(job.get(field), str)
+    }
+    return [
+        {"field": field, "trigram": gram, "value": value}
+        for field, value in sorted(values)
+        for gram in sorted(trigrams(value))
+    ]
+
+
+# Rows per executemany batch, to bound statement/packet size.
+_INSERT_CHUNK = 2000
+
+
+def insert_trigrams(connection, rows: List[dict]) -> None:
+    """Insert ``job_trigrams`` rows, skipping ones already present."""
+    from sqlalchemy import insert
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+    from app.models import JobTrigram
+
+    dialect = connection.dialect.name
+    if dialect == "mysql":
+        stmt = insert(JobTrigram).prefix_with("IGNORE")
+    elif dialect == "sqlite":
+        stmt = sqlite_insert(JobTrigram).on_conflict_do_nothing()
+    else:
+        stmt = insert(JobTrigram)
+    for start in range(0, len(rows), _INSERT_CHUNK):
+        connection.execute(stmt, rows[start:start + _INSERT_CHUNK])
+
+
+def trigram_candidates(field: str, value: str):
+    """``SELECT value`` of indexed ``field`` values containing every trigram of ``value``.
+
+    None when ``value`` is shorter than 3 characters (no trigram to probe).
+    Each stored value has exactly one row per trigram it contains (binary
+    ``TRIGRAM_COLLATION`` on MySQL), so matching all of them means a count of
+    ``len(grams)``.
+    """
+    from sqlalchemy import func, select
+    from app.models import JobTrigram
+
+    grams = trigrams(value)
+    if not grams:
+        return None
+    return (
+        select(JobTrigram.value)
+        .where(JobTrigram.field == field, JobTrigram.trigram.in_(sorted(grams)))
+        .group_by(JobTrigram.value)
+        .having(func.count() == len(grams))
+    )
@@ -0,0 +1,29 @@
+import hashlib
+from urllib.parse import urlsplit, urlunsplit
+
+# Width of ``jobs.job_url_hash`` in bytes (BLAKE2b digest size).
+JOB_URL_HASH_BYTES = 16
+
+
+def canonical_job_url(url: str) -> str:
+    """Canonical form of a job URL used for de-duplication.
+
+    Conservative on purpose: scheme/host case, surrounding whitespace, the
+    fragment and a trailing slash never identify a different posting, but the
+    query string can (e.g. Indeed's ``viewjob?jk=<id>``), so it is kept verbatim.
+    """
+    parts = urlsplit(url.strip())
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), parts.query, "")
+    )
+
+
+def job_url_hash(url: str) -> bytes:
+    """Fixed-width dedup key for a job URL: BLAKE2b-128 of its canonical form.
+
+    Backs the unique ``jobs.job_url_hash`` index, which replaces the wide unique
+    index on ``job_url`` (VARCHAR(768)) for inserts and existence probes.
+    """
+    return hashlib.blake2b(
+        canonical_job_url(url).encode("utf-8"), digest_size=JOB_URL_HASH_BYTES
+    ).digest()
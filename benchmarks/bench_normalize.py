@@ -0,0 +1,107 @@
+"""Time and peak memory of scraper.normalize_jobs_frame vs the old pandas cleanup.
+
+Builds synthetic jobspy-shaped frames (same columns and dtypes as
+``scrape_jobs`` output, with NaN/None gaps) and normalizes them into the
+``REQUIRED_COLS`` record dicts. Peak memory is measured with tracemalloc,
+which also sees numpy/pandas buffers. Usage:
+
+    poetry run python -m benchmarks.bench_normalize [rows] [repeats]
+"""
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from app.scraper import COLMAP, REQUIRED_COLS, normalize_jobs_frame
+
+
+def make_frame(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    today = date(2026, 1, 1)
+    return pd.DataFrame(
+        {
+            "id": [f"li-{i}" for i in range(n)],
+            "site": ["linkedin" if i % 3 else "indeed" for i in range(n)],
+            "job_url": [f"https://www.linkedin.com/jobs/view/{i}" for i in range(n)],
+            "job_url_direct": [None if i % 2 else f"https://acme.example/{i}" for i in range(n)],
+            "title": [f"Backend Engineer {i}" for i in range(n)],
+            "company": [None if i % 17 == 0 else f" Company {i % 50} " for i in range(n)],
+            "location": ["Berlin, BE, Germany"] * n,
+            "date_posted": [None if i % 11 == 0 else today - timedelta(days=i % 30) for i in range(n)],
+            "job_type": ["fulltime"] * n,
+            "salary_source": [None if i % 4 else "direct_data" for i in range(n)],
+            "interval": [None if i % 4 else "yearly" for i in range(n)],
+            "min_amount": np.where(rng.random(n) < 0.7, np.nan, 60000.0),
+            "max_amount": np.where(rng.random(n) < 0.7, np.nan, 90000.0),
+            "currency": [None if i % 4 else "EUR" for i in range(n)],
+            "is_remote": [bool(i % 2) for i in range(n)],
+            "job_level": [None if i % 5 else "mid-senior level" for i in range(n)],
+            "job_function": [None] * n,
+            "listing_type": [None] * n,
+            "emails": [None if i % 9 else ["jobs@acme.example"] for i in range(n)],
+            "description": ["lorem ipsum dolor sit amet " * 80] * n,
+            "company_industry": [None if i % 3 else "Software Development" for i in range(n)],
+            "company_url": [f"https://www.linkedin.com/company/{i % 50}" for i in range(n)],
+            "company_logo": [None] * n,
+            "company_url_direct": [None] * n,
+            "company_addresses": [None] * n,
+            "company_num_employees": [None] * n,
+            "company_revenue": [None] * n,
+            "company_description": [None] * n,
+        }
+    )
+
+
+def legacy_normalize(jobs_df: pd.DataFrame, search_term: str) -> list[dict]:
+    """The pre-single-pass cleanup from run_scrape (minus the dev CSV dump)."""
+    jobs_df = jobs_df.rename(columns={k: v for k, v in COLMAP.items() if k in jobs_df.columns})
+    for col in ["site_name", "job_title", "company", "location", "job_url"]:
+        if col not in jobs_df.columns:
+            jobs_df[col] = None
+    for col in REQUIRED_COLS:
+        if col not in jobs_df.columns:
+            jobs_df[col] = None
+    if "date_posted" in jobs_df.columns:
+        jobs_df["date_posted"] = pd.to_datetime(jobs_df["date_posted"], errors="coerce")
+    jobs_df["search_term"] = search_term
+    jobs_df.replace({np.nan: None, pd.NaT: None}, inplace=True)
+    jobs_df.where(pd.notnull(jobs_df), None, inplace=True)
+    if "company" in jobs_df.columns:
+        jobs_df["company"] = jobs_df["company"].map(
+            lambda v: (v.strip() or None) if isinstance(v, str) else v
+        )
+    return jobs_df[REQUIRED_COLS].to_dict(orient="records")
+
+
+def run(label, fn, frame, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        records = fn(frame, "backend engineer")
+        best = min(best, time.perf_counter() - t0)
+    del records
+
+    tracemalloc.start()
+    records = fn(frame, "backend engineer")
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12} rows={len(frame):<6} best={best * 1000:8.1f} ms  "
+          f"peak={peak / 2**20:7.1f} MiB")
+    return best, peak, records
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    frame = make_frame(rows)
+    old_t, old_peak, old = run("pandas", legacy_normalize, frame, repeats)
+    new_t, new_peak, new = run("single-pass", normalize_jobs_frame, frame, repeats)
+    assert new == old, "normalizers disagree"
+    print(f"speedup: {old_t / new_t:.1f}x  peak memory: {old_peak / new_peak:.1f}x lower")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Per-row cost of serializing a /jobs page: old path vs app.serialization.
+
+Old: ``JobOut.model_validate(i).model_dump()`` per row, then FastAPI's
+``jsonable_encoder`` and ``JSONResponse`` (stdlib json). New: one TypeAdapter
+validation for the page and ``FastJSONResponse`` (pydantic-core encoder).
+Rows are in-memory ``Job`` objects, so only serialization is timed. Usage:
+
+    poetry run python -m benchmarks.bench_serialize [rows] [repeats]
+"""
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.models import Job
+from app.schemas import JobOut
+from app.serialization import FastJSONResponse, jobs_payload
+
+
+def make_jobs(n: int) -> list[Job]:
+    now = datetime(2026, 7, 7, 12, 0, 0)
+    return [
+        Job(
+            id=i + 1,
+            site_name="linkedin",
+            search_term="backend engineer",
+            job_title=f"Backend Engineer {i}",
+            company=f"Company {i % 50}",
+            location="Berlin, BE, Germany",
+            job_url=f"https://www.linkedin.com/jobs/view/{i}",
+            job_type="fulltime",
+            job_level="mid-senior level",
+            description="Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 150,
+            date_posted=now - timedelta(days=i % 30),
+            is_remote=bool(i % 2),
+            applied=False,
+            created_at=now,
+        )
+        for i in range(n)
+    ]
+
+
+def old_path(items) -> bytes:
+    content = {"total": len(items), "count": len(items),
+               "items": [JobOut.model_validate(i).model_dump() for i in items]}
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def new_path(items) -> bytes:
+    content = {"total": len(items), "count": len(items), "items": jobs_payload(items)}
+    return FastJSONResponse(content).body
+
+
+def run(label, fn, items, repeats) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn(items)
+        best = min(best, time.perf_counter() - t0)
+    print(f"{label:<6} rows={len(items):<5} best={best * 1000:8.2f} ms  "
+          f"{best / len(items) * 1e6:7.1f} us/row")
+    return best
+
+
+def main():
+    sizes = [int(sys.argv[1])] if len(sys.argv) > 1 else [20, 100, 500]
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    for n in sizes:
+        items = make_jobs(n)
+        assert json.loads(old_path(items)) == json.loads(new_path(items)), "outputs differ"
+        slow = run("old", old_path, items, repeats)
+        fast = run("new", new_path, items, repeats)
+        print(f"speedup: {slow / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""/jobs substring filters: job_trigrams probe vs plain ilike scan.
+
+Seeds a file-backed SQLite DB (through crud.upsert_jobs, which maintains
+job_trigrams) and times crud.list_jobs for company/location/search_term
+filters with JOBS_TRIGRAM_ENABLED on and off. Selective values gain the most;
+a value contained in most rows (e.g. the common city) gains little. Usage:
+
+    poetry run python -m benchmarks.bench_trigram [rows] [repeats]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import get_settings
+from app.crud import list_jobs, upsert_jobs
+from app.models import Base
+from app.schemas import JobsQuery
+
+CITIES = ["Berlin", "Hamburg", "München", "Köln", "Frankfurt am Main", "Stuttgart", "Leipzig"]
+TERMS = ["python developer", "backend engineer", "data engineer", "devops", "frontend react"]
+
+FILTERS = [
+    {"company": "Company 4711"},       # one company among thousands
+    {"company": "ny 13"},              # substring spanning words
+    {"location": "leipzig"},           # one city in seven
+    {"search_term": "devops", "location": "köln"},
+    {"location": "berlin"},
+]
+
+
+def seed(db, rows: int) -> None:
+    records = [
+        {
+            "site_name": "linkedin",
+            "search_term": TERMS[i % len(TERMS)],
+            "job_title": f"Engineer {i}",
+            "company": f"Company {i % 5000} GmbH",
+            "location": CITIES[i % len(CITIES)],
+            "job_url": f"https://www.linkedin.com/jobs/view/{i}",
+            "description": "lorem ipsum " * 20,
+        }
+        for i in range(rows)
+    ]
+    upsert_jobs(db, records, batch_size=1000)
+
+
+def time_filter(db, filters: dict, repeats: int) -> tuple[float, int]:
+    best, found = float("inf"), 0
+    for _ in range(repeats):
+        params = JobsQuery(all_time=True, count="exact", limit=20, **filters)
+        t0 = time.perf_counter()
+        total, _ = list_jobs(db, params)
+        best = min(best, time.perf_counter() - t0)
+        found = total
+        from app.crud import invalidate_job_counts
+        invalidate_job_counts()
+    return best, found
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{path}", future=True)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine, future=True)()
+    try:
+        t0 = time.perf_counter()
+        seed(db, rows)
+        print(f"seeded {rows} jobs (with trigrams) in {time.perf_counter() - t0:.1f} s")
+
+        settings = get_settings()
+        for filters in FILTERS:
+            settings.JOBS_TRIGRAM_ENABLED = False
+            scan, n_scan = time_filter(db, filters, repeats)
+            settings.JOBS_TRIGRAM_ENABLED = True
+            probe, n_probe = time_filter(db, filters, repeats)
+            assert n_scan == n_probe, (filters, n_scan, n_probe)
+            print(f"{str(filters):<48} matches={n_probe:<6} ilike={scan * 1000:8.1f} ms  "
+                  f"trigram={probe * 1000:8.1f} ms  {scan / probe:5.1f}x")
+    finally:
+        db.close()
+        engine.dispose()
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Rows/sec of crud.upsert_jobs (set-based) vs the per-row SAVEPOINT loop.
+
+Runs against a file-backed SQLite DB so every statement pays real I/O; MySQL
+round trips make the gap wider. Usage:
+
+    poetry run python -m benchmarks.bench_upsert [rows] [repeats]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from app.crud import upsert_jobs
+from app.models import Base, Job
+from app.urlkey import job_url_hash
+
+
+def make_records(n: int, prefix: str) -> list[dict]:
+    return [
+        {
+            "site_name": "linkedin",
+            "search_term": "backend engineer",
+            "job_title": f"Backend Engineer {i}",
+            "company": f"Company {i % 50}",
+            "location": "Berlin",
+            "job_url": f"https://www.linkedin.com/jobs/view/{prefix}{i}",
+            "description": "lorem ipsum " * 50,
+            "is_remote": bool(i % 2),
+        }
+        for i in range(n)
+    ]
+
+
+def rowwise_upsert(db, records) -> int:
+    """The pre-bulk implementation: one probe + one SAVEPOINT/flush per record.
+
+    Probes the indexed ``job_url_hash`` so the comparison measures round trips,
+    not a missing index.
+    """
+    inserted = 0
+    seen = set()
+    for r in records:
+        url = r.get("job_url")
+        if not url or url in seen:
+            continue
+        seen.add(url)
+        url_hash = job_url_hash(url)
+        if db.execute(select(Job.id).where(Job.job_url_hash == url_hash)).scalar_one_or_none():
+            continue
+        try:
+            with db.begin_nested():
+                db.add(Job(**r))
+                db.flush()
+            inserted += 1
+        except IntegrityError:
+            continue
+    db.commit()
+    return inserted
+
+
+def run(label, fn, rows, repeats):
+    best = float("inf")
+    for rep in range(repeats):
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        engine = create_engine(f"sqlite:///{path}", future=True)
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine, future=True)()
+        # Half the payload already exists, as in a typical recurring scrape.
+        upsert_jobs(db, make_records(rows // 2, "seed"))
+        records = make_records(rows // 2, "seed") + make_records(rows - rows // 2, f"new{rep}-")
+        t0 = time.perf_counter()
+        inserted = fn(db, records)
+        best = min(best, time.perf_counter() - t0)
+        db.close()
+        engine.dispose()
+        os.remove(path)
+    print(f"{label:<10} rows={rows:<6} inserted={inserted:<6} "
+          f"best={best * 1000:8.1f} ms  {rows / best:10.0f} rows/s")
+    return best
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    slow = run("per-row", rowwise_upsert, rows, repeats)
+    fast = run("bulk", upsert_jobs, rows, repeats)
+    print(f"speedup: {slow / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""add fixed-width job_url_hash dedup key; drop the wide unique index on job_url"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.urlkey import JOB_URL_HASH_BYTES, job_url_hash
+
+# --- Alembic identifiers ---
+revision = "0004_add_job_url_hash"
+down_revision = "0003_make_company_nullable"
+branch_labels = None
+depends_on = None
+
+# Rows hashed per SELECT/UPDATE round trip during the backfill.
+BACKFILL_BATCH_SIZE = 1000
+
+jobs = sa.table(
+    "jobs",
+    sa.column("id", sa.Integer),
+    sa.column("job_url", sa.Text),
+    sa.column("job_url_hash", sa.BINARY(JOB_URL_HASH_BYTES)),
+)
+
+
+def upgrade():
+    """Add job_url_hash, backfill it in id-ordered batches, then make it the unique key"""
+    op.add_column(
+        "jobs", sa.Column("job_url_hash", sa.BINARY(JOB_URL_HASH_BYTES), nullable=True)
+    )
+
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(jobs.c.id, jobs.c.job_url)
+            .where(jobs.c.id > last_id)
+            .order_by(jobs.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            jobs.update()
+            .where(jobs.c.id == sa.bindparam("pk"))
+            .values(job_url_hash=sa.bindparam("url_hash")),
+            [{"pk": r.id, "url_hash": job_url_hash(r.job_url)} for r in rows],
+        )
+        last_id = rows[-1].id
+
+    # Canonicalization can fold URLs that were stored as distinct strings
+    # (e.g. trailing slash). Refuse to guess which row to keep.
+    dupes = bind.execute(
+        sa.select(sa.func.count()).select_from(
+            sa.select(jobs.c.job_url_hash)
+            .group_by(jobs.c.job_url_hash)
+            .having(sa.func.count() > 1)
+            .subquery()
+        )
+    ).scalar()
+    if dupes:
+        raise RuntimeError(
+            f"{dupes} job_url_hash value(s) are shared by several jobs rows; "
+            "de-duplicate those rows before applying this migration"
+        )
+
+    with op.batch_alter_table("jobs", schema=None) as batch_op:
+        batch_op.alter_column(
+            "job_url_hash",
+            existing_type=sa.BINARY(JOB_URL_HASH_BYTES),
+            nullable=False,
+        )
+        batch_op.create_index("ix_jobs_job_url_hash", ["job_url_hash"], unique=True)
+        # 0001 declared job_url unique inline; MySQL named that key after the column.
+        batch_op.drop_constraint("job_url", type_="unique")
+
+
+def downgrade():
+    """Restore the unique index on job_url and drop job_url_hash"""
+    with op.batch_alter_table("jobs", schema=None) as batch_op:
+        batch_op.create_unique_constraint("job_url", ["job_url"])
+        batch_op.drop_index("ix_jobs_job_url_hash")
+        batch_op.drop_column("job_url_hash")
@@ -0,0 +1,30 @@
+"""create scrape_flights table (cross-worker single-flight leases for /scrape)"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+# --- Alembic identifiers ---
+revision = "0005_create_scrape_flights_table"
+down_revision = "0004_add_job_url_hash"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "scrape_flights",
+        sa.Column("key_hash", sa.String(length=64), primary_key=True),
+        sa.Column("owner", sa.String(length=128), nullable=False),
+        sa.Column("lease_expires_at", sa.DateTime(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("result", sa.Text().with_variant(mysql.LONGTEXT(), "mysql"), nullable=True),
+    )
+    op.create_index(
+        "ix_scrape_flights_lease_expires_at", "scrape_flights", ["lease_expires_at"]
+    )
+
+
+def downgrade():
+    op.drop_index("ix_scrape_flights_lease_expires_at", table_name="scrape_flights")
+    op.drop_table("scrape_flights")
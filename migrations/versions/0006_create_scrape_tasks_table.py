@@ -0,0 +1,36 @@
+"""create scrape_tasks table (durable scrape/backfill queue)"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# --- Alembic identifiers ---
+revision = "0006_create_scrape_tasks_table"
+down_revision = "0005_create_scrape_flights_table"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "scrape_tasks",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("kind", sa.String(length=32), nullable=False),
+        sa.Column("state", sa.String(length=16), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("result", sa.Text(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("owner", sa.String(length=128), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index(
+        "ix_scrape_tasks_state_lease", "scrape_tasks", ["state", "lease_expires_at"]
+    )
+
+
+def downgrade():
+    op.drop_index("ix_scrape_tasks_state_lease", table_name="scrape_tasks")
+    op.drop_table("scrape_tasks")
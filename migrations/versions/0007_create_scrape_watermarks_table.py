@@ -0,0 +1,27 @@
+"""create scrape_watermarks table (per-query high-water marks for incremental scrapes)"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# --- Alembic identifiers ---
+revision = "0007_create_scrape_watermarks_table"
+down_revision = "0006_create_scrape_tasks_table"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "scrape_watermarks",
+        sa.Column("key_hash", sa.String(length=64), primary_key=True),
+        sa.Column("site_name", sa.String(length=64), nullable=False),
+        sa.Column("search_term", sa.String(length=255), nullable=False),
+        sa.Column("location", sa.String(length=255), nullable=True),
+        sa.Column("is_remote", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("last_success_at", sa.DateTime(), nullable=False),
+        sa.Column("newest_date_posted", sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_table("scrape_watermarks")
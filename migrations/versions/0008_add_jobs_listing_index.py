@@ -0,0 +1,19 @@
+"""add composite (date_posted, created_at, id) index for /jobs ordering and keyset pagination"""
+
+from alembic import op
+
+# --- Alembic identifiers ---
+revision = "0008_add_jobs_listing_index"
+down_revision = "0007_create_scrape_watermarks_table"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_jobs_date_posted_created_at_id", "jobs", ["date_posted", "created_at", "id"]
+    )
+
+
+def downgrade():
+    op.drop_index("ix_jobs_date_posted_created_at_id", table_name="jobs")
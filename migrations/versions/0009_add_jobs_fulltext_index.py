@@ -0,0 +1,34 @@
+"""add full-text index over job_title/description/company (MySQL FULLTEXT, SQLite FTS5)"""
+
+from alembic import op
+
+from app.fulltext import FULLTEXT_COLUMNS, MYSQL_FULLTEXT_INDEX, SQLITE_FTS_DDL, SQLITE_FTS_DROP
+
+# --- Alembic identifiers ---
+revision = "0009_add_jobs_fulltext_index"
+down_revision = "0008_add_jobs_listing_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "mysql":
+        # InnoDB builds the index over the existing rows in place.
+        op.create_index(
+            MYSQL_FULLTEXT_INDEX, "jobs", list(FULLTEXT_COLUMNS), mysql_prefix="FULLTEXT"
+        )
+    elif dialect == "sqlite":
+        for stmt in SQLITE_FTS_DDL:
+            op.execute(stmt)
+        # Index the rows that predate the triggers.
+        op.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "mysql":
+        op.drop_index(MYSQL_FULLTEXT_INDEX, table_name="jobs")
+    elif dialect == "sqlite":
+        for stmt in SQLITE_FTS_DROP:
+            op.execute(stmt)
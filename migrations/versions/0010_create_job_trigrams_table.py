@@ -0,0 +1,67 @@
+"""create job_trigrams side index (distinct search_term/location/company values) for substring filters"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.trigram import TRIGRAM_COLLATION, TRIGRAM_FIELDS, trigrams
+
+# --- Alembic identifiers ---
+revision = "0010_create_job_trigrams_table"
+down_revision = "0009_add_jobs_fulltext_index"
+branch_labels = None
+depends_on = None
+
+# Distinct values indexed per INSERT round trip during the backfill.
+BACKFILL_BATCH_SIZE = 1000
+
+jobs = sa.table("jobs", *(sa.column(field, sa.String) for field in TRIGRAM_FIELDS))
+job_trigrams = sa.table(
+    "job_trigrams",
+    sa.column("field", sa.String),
+    sa.column("trigram", sa.String),
+    sa.column("value", sa.String),
+)
+
+
+def upgrade():
+    """Create job_trigrams and index the distinct values already stored"""
+    op.create_table(
+        "job_trigrams",
+        sa.Column("field", sa.String(length=16), nullable=False),
+        # Binary on MySQL, see app.models.JobTrigram.
+        sa.Column(
+            "trigram",
+            sa.String(length=3).with_variant(
+                sa.String(length=3, collation=TRIGRAM_COLLATION), "mysql"
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "value",
+            sa.String(length=512).with_variant(
+                sa.String(length=512, collation=TRIGRAM_COLLATION), "mysql"
+            ),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("field", "trigram", "value"),
+    )
+
+    bind = op.get_bind()
+    insert = job_trigrams.insert()
+    for field in TRIGRAM_FIELDS:
+        column = jobs.c[field]
+        values = bind.execute(
+            sa.select(column).where(column.is_not(None)).distinct()
+        ).scalars().all()
+        for start in range(0, len(values), BACKFILL_BATCH_SIZE):
+            rows = [
+                {"field": field, "trigram": gram, "value": value}
+                for value in values[start:start + BACKFILL_BATCH_SIZE]
+                for gram in trigrams(value)
+            ]
+            if rows:
+                bind.execute(insert, rows)
+
+
+def downgrade():
+    op.drop_table("job_trigrams")
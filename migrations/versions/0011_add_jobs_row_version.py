@@ -0,0 +1,23 @@
+"""add jobs.row_version and jobs.updated_at for conditional GET (ETag / Last-Modified)"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# --- Alembic identifiers ---
+revision = "0011_add_jobs_row_version"
+down_revision = "0010_create_job_trigrams_table"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "jobs",
+        sa.Column("row_version", sa.Integer(), nullable=False, server_default="1"),
+    )
+    op.add_column("jobs", sa.Column("updated_at", sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("jobs", "updated_at")
+    op.drop_column("jobs", "row_version")
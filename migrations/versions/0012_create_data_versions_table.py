@@ -0,0 +1,23 @@
+"""create data_versions table (cluster-wide change counters for result caches)"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# --- Alembic identifiers ---
+revision = "0012_create_data_versions_table"
+down_revision = "0011_add_jobs_row_version"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    data_versions = op.create_table(
+        "data_versions",
+        sa.Column("name", sa.String(length=32), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.bulk_insert(data_versions, [{"name": "jobs", "version": 0}])
+
+
+def downgrade():
+    op.drop_table("data_versions")
@@ -0,0 +1,31 @@
+"""add per-job description backfill attempt tracking (attempts, last error, next attempt)"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# --- Alembic identifiers ---
+revision = "0013_add_jobs_backfill_attempts"
+down_revision = "0012_create_data_versions_table"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "jobs",
+        sa.Column("backfill_attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("jobs", sa.Column("backfill_last_error", sa.String(length=255), nullable=True))
+    op.add_column("jobs", sa.Column("backfill_next_attempt_at", sa.DateTime(), nullable=True))
+    op.create_index(
+        "ix_jobs_site_name_backfill_next_attempt_at",
+        "jobs",
+        ["site_name", "backfill_next_attempt_at"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_jobs_site_name_backfill_next_attempt_at", table_name="jobs")
+    op.drop_column("jobs", "backfill_next_attempt_at")
+    op.drop_column("jobs", "backfill_last_error")
+    op.drop_column("jobs", "backfill_attempts")
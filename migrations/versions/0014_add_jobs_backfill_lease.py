@@ -0,0 +1,20 @@
+"""add jobs.backfill_owner / backfill_lease_expires_at (cross-worker backfill leases)"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# --- Alembic identifiers ---
+revision = "0014_add_jobs_backfill_lease"
+down_revision = "0013_add_jobs_backfill_attempts"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("jobs", sa.Column("backfill_owner", sa.String(length=128), nullable=True))
+    op.add_column("jobs", sa.Column("backfill_lease_expires_at", sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("jobs", "backfill_lease_expires_at")
+    op.drop_column("jobs", "backfill_owner")
@@ -1,19 +1,30 @@
 from datetime import datetime
 
+import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, select
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app import main as main_module
 from app.crud import list_jobs
 from app.db import get_db
-from app.models import Base, Job
+from app.models import Base, DataVersion, Job
 from app.schemas import JobsQuery
 
 client = TestClient(main_module.app)
 
 
+@pytest.fixture(autouse=True)
+def fresh_result_caches():
+    """Each test gets its own DB; don't serve it results cached for another."""
+    from app import crud as crud_module
+
+    crud_module.invalidate_job_counts()
+    crud_module._JOB_COUNT_ESTIMATES.clear()
+    crud_module._JOBS_QUERY_CACHE.clear()
+
+
 def test_health():
     """Basic smoke test to verify the API health endpoint."""
     response = client.get("/health")
@@ -81,6 +92,398 @@ def test_list_jobs_orders_by_posting_freshness_then_insert_time():
     ]
 
 
+def test_list_jobs_q_uses_fulltext_index_with_relevance_order():
+    db = make_session()
+    db.add_all(
+        [
+            make_job(job_url="https://example.test/ft1", job_title="Python Developer",
+                     description="Django and python services, python tooling"),
+            make_job(job_url="https://example.test/ft2", job_title="Data Engineer",
+                     description="Some python scripting"),
+            make_job(job_url="https://example.test/ft3", job_title="Java Developer",
+                     description="Spring"),
+        ]
+    )
+    db.commit()
+
+    def titles(**kw):
+        return [j.job_title for j in list_jobs(db, JobsQuery(all_time=True, count="none", **kw))[1]]
+
+    assert sorted(titles(q="pyth")) == ["Data Engineer", "Python Developer"]   # word prefix
+    assert titles(q="python developer") == ["Python Developer"]                 # all words
+    assert titles(q="python", sort="relevance")[0] == "Python Developer"
+
+    # Triggers keep the FTS table in sync with updates.
+    java = db.query(Job).filter_by(job_url="https://example.test/ft3").one()
+    java.description = "Spring, some Python glue"
+    db.commit()
+    assert "Java Developer" in titles(q="python")
+
+
+def test_list_jobs_q_falls_back_to_ilike_for_terms_the_index_drops():
+    db = make_session()
+    db.add_all(
+        [
+            make_job(job_url="https://example.test/cpp", job_title="C++ Engineer"),
+            make_job(job_url="https://example.test/cobol", job_title="Cobol Engineer"),
+            make_job(job_url="https://example.test/net", job_title=".NET Developer"),
+            make_job(job_url="https://example.test/ai", job_title="AI Researcher"),
+            make_job(job_url="https://example.test/the", job_title="The Agency"),
+        ]
+    )
+    db.commit()
+
+    def titles(q):
+        return [j.job_title for j in list_jobs(db, JobsQuery(all_time=True, count="none", q=q))[1]]
+
+    assert titles("C++") == ["C++ Engineer"]       # not the prefix "c*" (Cobol)
+    assert titles(".NET") == [".NET Developer"]
+    assert titles("AI") == ["AI Researcher"]       # shorter than innodb_ft_min_token_size
+    assert titles("the") == ["The Agency"]         # InnoDB stopword
+
+
+def test_trigram_keys_use_binary_collation_on_mysql():
+    from sqlalchemy.dialects import mysql
+    from sqlalchemy.schema import CreateTable
+    from app.models import JobTrigram
+
+    # trigram_candidates counts one row per query trigram; a case/accent-
+    # insensitive collation would fold several stored trigrams into one.
+    ddl = str(CreateTable(JobTrigram.__table__).compile(dialect=mysql.dialect()))
+    assert "trigram VARCHAR(3) COLLATE utf8mb4_bin" in ddl
+    assert "value VARCHAR(512) COLLATE utf8mb4_bin" in ddl
+
+
+def test_substring_filters_probe_trigram_index_for_bulk_and_orm_inserts():
+    from app.crud import upsert_jobs
+    from app.models import JobTrigram
+
+    db = make_session()
+    upsert_jobs(db, [
+        {"site_name": "linkedin", "search_term": "python", "job_title": "T",
+         "location": "Berlin", "company": "Deutsche Bahn", "job_url": "https://example.test/t1"},
+        {"site_name": "linkedin", "search_term": "python", "job_title": "T",
+         "location": "Hamburg", "company": "Acme", "job_url": "https://example.test/t2"},
+    ])
+    db.add(make_job(job_url="https://example.test/t3", company="Bahnhof GmbH",
+                    location="Berlin-Mitte"))                     # ORM insert path
+    db.commit()
+
+    def companies(**kw):
+        items = list_jobs(db, JobsQuery(all_time=True, count="none", **kw))[1]
+        return sorted(j.company for j in items)
+
+    assert sorted(t.value for t in db.query(JobTrigram).filter_by(field="company", trigram="bah")) \
+        == ["Bahnhof GmbH", "Deutsche Bahn"]
+    assert companies(company="che BA") == ["Deutsche Bahn"]       # spans words, any case
+    assert companies(company="bahn") == ["Bahnhof GmbH", "Deutsche Bahn"]
+    assert companies(location="berlin") == ["Bahnhof GmbH", "Deutsche Bahn"]
+    assert companies(company="Ac") == ["Acme"]                    # < 3 chars: ilike only
+    assert companies(company="bahn", location="ham") == []
+
+
+def test_jobs_fields_projection_reads_only_requested_columns():
+    from sqlalchemy import event
+
+    db = make_session()
+    db.add_all([make_job(job_url=f"https://example.test/p{i}", description="x" * 5000,
+                         created_at=datetime(2026, 7, 7, 12, 0, i)) for i in range(3)])
+    db.commit()
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute",
+                 lambda conn, cur, stmt, *a: statements.append(stmt))
+
+    def override_db():
+        yield db
+
+    main_module.app.dependency_overrides[get_db] = override_db
+    try:
+        summary = client.get("/jobs?all_time=true&count=none&fields=summary").json()
+        picked = client.get("/jobs?all_time=true&count=none&limit=2&fields=job_url,id").json()
+        following = client.get(
+            f"/jobs?all_time=true&count=none&fields=id&cursor={picked['next_cursor']}"
+        ).json()
+        bad = client.get("/jobs?all_time=true&fields=id,nope")
+    finally:
+        main_module.app.dependency_overrides.clear()
+
+    assert list(summary["items"][0]) == [
+        "site_name", "job_title", "location", "job_url", "company", "date_posted",
+        "is_remote", "applied", "id", "created_at",
+    ]
+    assert all("description" not in stmt for stmt in statements)
+    assert [list(j) for j in picked["items"]] == [["job_url", "id"]] * 2
+    assert len(following["items"]) == 1
+    assert bad.status_code == 400
+
+
+def test_jobs_export_streams_every_match_as_ndjson_and_csv():
+    import csv
+    import io
+    import json
+
+    db = make_session()
+    db.add_all([make_job(job_url=f"https://example.test/e{i}", company=None if i == 2 else "Acme",
+                         date_posted=datetime(2026, 7, i + 1)) for i in range(5)])
+    db.add(make_job(job_url="https://example.test/other", site_name="indeed"))
+    db.commit()
+
+    def override_db():
+        yield db
+
+    main_module.app.dependency_overrides[get_db] = override_db
+    try:
+        ndjson = client.get("/jobs/export?all_time=true&site_name=linkedin&limit=1")
+        as_csv = client.get("/jobs/export?all_time=true&site_name=linkedin"
+                            "&format=csv&fields=job_url,company,date_posted")
+    finally:
+        main_module.app.dependency_overrides.clear()
+
+    assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert [r["job_url"] for r in rows] == [f"https://example.test/e{i}" for i in range(5)]
+    assert rows[0]["date_posted"] == "2026-07-01T00:00:00" and "description" in rows[0]
+
+    table = list(csv.reader(io.StringIO(as_csv.text)))
+    assert table[0] == ["job_url", "company", "date_posted"]
+    assert len(table) == 6 and table[3] == ["https://example.test/e2", "", "2026-07-03T00:00:00"]
+
+
+def test_fast_json_matches_the_jsonable_encoder_output():
+    import json
+
+    import numpy as np
+    import pandas as pd
+    from fastapi.encoders import jsonable_encoder
+    from app.schemas import JobOut
+    from app.serialization import dumps, jobs_payload
+
+    job = make_job(id=7, created_at=datetime(2026, 7, 7, 12, 0, 0, 123456),
+                   date_posted=datetime(2026, 7, 6), is_remote=True, applied=False)
+    assert json.loads(dumps({"items": jobs_payload([job])})) == jsonable_encoder(
+        {"items": [JobOut.model_validate(job).model_dump()]}
+    )
+    # Scrape records carry pandas/numpy values straight from the normalizer.
+    record = {"date_posted": pd.Timestamp("2026-07-06"), "n": np.int64(3), "x": float("nan")}
+    assert json.loads(dumps(record)) == {"date_posted": "2026-07-06T00:00:00", "n": 3, "x": None}
+
+
+def test_jobs_conditional_get_returns_304_until_a_row_changes():
+    db = make_session()
+    db.add_all([make_job(job_url=f"https://example.test/c{i}", description="x" * 5000,
+                         created_at=datetime(2026, 7, 7, 12, 0, i)) for i in range(3)])
+    db.commit()
+    job_pk = db.scalars(select(Job.id)).first()
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute",
+                 lambda conn, cur, stmt, *a: statements.append(stmt))
+
+    def override_db():
+        yield db
+
+    main_module.app.dependency_overrides[get_db] = override_db
+    try:
+        first = client.get("/jobs?all_time=true")
+        unconditional = list(statements)
+        etag = first.headers["etag"]
+        statements.clear()
+        unchanged = client.get("/jobs?all_time=true", headers={"If-None-Match": etag})
+        validating = list(statements)
+        other_page = client.get("/jobs?all_time=true&limit=1", headers={"If-None-Match": etag})
+        since = client.get(
+            "/jobs?all_time=true",
+            headers={"If-Modified-Since": first.headers["last-modified"]},
+        )
+        statements.clear()
+        single = client.get(f"/jobs/{job_pk}")
+        single_unconditional = list(statements)
+        single_unchanged = client.get(
+            f"/jobs/{job_pk}", headers={"If-None-Match": single.headers["etag"]}
+        )
+        client.post(f"/jobs/{job_pk}/apply")
+        changed = client.get("/jobs?all_time=true", headers={"If-None-Match": etag})
+        single_changed = client.get(
+            f"/jobs/{job_pk}", headers={"If-None-Match": single.headers["etag"]}
+        )
+    finally:
+        main_module.app.dependency_overrides.clear()
+
+    assert first.status_code == 200 and first.headers["last-modified"].endswith(" GMT")
+    assert first.json()["items"][0]["description"] == "x" * 5000
+    # Without a validator to check, no version pre-query: count + page, one lookup.
+    assert len(unconditional) == 2 and len(single_unconditional) == 1
+    assert unchanged.status_code == 304 and unchanged.content == b""
+    assert unchanged.headers["etag"] == etag
+    assert all("description" not in stmt for stmt in validating)
+    assert other_page.status_code == 200
+    assert since.status_code == 304
+    assert single.headers["etag"] == f'"{job_pk}-1"'
+    assert single_unchanged.status_code == 304
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert single_changed.status_code == 200
+    assert single_changed.headers["etag"] == f'"{job_pk}-2"'
+    assert single_changed.json()["applied"] is True
+
+
+def test_jobs_query_cache_serves_repeats_until_data_version_changes(monkeypatch):
+    from app.config import get_settings
+
+    db = make_session()
+    db.add_all([make_job(job_url=f"https://example.test/v{i}",
+                         created_at=datetime(2026, 7, 7, 12, 0, i)) for i in range(2)])
+    db.commit()
+    job_pk = db.scalars(select(Job.id)).first()
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute",
+                 lambda conn, cur, stmt, *a: statements.append(stmt))
+
+    def override_db():
+        yield db
+
+    main_module.app.dependency_overrides[get_db] = override_db
+    try:
+        before = client.get("/metrics").json()["jobs_query_cache"]
+        first = client.get("/jobs?all_time=true&fields=id,applied")
+        statements.clear()
+        # Same resolved query (explicit default, other order) -> cache hit.
+        repeat = client.get("/jobs?fields=id,applied&limit=20&all_time=true")
+        served_from_cache = not any("jobs" in stmt for stmt in statements)
+        client.post(f"/jobs/{job_pk}/apply")
+        after_write = client.get("/jobs?all_time=true&fields=id,applied")
+
+        monkeypatch.setattr(get_settings(), "JOBS_QUERY_CACHE_SHARED", True)
+        shared = client.get("/jobs?all_time=true&fields=id,applied")
+        db.merge(DataVersion(name="jobs", version=7))
+        db.commit()  # e.g. another worker stored jobs
+        shared_bumped = client.get("/jobs?all_time=true&fields=id,applied")
+        stats = client.get("/metrics").json()["jobs_query_cache"]
+    finally:
+        main_module.app.dependency_overrides.clear()
+
+    assert repeat.content == first.content and served_from_cache
+    assert {j["id"]: j["applied"] for j in after_write.json()["items"]}[job_pk] is True
+    assert shared.status_code == shared_bumped.status_code == 200
+    assert stats["hits"] - before["hits"] == 1
+    assert stats["misses"] - before["misses"] == 4
+    assert JobsQuery().resolve_created_after().second == 0
+
+
+def test_read_endpoints_use_replica_and_fall_back_to_primary(monkeypatch):
+    from app import db as db_module
+
+    primary = make_session()
+    primary.add(make_job(job_title="on primary", job_url="https://example.test/primary"))
+    primary.commit()
+    replica = make_session()
+    replica.add(make_job(job_title="on replica", job_url="https://example.test/replica"))
+    replica.commit()
+    broken = sessionmaker(bind=create_engine("sqlite:////nonexistent-dir/replica.db"))
+
+    def override_db():
+        yield primary
+
+    main_module.app.dependency_overrides[get_db] = override_db
+    monkeypatch.setattr(db_module, "_replica_down_until", 0.0)
+    try:
+        monkeypatch.setattr(db_module, "ReadSessionLocal", sessionmaker(bind=replica.get_bind()))
+        from_replica = client.get("/jobs?all_time=true&count=none").json()
+        exported = client.get("/jobs/export?all_time=true&fields=job_title").text
+        monkeypatch.setattr(db_module, "ReadSessionLocal", broken)
+        fallback = client.get("/jobs?all_time=true&count=none&limit=5").json()
+        stats = db_module.read_replica_stats()
+        client.post("/jobs/1/apply")  # writes always use the primary
+    finally:
+        main_module.app.dependency_overrides.clear()
+
+    assert [j["job_title"] for j in from_replica["items"]] == ["on replica"]
+    assert "on replica" in exported
+    assert [j["job_title"] for j in fallback["items"]] == ["on primary"]
+    assert stats["fallbacks"] >= 1 and stats["available"] is False
+    assert primary.get(Job, 1).applied and not replica.get(Job, 1).applied
+
+
+def test_list_jobs_count_modes_and_cache_invalidation():
+    from app import crud as crud_module
+    from app.crud import upsert_jobs
+
+    crud_module.invalidate_job_counts()
+    crud_module._JOB_COUNT_ESTIMATES.clear()
+    db = make_session()
+    db.add_all([make_job(search_term="count-modes", job_url=f"https://example.test/c{i}")
+                for i in range(3)])
+    db.commit()
+
+    def query(mode):
+        return JobsQuery(search_term="count-modes", all_time=True, limit=1, count=mode)
+
+    assert list_jobs(db, query("none"))[0] is None
+    assert list_jobs(db, query("exact"))[0] == 3       # all matches, not just the page
+
+    # Writes that bypass upsert_jobs are only seen once the cached count expires...
+    db.add(make_job(search_term="count-modes", job_url="https://example.test/c3"))
+    db.commit()
+    assert list_jobs(db, query("exact"))[0] == 3
+    # ...while an insert through upsert_jobs invalidates it right away.
+    upsert_jobs(db, [{"site_name": "linkedin", "search_term": "count-modes",
+                      "job_title": "T", "location": "Berlin",
+                      "job_url": "https://example.test/c4"}])
+    assert list_jobs(db, query("estimate"))[0] == 3    # last exact count, still recent
+    assert list_jobs(db, query("exact"))[0] == 5
+    assert list_jobs(db, query("estimate"))[0] == 5
+
+
+def test_cached_exact_counts_are_keyed_on_the_explicit_cutoff():
+    db = make_session()
+    db.add_all([
+        make_job(job_url="https://example.test/early", created_at=datetime(2026, 7, 7, 12, 0, 10)),
+        make_job(job_url="https://example.test/late", created_at=datetime(2026, 7, 7, 12, 0, 40)),
+    ])
+    db.commit()
+
+    def total(cutoff):
+        return list_jobs(db, JobsQuery(created_after=cutoff, count="exact"))[0]
+
+    # Same minute, different cutoffs: each gets its own count.
+    assert total(datetime(2026, 7, 7, 12, 0, 5)) == 2
+    assert total(datetime(2026, 7, 7, 12, 0, 30)) == 1
+
+
+def test_jobs_cursor_pagination_walks_every_row_once_in_listing_order():
+    db = make_session()
+    posted = [datetime(2026, 7, 6), datetime(2026, 7, 6), datetime(2026, 7, 5), None, None, None, None]
+    created = datetime(2026, 7, 7, 12, 0, 0)   # shared: only id breaks the ties
+    db.add_all(
+        [make_job(job_url=f"https://example.test/{i}", date_posted=p, created_at=created)
+         for i, p in enumerate(posted)]
+    )
+    db.commit()
+
+    def override_db():
+        yield db
+
+    main_module.app.dependency_overrides[get_db] = override_db
+    try:
+        expected = [j["id"] for j in client.get("/jobs?all_time=true&limit=100").json()["items"]]
+        walked, cursor = [], None
+        while True:
+            url = "/jobs?all_time=true&limit=2" + (f"&cursor={cursor}" if cursor else "")
+            body = client.get(url).json()
+            walked += [j["id"] for j in body["items"]]
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+        bad = client.get("/jobs?all_time=true&cursor=not-a-cursor")
+        # Relevance order cannot be resumed by a cursor, so none is offered.
+        ranked = client.get("/jobs?all_time=true&limit=1&q=backend&sort=relevance").json()
+    finally:
+        main_module.app.dependency_overrides.clear()
+
+    assert walked == expected
+    assert len(expected) == 7
+    assert bad.status_code == 400
+    assert ranked["count"] == 1 and ranked["next_cursor"] is None
+
+
 def test_scrape_response_includes_metadata_and_separate_scrape_items(monkeypatch):
     db = make_session()
     db.add(
@@ -146,6 +549,88 @@ def test_scrape_response_includes_metadata_and_separate_scrape_items(monkeypatch
     assert body["items"] == []
 
 
+def test_upsert_jobs_bulk_skips_existing_and_intra_batch_duplicates():
+    from app.crud import upsert_jobs
+
+    db = make_session()
+    db.add(make_job(job_url="https://example.test/existing"))
+    db.commit()
+
+    records = [
+        {"site_name": "linkedin", "search_term": "X", "job_title": f"Job {i}",
+         "company": "Acme", "location": "Berlin",
+         "job_url": f"https://example.test/bulk/{i}", "is_remote": None}
+        for i in range(7)
+    ]
+    records += [
+        {**records[0]},                                            # intra-batch duplicate
+        {**records[1], "job_url": "https://example.test/existing"},  # already stored
+        {**records[2], "job_url": None},                           # no URL -> ignored
+    ]
+
+    # batch_size=3 forces several chunks (probe + multi-row insert per chunk).
+    assert upsert_jobs(db, records, batch_size=3) == 7
+    assert db.query(Job).count() == 8
+    assert {j.is_remote for j in db.query(Job).all()} == {False}
+    # Re-running the same payload inserts nothing.
+    assert upsert_jobs(db, records, batch_size=3) == 0
+
+
+def test_upsert_jobs_rowwise_fallback_swallows_duplicates():
+    from app.crud import _job_insert_row, _upsert_jobs_rowwise
+
+    db = make_session()
+    db.add(make_job(job_url="https://example.test/existing"))
+    db.commit()
+
+    rows = [
+        _job_insert_row({"site_name": "linkedin", "search_term": "X", "job_title": "T",
+                         "location": "Berlin", "job_url": url})
+        for url in ("https://example.test/new", "https://example.test/existing")
+    ]
+    assert _upsert_jobs_rowwise(db, rows) == 1
+    db.commit()
+    assert db.query(Job).count() == 2
+
+
+def test_upsert_jobs_skips_records_missing_required_columns():
+    from app.crud import upsert_jobs
+
+    db = make_session()
+    base = {"site_name": "linkedin", "search_term": "X", "job_title": "T",
+            "location": "Berlin"}
+    records = [
+        {**base, "job_url": "https://example.test/complete"},
+        {**base, "job_url": "https://example.test/no-title", "job_title": None},
+        {**base, "job_url": "https://example.test/no-location", "location": None},
+    ]
+    # Dropped up front, so MySQL's INSERT IGNORE never stores them as ''.
+    assert upsert_jobs(db, records) == 1
+    assert [j.job_url for j in db.query(Job).all()] == ["https://example.test/complete"]
+
+
+def test_job_url_hash_is_canonical_dedup_key():
+    from app.crud import upsert_jobs
+    from app.urlkey import JOB_URL_HASH_BYTES, job_url_hash
+
+    base = "https://www.linkedin.com/jobs/view/123"
+    assert len(job_url_hash(base)) == JOB_URL_HASH_BYTES
+    assert job_url_hash(base) == job_url_hash("  HTTPS://WWW.LinkedIn.com/jobs/view/123/#top ")
+    # The query string identifies postings on some boards -> kept.
+    assert job_url_hash("https://de.indeed.com/viewjob?jk=1") != job_url_hash(
+        "https://de.indeed.com/viewjob?jk=2"
+    )
+
+    db = make_session()
+    db.add(make_job(job_url=base))  # hash filled by the column default
+    db.commit()
+    assert db.query(Job).one().job_url_hash == job_url_hash(base)
+
+    record = {"site_name": "linkedin", "search_term": "X", "job_title": "T",
+              "location": "Berlin", "job_url": base + "/"}
+    assert upsert_jobs(db, [record]) == 0
+
+
 # ---------------------------------------------------------------------------
 # Description backfill (async /scrape background mode)
 # ---------------------------------------------------------------------------
@@ -169,9 +654,9 @@ def _shared_sqlite_factory():
     return sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
 
-def test_list_linkedin_jobs_missing_description():
+def test_backfill_claims_only_recent_description_less_linkedin_jobs():
     from datetime import timedelta, timezone
-    from app.crud import list_linkedin_jobs_missing_description
+    from app.crud import claim_backfill_jobs, count_claimable_backfill_jobs
 
     db = make_session()
     now = datetime.now(timezone.utc).replace(tzinfo=None)
@@ -192,16 +677,196 @@ def test_list_linkedin_jobs_missing_description():
     )
     db.commit()
 
-    rows = list_linkedin_jobs_missing_description(db, window_days=3, limit=50)
+    assert count_claimable_backfill_jobs(db, window_days=3, limit=50) == 2
+    rows = claim_backfill_jobs(db, "worker", window_days=3, limit=50, lease_seconds=600)
     assert {r.job_url for r in rows} == {
         "https://www.linkedin.com/jobs/view/111",
         "https://www.linkedin.com/jobs/view/222",
     }
 
 
+def test_backfill_failures_defer_retries_exponentially_then_give_up(monkeypatch):
+    from datetime import timedelta
+
+    from app import scraper as scraper_module
+    from app.config import get_settings
+    from app.crud import backfill_retry_delay, count_claimable_backfill_jobs
+    from app.timeutils import local_now_naive
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "DESCRIPTION_BACKFILL_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(settings, "DESCRIPTION_BACKFILL_RETRY_BASE_SECONDS", 60)
+    monkeypatch.setattr(settings, "DESCRIPTION_BACKFILL_RETRY_MAX_SECONDS", 150)
+    assert [backfill_retry_delay(n).total_seconds() for n in (1, 2, 3)] == [60, 120, 150]
+
+    Factory = _shared_sqlite_factory()
+    seed = Factory()
+    seed.add_all([make_job(job_url=f"https://www.linkedin.com/jobs/view/{n}", site_name="linkedin",
+                           description=None, created_at=local_now_naive()) for n in (1, 2)])
+    seed.commit()
+    seed.close()
+    monkeypatch.setattr(scraper_module, "has_description_backfill_support", lambda: True)
+    monkeypatch.setattr(scraper_module, "_fetch_description_for_job",
+                        lambda job_id: (None, 200) if job_id == "1" else ("found", 200))
+
+    def sweep():
+        return scraper_module.run_description_backfill(
+            session_factory=Factory, window_days=3, limit=50
+        )
+
+    def dead_job():
+        check = Factory()
+        try:
+            return check.scalars(select(Job).where(Job.job_url.endswith("/1"))).one()
+        finally:
+            check.close()
+
+    assert sweep()["candidates"] == 2
+    job = dead_job()
+    assert (job.backfill_attempts, job.backfill_last_error) == (1, "no description on page (HTTP 200)")
+    assert job.backfill_next_attempt_at > local_now_naive() + timedelta(seconds=50)
+    assert job.row_version == 1  # bookkeeping does not touch the row's ETag
+    assert sweep()["candidates"] == 0  # not due yet
+
+    for _ in range(2):  # make it due again and fail twice more
+        db = Factory()
+        db.execute(Job.__table__.update().values(backfill_next_attempt_at=None))
+        db.commit()
+        db.close()
+        assert sweep()["candidates"] == 1
+    db = Factory()
+    db.execute(Job.__table__.update().values(backfill_next_attempt_at=None))
+    db.commit()
+    try:
+        assert dead_job().backfill_attempts == 3
+        assert count_claimable_backfill_jobs(db, 3, 50) == 0  # given up
+    finally:
+        db.close()
+
+
+def test_throttled_backfill_fetches_defer_jobs_without_using_attempts(monkeypatch):
+    from app import scraper as scraper_module
+    from app.timeutils import local_now_naive
+
+    Factory = _shared_sqlite_factory()
+    seed = Factory()
+    seed.add_all([make_job(job_url=f"https://www.linkedin.com/jobs/view/{n}", site_name="linkedin",
+                           description=None, created_at=local_now_naive()) for n in (1, 2, 3)])
+    seed.commit()
+    seed.close()
+    monkeypatch.setattr(scraper_module, "has_description_backfill_support", lambda: True)
+    statuses = {"1": 429, "2": 503, "3": None}
+    monkeypatch.setattr(scraper_module, "_fetch_description_for_job",
+                        lambda job_id: (None, statuses[job_id]))
+
+    result = scraper_module.run_description_backfill(
+        session_factory=Factory, window_days=3, limit=50
+    )
+    assert result["candidates"] == 3
+    assert scraper_module.backfill_progress()["throttled"] == 3
+
+    check = Factory()
+    try:
+        jobs = check.scalars(select(Job).order_by(Job.id)).all()
+        assert [j.backfill_attempts for j in jobs] == [0, 0, 0]
+        assert [j.backfill_last_error for j in jobs] == [
+            "throttled: HTTP 429", "throttled: HTTP 503", "no response"
+        ]
+        assert all(j.backfill_next_attempt_at > local_now_naive() for j in jobs)
+    finally:
+        check.close()
+
+
+def test_backfill_claims_are_disjoint_across_workers_and_expire(monkeypatch):
+    from datetime import timedelta
+
+    from app import scraper as scraper_module
+    from app.crud import claim_backfill_jobs, release_backfill_jobs
+    from app.timeutils import local_now_naive
+
+    Factory = _shared_sqlite_factory()
+    db = Factory()
+    db.add_all([make_job(job_url=f"https://www.linkedin.com/jobs/view/{n}", site_name="linkedin",
+                         description=None, created_at=local_now_naive() - timedelta(minutes=n))
+                for n in range(5)])
+    db.commit()
+
+    first = claim_backfill_jobs(db, "worker-a", 3, 3, lease_seconds=600)
+    second = claim_backfill_jobs(db, "worker-b", 3, 3, lease_seconds=600)
+    assert len(first) == 3 and len(second) == 2
+    assert not {j.id for j in first} & {j.id for j in second}
+    assert claim_backfill_jobs(db, "worker-c", 3, 3, lease_seconds=600) == []
+
+    # worker-a dies: once its lease has expired its jobs can be claimed again.
+    db.execute(Job.__table__.update().where(Job.backfill_owner == "worker-a")
+               .values(backfill_lease_expires_at=local_now_naive() - timedelta(seconds=1)))
+    db.commit()
+    assert {j.id for j in claim_backfill_jobs(db, "worker-c", 3, 5, lease_seconds=600)} == {
+        j.id for j in first
+    }
+    release_backfill_jobs(db, "worker-b", [j.id for j in second])
+    assert len(claim_backfill_jobs(db, "worker-d", 3, 5, lease_seconds=600)) == 2
+    db.close()
+
+    # A sweep fetches only what it could claim and releases its leases afterwards.
+    monkeypatch.setattr(scraper_module, "has_description_backfill_support", lambda: True)
+    monkeypatch.setattr(scraper_module, "_fetch_description_for_job", lambda job_id: (None, 404))
+    assert scraper_module.run_description_backfill(
+        session_factory=Factory, window_days=3, limit=50
+    )["candidates"] == 0
+    check = Factory()
+    check.execute(Job.__table__.update().values(backfill_lease_expires_at=None))
+    check.commit()
+    assert scraper_module.run_description_backfill(
+        session_factory=Factory, window_days=3, limit=50
+    )["candidates"] == 5
+    assert check.scalars(select(Job.backfill_owner).where(Job.backfill_owner.is_not(None))).all() == []
+    check.close()
+
+
+def test_backfill_sweep_leases_jobs_one_chunk_at_a_time(monkeypatch):
+    from datetime import timedelta
+
+    from app import scraper as scraper_module
+    from app.crud import claim_backfill_jobs, count_claimable_backfill_jobs
+    from app.timeutils import local_now_naive
+
+    Factory = _shared_sqlite_factory()
+    db = Factory()
+    db.add_all([make_job(job_url=f"https://www.linkedin.com/jobs/view/{n}", site_name="linkedin",
+                         description=None, created_at=local_now_naive() - timedelta(minutes=n))
+                for n in range(6)])
+    db.commit()
+    # Jobs leased by another worker's sweep are not reported as candidates.
+    claim_backfill_jobs(db, "worker-x", 3, 1, lease_seconds=600)
+    assert count_claimable_backfill_jobs(db, 3, 50) == 5
+    assert count_claimable_backfill_jobs(db, 3, 2) == 2
+
+    leased = []
+
+    def fetch(job_id):
+        check = Factory()
+        try:
+            leased.append(check.query(Job).filter(Job.backfill_owner.like("%:%")).count())
+        finally:
+            check.close()
+        return f"desc-{job_id}", 200
+
+    monkeypatch.setattr(scraper_module, "has_description_backfill_support", lambda: True)
+    monkeypatch.setattr(scraper_module, "_fetch_description_for_job", fetch)
+    result = scraper_module.run_description_backfill(
+        session_factory=Factory, window_days=3, limit=4, concurrency=1, write_batch=2
+    )
+    assert result == {"status": "ok", "candidates": 4, "updated": 4}
+    # Never more than one chunk (write_batch) leased by the sweep at once.
+    assert leased == [2, 2, 2, 2]
+    assert count_claimable_backfill_jobs(db, 3, 50) == 1
+    db.close()
+
+
 def test_run_description_backfill_updates_rows(monkeypatch):
     from app import scraper as scraper_module
-    from app.crud import list_linkedin_jobs_missing_description
+    from app.crud import count_claimable_backfill_jobs
 
     Factory = _shared_sqlite_factory()
     seed = Factory()
@@ -219,18 +884,18 @@ def test_run_description_backfill_updates_rows(monkeypatch):
     # No network: canned description per job id, and force the guard True.
     monkeypatch.setattr(scraper_module, "has_description_backfill_support", lambda: True)
     monkeypatch.setattr(
-        scraper_module, "_fetch_description_for_job", lambda job_id: f"desc-{job_id}"
+        scraper_module, "_fetch_description_for_job", lambda job_id: (f"desc-{job_id}", 200)
     )
 
     result = scraper_module.run_description_backfill(
-        session_factory=Factory, window_days=3, limit=50, concurrency=2, delay=0
+        session_factory=Factory, window_days=3, limit=50, concurrency=2
     )
     assert result["candidates"] == 2
     assert result["updated"] == 2
 
     check = Factory()
     try:
-        assert list_linkedin_jobs_missing_description(check, 3, 50) == []
+        assert count_claimable_backfill_jobs(check, 3, 50) == 0
         by_id = {j.job_url: j.description for j in check.query(Job).all()}
     finally:
         check.close()
@@ -238,6 +903,110 @@ def test_run_description_backfill_updates_rows(monkeypatch):
     assert by_id["https://www.linkedin.com/jobs/view/222"] == "desc-222"
 
 
+def test_run_description_backfill_writes_in_batches_as_fetches_complete(monkeypatch):
+    from app import scraper as scraper_module
+
+    Factory = _shared_sqlite_factory()
+    seed = Factory()
+    seed.add_all([make_job(job_url=f"https://www.linkedin.com/jobs/view/{n}",
+                           site_name="linkedin", description=None) for n in (1, 2, 3, 4)])
+    seed.commit()
+    seed.close()
+    updates = []
+    event.listen(Factory.kw["bind"], "before_cursor_execute",
+                 lambda conn, cur, stmt, *a: updates.append(stmt) if stmt.startswith("UPDATE") else None)
+
+    monkeypatch.setattr(scraper_module, "has_description_backfill_support", lambda: True)
+    monkeypatch.setattr(scraper_module, "_fetch_description_for_job",
+                        lambda job_id: (None, 404) if job_id == "3" else (f"desc-{job_id}", 200))
+
+    result = scraper_module.run_description_backfill(
+        session_factory=Factory, window_days=3, limit=50, concurrency=1, write_batch=2
+    )
+    progress = scraper_module.backfill_progress()
+
+    assert result["candidates"] == 4 and result["updated"] == 3
+    # Batches of two results: [1, 2] then [3 (failed), 4].
+    assert sum("SET description=" in stmt for stmt in updates) == 2
+    assert sum("backfill_attempts=" in stmt for stmt in updates) == 1
+    assert {k: progress[k] for k in ("running", "fetched", "failed", "pending", "updated")} == {
+        "running": False, "fetched": 3, "failed": 1, "pending": 0, "updated": 3,
+    }
+    check = Factory()
+    try:
+        versions = dict(check.execute(select(Job.job_url, Job.row_version)).all())
+    finally:
+        check.close()
+    assert versions["https://www.linkedin.com/jobs/view/1"] == 2
+    assert versions["https://www.linkedin.com/jobs/view/3"] == 1
+
+
+def test_adaptive_rate_limiter_paces_and_backs_off_aimd():
+    from app.ratelimit import AdaptiveRateLimiter
+
+    now = [0.0]
+    slept = []
+
+    def sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+
+    limiter = AdaptiveRateLimiter(1.0, min_rate=0.25, max_rate=2.0, increase=0.5,
+                                  decrease=0.5, burst=2, clock=lambda: now[0], sleep=sleep)
+    waits = [limiter.acquire() for _ in range(3)]
+    assert waits == [0.0, 0.0, 1.0]  # burst of two, then one per second
+
+    limiter.record(200)
+    limiter.record(404)  # says nothing about load
+    assert limiter.rate == 1.5
+    limiter.record(429)
+    assert limiter.rate == 0.75 and limiter.acquire() > 1.0  # bucket emptied
+    for _ in range(3):
+        limiter.record(503)
+    assert limiter.rate == 0.25
+    stats = limiter.stats()
+    assert stats["successes"] == 1 and stats["throttles"] == 4 and stats["acquired"] == 4
+
+
+def test_linkedin_detail_fetches_reuse_pooled_scrapers_and_feed_rate_limiter(monkeypatch):
+    from types import SimpleNamespace
+
+    from app import scraper as scraper_module
+    from app.ratelimit import AdaptiveRateLimiter
+
+    statuses = iter([200, 404, 429, 200])
+    made = []
+
+    class FakeLinkedIn:
+        def __init__(self):
+            self.session = SimpleNamespace(hooks={"response": []}, closed=False)
+            self.session.close = lambda: setattr(self.session, "closed", True)
+            made.append(self)
+
+        def _get_job_details(self, job_id):
+            status = next(statuses)
+            for hook in self.session.hooks["response"]:
+                hook(SimpleNamespace(status_code=status))
+            return {"description": "d"} if status == 200 else {}
+
+    limiter = AdaptiveRateLimiter(1.0, min_rate=0.1, max_rate=4.0, increase=0.5,
+                                  decrease=0.5, burst=10)
+    pool = scraper_module._LinkedInScraperPool(maxsize=2, max_age=300, max_uses=100)
+    monkeypatch.setattr(scraper_module, "_LINKEDIN_RATE_LIMITER", limiter)
+    monkeypatch.setattr(scraper_module, "_LINKEDIN_SCRAPERS", pool)
+    monkeypatch.setattr(scraper_module, "_make_linkedin_scraper", FakeLinkedIn)
+
+    results = [scraper_module._fetch_linkedin_details(str(n)) for n in range(4)]
+
+    assert [(bool(r), status) for r, status in results] == [
+        (True, 200), (False, 404), (False, 429), (True, 200)
+    ]
+    # 200 and 404 share one session; the 429 recycles it, the next fetch starts fresh.
+    assert len(made) == 2 and made[0].session.closed and not made[1].session.closed
+    assert pool.stats() == {"idle": 1, "maxsize": 2, "created": 2, "reused": 2, "recycled": 1}
+    assert limiter.successes == 2 and limiter.throttles == 1
+
+
 def _linkedin_listing_record(search_term="Backend Engineer Python",
                              url="https://www.linkedin.com/jobs/view/999"):
     return {
@@ -310,6 +1079,502 @@ def test_scrape_background_skips_backfill_when_fetch_desc_false(monkeypatch):
     assert called["n"] == 0
 
 
+def test_sync_scrape_fetches_details_only_for_unknown_or_description_less_jobs(monkeypatch):
+    from app import scraper as scraper_module
+
+    db = make_session()
+    db.add_all(
+        [
+            make_job(job_url="https://www.linkedin.com/jobs/view/111", description="stored"),
+            make_job(job_url="https://www.linkedin.com/jobs/view/222", description=None),
+        ]
+    )
+    db.commit()
+
+    def override_db():
+        yield db
+
+    seen_payloads = []
+    records = [
+        _linkedin_listing_record(url=f"https://www.linkedin.com/jobs/view/{i}")
+        for i in (111, 222, 333)
+    ]
+    monkeypatch.setattr(main_module, "run_scrape",
+                        lambda payload: seen_payloads.append(payload) or records)
+    fetched = []
+    monkeypatch.setattr(
+        scraper_module, "_fetch_linkedin_details",
+        lambda job_id: fetched.append(job_id) or ({"description": f"desc-{job_id}",
+                                                   "job_level": "mid-senior level"}, 200),
+    )
+    main_module.app.dependency_overrides[get_db] = override_db
+    try:
+        response = client.post(
+            "/scrape",
+            json={"site_name": ["linkedin"], "search_term": "X", "location": "Berlin",
+                  "linkedin_fetch_description": True},
+        )
+    finally:
+        main_module.app.dependency_overrides.clear()
+
+    body = response.json()
+    assert response.status_code == 200
+    # jobspy ran a listing-only pass; only 222 (no description) and 333 (new) hit LinkedIn.
+    assert seen_payloads[0]["linkedin_fetch_description"] is False
+    assert sorted(fetched) == ["222", "333"]
+    assert body["descriptions"] == {"status": "ok", "linkedin": 3, "known": 1,
+                                    "fetched": 2, "updated": 1}
+    assert body["inserted"] == 1
+    stored = {j.job_url: (j.description, j.job_level) for j in db.query(Job).all()}
+    assert stored["https://www.linkedin.com/jobs/view/111"][0] == "stored"
+    assert stored["https://www.linkedin.com/jobs/view/222"][0] == "desc-222"
+    assert stored["https://www.linkedin.com/jobs/view/333"] == ("desc-333", "mid-senior level")
+
+
+# ---------------------------------------------------------------------------
+# Per-site fan-out (parallel_sites)
+# ---------------------------------------------------------------------------
+
+def _jobspy_frame(site, n):
+    import pandas as pd
+
+    return pd.DataFrame(
+        [
+            {"site": site, "title": f"{site} job {i}", "company": "Acme",
+             "location": "Berlin", "job_url": f"https://{site}.example/{i}"}
+            for i in range(n)
+        ]
+    )
+
+
+def test_normalize_jobs_frame_maps_columns_and_cleans_missing_values():
+    import numpy as np
+    import pandas as pd
+    from app.scraper import REQUIRED_COLS, normalize_jobs_frame
+
+    frame = pd.DataFrame(
+        {
+            "site": ["linkedin", "indeed"],
+            "title": ["A", "B"],
+            "company": ["  Acme ", "   "],
+            "job_url": ["https://x.example/1", "https://x.example/2"],
+            "date_posted": ["2026-01-02", None],
+            "salary_source": [np.nan, "direct_data"],
+            "is_remote": [True, False],
+            "emails": [["a@x.example"], None],
+        }
+    )
+    records = normalize_jobs_frame(frame, "python")
+
+    assert [list(r) for r in records] == [REQUIRED_COLS, REQUIRED_COLS]
+    first, second = records
+    assert first["site_name"] == "linkedin" and first["job_title"] == "A"
+    assert first["company"] == "Acme" and second["company"] is None
+    assert first["date_posted"] == datetime(2026, 1, 2) and second["date_posted"] is None
+    assert first["salary"] is None and second["salary"] == "direct_data"
+    assert first["emails"] == ["a@x.example"] and second["emails"] is None
+    assert first["search_term"] == second["search_term"] == "python"
+    assert first["description"] is None and first["job_id"] is None   # absent columns
+    assert first["is_remote"] is True
+
+
+def test_run_scrape_parallel_sites_merges_and_reports_partial_failure(monkeypatch):
+    from app import scraper as scraper_module
+
+    calls = []
+
+    def fake_scrape_jobs(site_name, **kwargs):
+        calls.append(site_name)
+        if site_name == ["google"]:
+            raise RuntimeError("blocked")
+        return _jobspy_frame(site_name[0], 2)
+
+    monkeypatch.setattr(scraper_module, "scrape_jobs", fake_scrape_jobs)
+    monkeypatch.setattr(scraper_module.settings, "APP_ENV", "test")
+
+    records = scraper_module.run_scrape(
+        {"site_name": ["indeed", "linkedin", "google"], "search_term": "X",
+         "location": "Berlin", "parallel_sites": True}
+    )
+
+    assert sorted(calls) == [["google"], ["indeed"], ["linkedin"]]
+    assert len(records) == 4
+    assert {r["site_name"] for r in records} == {"indeed", "linkedin"}
+    assert records.sites["indeed"]["ok"] is True
+    assert records.sites["indeed"]["returned"] == 2
+    assert records.sites["google"]["ok"] is False
+    assert "blocked" in records.sites["google"]["error"]
+
+
+def test_run_scrape_parallel_sites_raises_when_every_site_fails(monkeypatch):
+    import pytest
+    from app import scraper as scraper_module
+
+    def fake_scrape_jobs(site_name, **kwargs):
+        raise RuntimeError("down")
+
+    monkeypatch.setattr(scraper_module, "scrape_jobs", fake_scrape_jobs)
+    with pytest.raises(scraper_module.ScrapeError):
+        scraper_module.run_scrape(
+            {"site_name": ["indeed", "linkedin"], "search_term": "X",
+             "location": "Berlin", "parallel_sites": True}
+        )
+
+
+# ---------------------------------------------------------------------------
+# Scrape result cache
+# ---------------------------------------------------------------------------
+
+def test_ttl_cache_expires_and_evicts_lru():
+    from app.cache import TTLCache
+
+    now = [0.0]
+    cache = TTLCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1          # "a" is now most recently used
+    cache.set("c", 3)                   # evicts "b"
+    assert cache.get("b") is None
+    now[0] = 11
+    assert cache.get("a") is None       # expired
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 2, 1)
+
+
+def test_run_scrape_serves_identical_payload_from_cache(monkeypatch):
+    from app import scraper as scraper_module
+    from app.cache import TTLCache
+
+    calls = {"n": 0}
+
+    def fake_scrape_jobs(site_name, **kwargs):
+        calls["n"] += 1
+        return _jobspy_frame("linkedin", 2)
+
+    monkeypatch.setattr(scraper_module, "scrape_jobs", fake_scrape_jobs)
+    monkeypatch.setattr(scraper_module.settings, "APP_ENV", "test")
+    monkeypatch.setattr(scraper_module, "_SCRAPE_CACHE", TTLCache(maxsize=8, ttl=60))
+
+    payload = {"site_name": ["linkedin", "indeed"], "search_term": "Python Dev",
+               "location": "Berlin", "country_indeed": "Germany", "hours_old": 24}
+    first = scraper_module.run_scrape(payload)
+    first[0]["job_title"] = "mutated by caller"
+    # Same query modulo site order / case / whitespace -> cache hit.
+    again = scraper_module.run_scrape(
+        {**payload, "site_name": ["indeed", "linkedin"], "search_term": " python dev ",
+         "location": "BERLIN"}
+    )
+    assert calls["n"] == 1
+    assert len(again) == 2
+    assert again[0]["job_title"] == "linkedin job 0"
+
+    scraper_module.run_scrape({**payload, "use_cache": False})   # opt-out
+    scraper_module.run_scrape({**payload, "hours_old": 48})      # different query
+    assert calls["n"] == 3
+    assert scraper_module.scrape_cache_stats()["hits"] == 1
+
+
+def test_singleflight_coalesces_concurrent_identical_calls():
+    import threading
+    import time
+    from app.cache import SingleFlight
+
+    flights = SingleFlight()
+    release = threading.Event()
+    calls = {"n": 0}
+
+    def slow():
+        calls["n"] += 1
+        release.wait(5)
+        return "result"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flights.do("k", slow)))
+               for _ in range(3)]
+    for t in threads:
+        t.start()
+    deadline = time.monotonic() + 5
+    while flights.stats()["shared"] < 2 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert calls["n"] == 1
+    assert sorted(results) == [("result", False), ("result", True), ("result", True)]
+    assert flights.stats()["in_flight"] == 0
+
+
+def test_scrape_flight_lease_claim_publish_and_takeover():
+    from datetime import timedelta
+    from app.crud import claim_scrape_flight, finish_scrape_flight
+    from app.models import ScrapeFlight
+
+    db = make_session()
+    assert claim_scrape_flight(db, "k", "worker-a", 60) == ("leader", None)
+    assert claim_scrape_flight(db, "k", "worker-b", 60) == ("running", None)
+
+    finish_scrape_flight(db, "k", "worker-a", '{"records": [], "sites": {}}', keep_seconds=60)
+    assert claim_scrape_flight(db, "k", "worker-b", 60) == (
+        "finished", '{"records": [], "sites": {}}'
+    )
+    # use_cache=false ignores the published result and scrapes again.
+    assert claim_scrape_flight(db, "k", "worker-b", 60, accept_finished=False) == ("leader", None)
+
+    # A crashed leader's expired lease is taken over.
+    row = db.get(ScrapeFlight, "k")
+    row.lease_expires_at = row.lease_expires_at - timedelta(seconds=120)
+    db.commit()
+    assert claim_scrape_flight(db, "k", "worker-c", 60) == ("leader", None)
+    assert db.get(ScrapeFlight, "k").owner == "worker-c"
+
+
+def test_scrape_result_json_round_trip():
+    import numpy as np
+    import pandas as pd
+    from app.scraper import ScrapeResult, _decode_result, _encode_result
+
+    result = ScrapeResult(
+        [{"job_url": "u", "date_posted": pd.Timestamp("2026-07-06 09:00"),
+          "is_remote": np.bool_(True)}],
+        sites={"linkedin": {"ok": True, "returned": 1, "seconds": 0.1}},
+    )
+    decoded = _decode_result(_encode_result(result))
+    assert decoded[0] == {"job_url": "u", "date_posted": datetime(2026, 7, 6, 9, 0),
+                          "is_remote": True}
+    assert decoded.sites == result.sites
+
+
+# ---------------------------------------------------------------------------
+# Batch scrape (POST /scrape/batch)
+# ---------------------------------------------------------------------------
+
+def test_scrape_batch_dedups_across_queries_and_reports_per_query(monkeypatch):
+    from app import scraper as scraper_module
+    from app.scraper import ScrapeError
+
+    db = make_session()
+    db.add(make_job(job_url="https://www.linkedin.com/jobs/view/1", description="stored"))
+    db.commit()
+
+    def fake_run_scrape(payload):
+        assert payload["linkedin_fetch_description"] is False  # listing pass only
+        term = payload["search_term"]
+        if term == "broken":
+            raise ScrapeError("upstream down")
+        urls = {"python": ["1", "2", "3"], "go": ["3", "4"]}[term]
+        return [_linkedin_listing_record(search_term=term,
+                                         url=f"https://www.linkedin.com/jobs/view/{u}")
+                for u in urls]
+
+    def override_db():
+        yield db
+
+    fetched = []
+    monkeypatch.setattr(
+        scraper_module, "_fetch_linkedin_details",
+        lambda job_id: fetched.append(job_id) or ({"description": f"desc-{job_id}"}, 200),
+    )
+    monkeypatch.setattr(main_module, "run_scrape", fake_run_scrape)
+    main_module.app.dependency_overrides[get_db] = override_db
+    try:
+        response = client.post(
+            "/scrape/batch",
+            json={"requests": [
+                {"site_name": ["linkedin"], "search_term": "python", "location": "Berlin"},
+                {"site_name": ["linkedin"], "search_term": "go", "location": "Berlin"},
+                {"site_name": ["linkedin"], "search_term": "broken", "location": "Berlin"},
+            ], "concurrency": 2},
+        )
+    finally:
+        main_module.app.dependency_overrides.clear()
+
+    body = response.json()
+    assert response.status_code == 200, body
+    assert body["mode"] == "batch"
+    assert body["returned"] == 5
+    assert body["unique"] == 4          # job 3 returned by both queries
+    assert body["inserted"] == 3        # job 1 already stored
+    assert body["failed"] == 1
+    python_q, go_q, broken_q = body["queries"]
+    assert (python_q["returned"], python_q["unique"], python_q["inserted"]) == (3, 3, 2)
+    assert (go_q["returned"], go_q["unique"], go_q["inserted"]) == (2, 1, 1)
+    assert broken_q["ok"] is False and "upstream down" in broken_q["error"]
+    assert db.query(Job).count() == 4
+    # Details are fetched only for jobs not already stored with a description.
+    assert set(fetched) == {"2", "3", "4"}
+    assert python_q["descriptions"]["known"] == 1
+    assert {j.job_url[-1]: j.description for j in db.query(Job).all()} == {
+        "1": "stored", "2": "desc-2", "3": "desc-3", "4": "desc-4",
+    }
+
+
+def test_scrape_batch_rejects_unresolvable_country(monkeypatch):
+    called = {"n": 0}
+    monkeypatch.setattr(
+        main_module, "run_scrape",
+        lambda payload: called.__setitem__("n", called["n"] + 1) or [],
+    )
+    monkeypatch.setattr(
+        main_module, "get_settings",
+        lambda: type("S", (), {"COUNTRY_INDEED_FALLBACK": None,
+                               "SCRAPE_BATCH_MAX_REQUESTS": 50,
+                               "SCRAPE_BATCH_CONCURRENCY": 3})(),
+    )
+    response = client.post(
+        "/scrape/batch",
+        json={"requests": [
+            {"site_name": ["linkedin"], "search_term": "X"},
+            {"site_name": ["indeed"], "search_term": "X"},
+        ]},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("requests[1]:")
+    assert called["n"] == 0  # validated before any scrape runs
+
+
+# ---------------------------------------------------------------------------
+# Incremental scraping (per-query high-water marks)
+# ---------------------------------------------------------------------------
+
+def test_incremental_scrape_shrinks_window_to_gap_since_last_success():
+    from datetime import timedelta
+    from app.scraper import ScrapeResult, plan_incremental_scrape, record_incremental_scrape
+
+    db = make_session()
+    payload = {"site_name": ["linkedin", "indeed"], "search_term": "Python",
+               "location": "Berlin", "hours_old": 72, "results_wanted": 40}
+
+    # No watermark yet -> full requested window.
+    planned, window = plan_incremental_scrape(db, payload)
+    assert planned == payload and window["incremental"] is False
+
+    # Only linkedin succeeded -> indeed still has no watermark -> full window.
+    window["started_at"] -= timedelta(hours=5) - timedelta(minutes=1)
+    records = ScrapeResult(
+        [{"site_name": "linkedin", "job_url": "u", "date_posted": datetime(2026, 7, 6)}],
+        sites={"linkedin": {"ok": True}, "indeed": {"ok": False}},
+    )
+    record_incremental_scrape(db, payload, window, records)
+    assert plan_incremental_scrape(db, payload)[1]["incremental"] is False
+
+    # Both sites recorded ~5h ago -> ceil(5h gap + 2h margin).
+    record_incremental_scrape(db, payload, window, ScrapeResult(records))
+    planned, window = plan_incremental_scrape(
+        db, {**payload, "search_term": " python ", "location": "BERLIN"}
+    )
+    assert window["incremental"] is True
+    assert planned["hours_old"] == 7
+    assert planned["results_wanted"] == 10   # ceil(40 * 7/72) = 4, floored at 10
+
+    # Override forces the full window.
+    planned, window = plan_incremental_scrape(db, {**payload, "full_window": True})
+    assert planned["hours_old"] == 72 and window["incremental"] is False
+
+
+def test_incremental_watermark_stops_at_oldest_posting_of_saturated_site():
+    from datetime import timedelta
+    from app.models import ScrapeWatermark
+    from app.scraper import ScrapeResult, plan_incremental_scrape, record_incremental_scrape
+
+    db = make_session()
+    payload = {"site_name": ["linkedin", "indeed"], "search_term": "Python",
+               "hours_old": 72, "results_wanted": 2}
+    _, window = plan_incremental_scrape(db, payload)
+    oldest = window["started_at"] - timedelta(hours=30)
+    records = ScrapeResult([
+        # linkedin returned a full page: older postings may be missing.
+        {"site_name": "linkedin", "job_url": "a", "date_posted": oldest},
+        {"site_name": "linkedin", "job_url": "b", "date_posted": oldest + timedelta(hours=6)},
+        # indeed returned fewer than asked: its whole window was covered.
+        {"site_name": "indeed", "job_url": "c", "date_posted": oldest},
+    ])
+    record_incremental_scrape(db, payload, window, records)
+
+    marks = {m.site_name: m.last_success_at for m in db.query(ScrapeWatermark).all()}
+    assert marks == {"linkedin": oldest, "indeed": window["started_at"]}
+    # The next window still reaches back past the saturated site's oldest posting.
+    planned, _ = plan_incremental_scrape(db, payload)
+    assert planned["hours_old"] >= 30
+
+
+# ---------------------------------------------------------------------------
+# Durable task queue (/scrape queue=true, GET /tasks/{id})
+# ---------------------------------------------------------------------------
+
+def test_scrape_queue_mode_returns_task_and_worker_executes_it(monkeypatch):
+    from app import tasks as tasks_module
+
+    Factory = _shared_sqlite_factory()
+    db = Factory()
+
+    def override_db():
+        yield db
+
+    def must_not_scrape(payload):
+        raise AssertionError("the API process must not scrape in queue mode")
+
+    scraped = []
+    monkeypatch.setattr(main_module, "run_scrape", must_not_scrape)
+    monkeypatch.setattr(tasks_module, "run_scrape",
+                        lambda payload: scraped.append(payload) or [_linkedin_listing_record()])
+    main_module.app.dependency_overrides[get_db] = override_db
+    try:
+        queued = client.post(
+            "/scrape",
+            json={"site_name": ["linkedin"], "search_term": "Backend Engineer Python",
+                  "location": "Berlin", "queue": True, "linkedin_fetch_description": True},
+        )
+        task_id = queued.json()["task_id"]
+        before = client.get(f"/tasks/{task_id}").json()
+
+        pool = tasks_module.TaskWorkerPool(1, session_factory=Factory)
+        assert pool.run_once() is True          # the scrape task
+        after = client.get(f"/tasks/{task_id}").json()
+        missing = client.get("/tasks/999999")
+    finally:
+        main_module.app.dependency_overrides.clear()
+
+    assert queued.status_code == 202
+    assert queued.json()["mode"] == "queued"
+    assert before["state"] == "queued"
+    assert scraped[0]["linkedin_fetch_description"] is False   # listing pass only
+    assert after["state"] == "succeeded"
+    assert after["attempts"] == 1
+    assert after["result"]["returned"] == 1
+    assert after["result"]["inserted"] == 1
+    assert after["result"]["backfill_task_id"] is not None     # descriptions follow up
+    assert missing.status_code == 404
+
+
+def test_claim_next_task_requeues_expired_lease_and_gives_up():
+    from datetime import timedelta
+    from app.crud import claim_next_task, create_task, finish_task
+    from app.models import ScrapeTask
+
+    db = make_session()
+    task = create_task(db, "scrape", {"search_term": "X"})
+
+    claimed = claim_next_task(db, "worker-a", lease_seconds=60, max_attempts=2)
+    assert claimed.id == task.id and claimed.state == "running"
+    assert claim_next_task(db, "worker-b", 60, 2) is None       # leased
+
+    # worker-a dies: once the lease expires worker-b takes the task over.
+    claimed.lease_expires_at = claimed.lease_expires_at - timedelta(seconds=120)
+    db.commit()
+    retaken = claim_next_task(db, "worker-b", 60, 2)
+    assert retaken.owner == "worker-b" and retaken.attempts == 2
+    assert finish_task(db, task.id, "worker-a", result={"n": 1}) is False  # stale owner
+
+    # worker-b dies too: attempts are exhausted, so the task is failed.
+    retaken.lease_expires_at = retaken.lease_expires_at - timedelta(seconds=120)
+    db.commit()
+    assert claim_next_task(db, "worker-c", 60, 2) is None
+    db.expire_all()
+    assert db.get(ScrapeTask, task.id).state == "failed"
+
+
 # ---------------------------------------------------------------------------
 # country_indeed resolution (request > env fallback > 400)
 # ---------------------------------------------------------------------------